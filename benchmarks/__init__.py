@@ -0,0 +1,5 @@
+"""
+Micro and end-to-end benchmarks for the trade approval workflow.
+
+Every module is runnable on its own, e.g. `python -m benchmarks.bench_container`.
+"""
@@ -0,0 +1,115 @@
+"""
+Aggregates over N trades: the NumPy columnar projection vs. a Python loop over the Trade objects.
+
+Run:  python -m benchmarks.bench_analytics --trades 1000000
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+from dataclasses import replace
+from datetime import timedelta
+
+from benchmarks.bench_batch import DETAILS
+from benchmarks.bench_changelog import NOW
+from trading_approval_process.application.views.trade_analytics_projection import TradeAnalyticsProjection
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+
+CURRENCIES = ("USD", "EUR", "GBP", "JPY", "CHF")
+COUNTERPARTIES = tuple(f"Bank{index}" for index in range(50))
+APPROVERS = tuple(f"approver{index}" for index in range(20))
+
+
+def build_trades(count: int) -> list[Trade]:
+    rng = random.Random(42)
+    # A pool of details shared between trades, as recurring deals would be.
+    pool = [replace(DETAILS, notional_currency=currency, underlying=f"{currency}/XXX", counterparty=counterparty,
+                    notional_amount=rng.randrange(1, 100) * 100_000)
+            for currency in CURRENCIES for counterparty in COUNTERPARTIES for _ in range(4)]
+    trades = []
+    for _ in range(count):
+        trade = Trade()
+        trade.requester = "requester"
+        trade.details = rng.choice(pool)
+        trade.change("requester", TradeAction.CREATE, NOW)
+        outcome = rng.random()
+        if outcome < 0.1:
+            trade.change("requester", TradeAction.CANCEL, NOW)
+        elif outcome > 0.4:
+            trade.change("requester", TradeAction.SUBMIT, NOW)
+            if outcome > 0.6:
+                trade.approver = rng.choice(APPROVERS)
+                trade.change(trade.approver, TradeAction.APPROVE, NOW + timedelta(seconds=rng.randrange(60, 7200)))
+        trades.append(trade)
+    return trades
+
+
+def naive_notional(trades: list[Trade]) -> dict:
+    groups = defaultdict(lambda: [0, 0.0])
+    for trade in trades:
+        group = groups[(trade.details.notional_currency, trade.state)]
+        group[0] += 1
+        group[1] += trade.details.notional_amount
+    return groups
+
+
+def naive_turnaround(trades: list[Trade]) -> dict:
+    approvers = defaultdict(list)
+    for trade in trades:
+        audit = trade.audit
+        for index in range(len(audit) - 1, 0, -1):
+            if audit[index].action is TradeAction.APPROVE:
+                approvers[trade.approver].append((audit[index].timestamp - audit[index - 1].timestamp).total_seconds())
+                break
+    return {approver: (len(seconds), sum(seconds) / len(seconds), max(seconds)) for approver, seconds in approvers.items()}
+
+
+def naive_cancellations(trades: list[Trade]) -> dict:
+    counts = defaultdict(lambda: [0, 0])
+    for trade in trades:
+        count = counts[trade.details.counterparty]
+        count[0] += 1
+        count[1] += trade.state is TradeState.CANCELLED
+    return counts
+
+
+def timed(operation, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trades", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    trades = build_trades(args.trades)
+    print(f"built {args.trades} trades in {time.perf_counter() - started:.1f} s")
+
+    analytics = TradeAnalyticsProjection()
+    started = time.perf_counter()
+    for offset in range(0, len(trades), 10_000):
+        analytics.on_saved(trades[offset:offset + 10_000])
+    print(f"projection loaded in {time.perf_counter() - started:.2f} s (batches of 10k saves)")
+
+    assert {(g.group["currency"], g.group["state"]): g.trades for g in analytics.notional(("currency", "state"))} == {
+        key: count for key, (count, _) in naive_notional(trades).items()}
+    for name, naive, vectorized in (
+        ("notional by currency, state", naive_notional, lambda: analytics.notional(("currency", "state"))),
+        ("approval turnaround / approver", naive_turnaround, analytics.approval_turnaround),
+        ("cancellations / counterparty", naive_cancellations, analytics.cancellations),
+    ):
+        loop = timed(lambda: naive(trades), args.rounds)
+        columnar = timed(vectorized, args.rounds)
+        print(f"{name:<32}: python loop {loop * 1e3:9.1f} ms   columnar {columnar * 1e3:8.2f} ms   "
+              f"x{loop / columnar:6.0f}")
+
+
+if __name__ == "__main__":
+    main()
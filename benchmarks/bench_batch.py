@@ -0,0 +1,82 @@
+"""
+Bulk ingestion: create → submit → approve for N trades, one call per trade vs. batch calls.
+
+Run:  python -m benchmarks.bench_batch --trades 5000 --batch-size 1000 --store sqlite
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure import (
+    InmemoryTradeExecutor, InMemoryTradeRepository, SqliteTradeRepository, SystemTime)
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+
+
+def build_repository(store: str, directory: Path) -> ITradeRepository:
+    if store == "sqlite":
+        return SqliteTradeRepository(str(directory / f"bench-{time.monotonic_ns()}.db"))
+    return InMemoryTradeRepository()
+
+
+async def one_by_one(service: TradeApprovalService, trades: int, token: CancellationToken) -> None:
+    for _ in range(trades):
+        trade = await service.create("requester", DETAILS, token)
+        await service.submit("requester", trade.trade_id, token)
+        await service.approve("approver", trade.trade_id, token)
+
+
+async def batched(service: TradeApprovalService, trades: int, batch_size: int, token: CancellationToken) -> None:
+    for start in range(0, trades, batch_size):
+        created = await service.create_many("requester", [DETAILS] * min(batch_size, trades - start), token)
+        ids = [result.trade_id for result in created]
+        await service.submit_many("requester", ids, token)
+        await service.approve_many("approver", ids, token)
+
+
+async def run(store: str, trades: int, batch_size: int, directory: Path) -> tuple[float, float]:
+    token = CancellationToken()
+    timings = []
+    for mode in ("single", "batch"):
+        repository = build_repository(store, directory)
+        service = TradeApprovalService(InmemoryTradeExecutor(), repository, SystemTime())
+        started = time.perf_counter()
+        if mode == "single":
+            await one_by_one(service, trades, token)
+        else:
+            await batched(service, trades, batch_size, token)
+        timings.append(time.perf_counter() - started)
+        if isinstance(repository, SqliteTradeRepository):
+            await repository.close()
+    return timings[0], timings[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trades", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--store", choices=["inmemory", "sqlite"], default="sqlite")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        single, batch = asyncio.run(run(args.store, args.trades, args.batch_size, Path(directory)))
+    print(f"{args.store}: {args.trades} trades x 3 transitions")
+    print(f"  one call per trade: {args.trades / single:10.0f} trades/s")
+    print(f"  batches of {args.batch_size:<6}: {args.trades / batch:10.0f} trades/s  ({single / batch:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
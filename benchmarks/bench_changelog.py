@@ -0,0 +1,61 @@
+"""
+Version diffs on a long-lived trade: every consecutive pair through get_differences, and
+the whole changelog in one get_changelog pass.
+
+Run:  python -m benchmarks.bench_changelog --versions 100 1000 5000
+"""
+import argparse
+import time
+from dataclasses import replace
+from datetime import date, datetime
+
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+NOW = datetime(2025, 1, 2)
+
+
+def build_trade(versions: int) -> Trade:
+    """A draft updated `versions - 1` times, changing the amount on every other update."""
+    trade = Trade()
+    trade.requester = "requester"
+    trade.details = DETAILS
+    trade.change("requester", TradeAction.CREATE, NOW)
+    for version in range(2, versions + 1):
+        trade.details = replace(DETAILS, notional_amount=1_000_000 + version // 2)
+        trade.change("requester", TradeAction.UPDATE, NOW)
+    return trade
+
+
+def timed(operation, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--versions", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for versions in args.versions:
+        trade = build_trade(versions)
+        pairwise = timed(lambda: [trade.get_differences(v - 1, v) for v in range(2, versions + 1)], args.rounds)
+        line = f"{versions:>6} versions: pairwise get_differences {pairwise * 1e3:9.2f} ms"
+        if hasattr(trade, "get_changelog"):
+            line += f"   get_changelog {timed(trade.get_changelog, args.rounds) * 1e3:9.2f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
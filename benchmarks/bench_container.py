@@ -0,0 +1,77 @@
+"""
+Per-request overhead of resolving the trade service.
+
+Compares the former per-request construction (fresh repository, executor and time
+provider on every call) with the lifespan-managed container, both for the dependency
+alone and end-to-end through the FastAPI app via an in-process ASGI client.
+
+Run:  python -m benchmarks.bench_container --requests 2000
+"""
+import argparse
+import asyncio
+import time
+import timeit
+
+import httpx
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.dependencies import get_trade_service
+from trading_approval_process.api.main import app
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.infrastructure import InmemoryTradeExecutor, SystemTime, InMemoryTradeRepository
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+def per_request_service() -> TradeApprovalService:
+    """The previous dependency: every call builds its own adapters."""
+    return TradeApprovalService(InmemoryTradeExecutor(), InMemoryTradeRepository(), SystemTime())
+
+
+def bench_dependency(iterations: int) -> tuple[float, float]:
+    container = AppContainer()
+    before = timeit.timeit(per_request_service, number=iterations) / iterations
+    after = timeit.timeit(lambda: get_trade_service(container), number=iterations) / iterations
+    return before, after
+
+
+async def bench_asgi(requests: int, legacy: bool) -> float:
+    if legacy:
+        app.dependency_overrides[get_trade_service] = per_request_service
+    app.state.container = AppContainer()
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                started = time.perf_counter()
+                for _ in range(requests):
+                    response = await client.post("/api/trades/create", params={"user": "bench"}, json=DETAILS)
+                    response.raise_for_status()
+                return (time.perf_counter() - started) / requests
+    finally:
+        app.dependency_overrides.clear()
+        del app.state.container
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100_000, help="dependency resolutions to time")
+    parser.add_argument("--requests", type=int, default=2_000, help="HTTP requests per ASGI run")
+    args = parser.parse_args()
+
+    before, after = bench_dependency(args.iterations)
+    print(f"dependency  per-request construction: {before * 1e6:8.2f} us")
+    print(f"dependency  container singleton:      {after * 1e6:8.2f} us")
+
+    before = asyncio.run(bench_asgi(args.requests, legacy=True))
+    after = asyncio.run(bench_asgi(args.requests, legacy=False))
+    print(f"POST create per-request construction: {before * 1e6:8.2f} us")
+    print(f"POST create container singleton:      {after * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
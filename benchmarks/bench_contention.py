@@ -0,0 +1,76 @@
+"""
+Contention on hot trades: hundreds of concurrent updates spread over a few trade ids.
+
+Compares running the commands directly (load → validate → change → save, no coordination)
+with TradeApprovalService, which serialises per trade and retries lost version checks.
+Reports success rate and latency percentiles.
+
+Run:  python -m benchmarks.bench_contention --operations 500 --trades 5
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from dataclasses import replace
+from datetime import date
+
+from trading_approval_process.application.commands.update_command import UpdateCommand
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure import InmemoryTradeExecutor, SystemTime, InMemoryTradeRepository
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+
+
+async def run(operations: int, trades: int, coordinated: bool) -> tuple[float, list[float]]:
+    repository = InMemoryTradeRepository()
+    clock = SystemTime()
+    service = TradeApprovalService(InmemoryTradeExecutor(), repository, clock)
+    token = CancellationToken()
+    trade_ids = [(await service.create("requester", DETAILS, token)).trade_id for _ in range(trades)]
+
+    async def one(amount: int) -> tuple[bool, float]:
+        trade_id = random.choice(trade_ids)
+        details = replace(DETAILS, notional_amount=amount)
+        started = time.perf_counter()
+        try:
+            if coordinated:
+                await service.update("requester", trade_id, details, token)
+            else:
+                await UpdateCommand(repository, clock).run("requester", trade_id, details, token)
+            return True, time.perf_counter() - started
+        except Exception:
+            return False, time.perf_counter() - started
+
+    results = await asyncio.gather(*(one(amount) for amount in range(1, operations + 1)))
+    succeeded = sum(ok for ok, _ in results)
+    return succeeded / operations, sorted(latency for _, latency in results)
+
+
+def percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--trades", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, coordinated in (("uncoordinated commands", False), ("lock + retry service", True)):
+        success, latencies = asyncio.run(run(args.operations, args.trades, coordinated))
+        print(f"{label:<24} success {success:7.1%} | "
+              f"p50 {statistics.median(latencies) * 1e3:7.2f} ms | "
+              f"p99 {percentile(latencies, 0.99) * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
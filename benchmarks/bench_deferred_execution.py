@@ -0,0 +1,54 @@
+"""
+send_to_execute latency with the counterparty call inline vs. deferred to the outbox
+dispatcher, using InmemoryTradeExecutor (10 ms per send).
+
+Run:  python -m benchmarks.bench_deferred_execution --trades 500 --concurrency 16
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.bench_batch import DETAILS
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.core.cancellation_token import CancellationToken
+
+
+async def run(trades: int, deferred: bool, concurrency: int) -> None:
+    container = AppContainer(deferred_execution=deferred, dispatch_concurrency=concurrency)
+    await container.startup()
+    service, token = container.trade_service, CancellationToken()
+    ids = []
+    for _ in range(trades):
+        trade = await service.create("requester", DETAILS, token)
+        await service.submit("requester", trade.trade_id, token)
+        ids.append((await service.approve("approver", trade.trade_id, token)).trade_id)
+
+    latencies = []
+    started = time.perf_counter()
+    for trade_id in ids:
+        call = time.perf_counter()
+        await service.send_to_execute("approver", trade_id, token)
+        latencies.append(time.perf_counter() - call)
+    while container.outbox is not None and len(container.outbox):
+        await asyncio.sleep(0.001)
+    total = time.perf_counter() - started
+    await container.shutdown()
+
+    latencies.sort()
+    mode = f"deferred x{concurrency}" if deferred else "inline"
+    print(f"{mode:<14}: send_to_execute p50 {latencies[len(latencies) // 2] * 1e3:7.3f} ms   "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e3:7.3f} ms   all receipts recorded in {total:6.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trades", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.trades, deferred=False, concurrency=args.concurrency))
+    asyncio.run(run(args.trades, deferred=True, concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
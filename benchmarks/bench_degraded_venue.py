@@ -0,0 +1,107 @@
+"""
+Fault injection: latency of unrelated endpoints while one venue is degraded.
+
+`--clients` concurrent clients share a bounded pool of server slots (as a server's
+connection or worker limit would impose). A share of the traffic sends trades to a venue that answers only after
+`--venue-delay` seconds; the rest reads healthy trades. Without protection the sends hold
+slots for the whole delay and the reads queue behind them; with the resilient executor
+they time out, trip the venue's circuit and then fail fast with 503.
+
+Run:  python -m benchmarks.bench_degraded_venue --requests 2000 --clients 64 --slots 32 --venue-delay 2
+"""
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import replace
+
+import httpx
+
+from benchmarks.bench_batch import DETAILS
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.infrastructure import InmemoryTradeExecutor
+
+DEGRADED = "SlowBank"
+
+
+class FaultInjectingExecutor(InmemoryTradeExecutor):
+    """InmemoryTradeExecutor whose sends to the degraded counterparty take `delay` seconds longer."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    async def send(self, trade, token):
+        if trade.details.counterparty == DEGRADED:
+            await asyncio.sleep(self.delay)
+        return await super().send(trade, token)
+
+
+async def run(protected: bool, requests: int, clients: int, slots: int, degraded_share: float, venue_delay: float) -> None:
+    executor = FaultInjectingExecutor(venue_delay)
+    if protected:
+        container = AppContainer(executor=executor, execution_timeout=0.25, max_sends_per_venue=4)
+    else:
+        container = AppContainer(executor=executor, execution_timeout=3600, max_sends_per_venue=10 ** 6)
+    app.state.container = container
+    await container.startup()
+    service, token = container.trade_service, CancellationToken()
+
+    sends = int(requests * degraded_share)
+    healthy, approved = [], []
+    for index in range(sends + 100):
+        details = DETAILS if index < 100 else replace(DETAILS, counterparty=DEGRADED)
+        trade = await service.create("requester", details, token)
+        if index < 100:
+            healthy.append(trade.trade_id)
+            continue
+        await service.submit("requester", trade.trade_id, token)
+        approved.append((await service.approve("approver", trade.trade_id, token)).trade_id)
+
+    calls = [("send", trade_id) for trade_id in approved] + [("read", None)] * (requests - sends)
+    random.Random(7).shuffle(calls)
+    server = asyncio.Semaphore(slots)
+    reads, outcomes = [], {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def user() -> None:
+            while calls:
+                kind, trade_id = calls.pop()
+                started = time.perf_counter()
+                async with server:
+                    if kind == "read":
+                        await client.get(f"/api/trades/{random.choice(healthy)}")
+                        reads.append(time.perf_counter() - started)
+                    else:
+                        response = await client.post(f"/api/trades/{trade_id}/send_to_execute",
+                                                     params={"user": "approver"})
+                        outcomes[response.status_code] = outcomes.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(clients)))
+        total = time.perf_counter() - started
+
+    await container.shutdown()
+    del app.state.container
+    reads.sort()
+    mode = "resilient" if protected else "unprotected"
+    print(f"{mode:<12}: reads p50 {reads[len(reads) // 2] * 1e3:8.1f} ms   p99 {reads[int(len(reads) * 0.99)] * 1e3:8.1f} ms"
+          f"   sends by status {dict(sorted(outcomes.items()))}   total {total:6.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--slots", type=int, default=32, help="requests the server handles at once")
+    parser.add_argument("--degraded-share", type=float, default=0.1, help="share of requests sent to the degraded venue")
+    parser.add_argument("--venue-delay", type=float, default=2.0, help="extra seconds the degraded venue takes")
+    args = parser.parse_args()
+
+    for protected in (False, True):
+        asyncio.run(run(protected, args.requests, args.clients, args.slots, args.degraded_share, args.venue_delay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Event fan-out: latency from publishing one trade change to the last of N subscribers
+receiving it, each subscriber being a task blocked on its queue.
+
+Run:  python -m benchmarks.bench_event_fanout --subscribers 10 100 1000 --events 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, datetime
+
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure.events.trade_event_bus import TradeEventBus
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+
+
+def build_trade() -> Trade:
+    trade = Trade()
+    trade.requester = "requester"
+    trade.details = DETAILS
+    trade.change("requester", TradeAction.CREATE, datetime(2025, 1, 2))
+    return trade
+
+
+async def run(subscribers: int, events: int) -> list[float]:
+    bus = TradeEventBus()
+    subscriptions = [bus.subscribe() for _ in range(subscribers)]
+    received = asyncio.Event()
+    remaining = 0
+
+    async def consume(subscription) -> None:
+        nonlocal remaining
+        while await subscription.get() is not None:
+            remaining -= 1
+            if remaining == 0:
+                received.set()
+
+    consumers = [asyncio.create_task(consume(subscription)) for subscription in subscriptions]
+    await asyncio.sleep(0)
+    trade = build_trade()
+    latencies = []
+    for _ in range(events):
+        remaining = subscribers
+        received.clear()
+        started = time.perf_counter()
+        bus.on_saved([trade])
+        await received.wait()
+        latencies.append(time.perf_counter() - started)
+    for subscription in subscriptions:
+        bus.unsubscribe(subscription)
+    await asyncio.gather(*consumers)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[10, 100, 1_000])
+    parser.add_argument("--events", type=int, default=200)
+    args = parser.parse_args()
+
+    for subscribers in args.subscribers:
+        latencies = sorted(asyncio.run(run(subscribers, args.events)))
+        p50, p99 = statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+        print(f"{subscribers:>6} subscribers: p50 {p50 * 1e6:8.1f} us   p99 {p99 * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Send throughput against a stand-in venue over TCP: one venue request per trade vs.
+concurrent sends coalesced by BatchingTradeExecutor, over the same connection pool.
+
+Run:  python -m benchmarks.bench_executor_throughput --sends 10000 --latency 0.002 --pool-size 4
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.bench_changelog import build_trade
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.infrastructure import BatchingTradeExecutor, TcpTradeExecutor
+from trading_approval_process.infrastructure.executor.venue_protocol import VenueAddress
+from trading_approval_process.infrastructure.executor.venue_server import StandInVenueServer
+
+
+async def run(sends: int, latency: float, pool_size: int, batched: bool, window: float, max_batch: int) -> None:
+    server = StandInVenueServer(latency=latency)
+    port = await server.start()
+    tcp = TcpTradeExecutor(VenueAddress("STANDIN", "127.0.0.1", port), pool_size=pool_size)
+    executor = BatchingTradeExecutor(tcp, window=window, max_batch=max_batch) if batched else tcp
+    trades = [build_trade(1) for _ in range(sends)]
+
+    started = time.perf_counter()
+    receipts = await asyncio.gather(*(executor.send(trade, CancellationToken()) for trade in trades))
+    elapsed = time.perf_counter() - started
+    assert len(receipts) == sends
+
+    await tcp.close()
+    await server.close()
+    mode = f"batched (<= {max_batch})" if batched else "one per send"
+    print(f"{mode:<18}: {sends} sends in {elapsed:6.2f} s = {sends / elapsed:9.0f} sends/s   "
+          f"venue requests {server.requests:6d}   connections {server.connections}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sends", type=int, default=10_000)
+    parser.add_argument("--latency", type=float, default=0.002, help="simulated venue latency per request, seconds")
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-batch", type=int, default=100)
+    args = parser.parse_args()
+
+    for batched in (False, True):
+        asyncio.run(run(args.sends, args.latency, args.pool_size, batched, args.window, args.max_batch))
+
+
+if __name__ == "__main__":
+    main()
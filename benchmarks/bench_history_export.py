@@ -0,0 +1,66 @@
+"""
+Exporting a long audit trail from SQLite: materialising the history (get_by_id, then one
+JSON document) against streaming it as NDJSON. Reports time and peak Python heap.
+
+Run:  python -m benchmarks.bench_history_export --versions 1000 20000
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.bench_changelog import build_trade
+from trading_approval_process.api.encoders import dumps
+from trading_approval_process.api.export import ndjson_chunks
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.infrastructure import SqliteTradeRepository
+
+
+async def materialised(repository: SqliteTradeRepository, trade_id, token: CancellationToken) -> int:
+    trade = await repository.get_by_id(trade_id, token)
+    return len(dumps(trade.to_history()))
+
+
+async def streamed(repository: SqliteTradeRepository, trade_id, token: CancellationToken) -> int:
+    rows = ((trade_id, record) async for record in repository.stream_audit(trade_id, token))
+    size = 0
+    async for chunk in ndjson_chunks(rows):
+        size += len(chunk)  # what the response would write to the socket
+    return size
+
+
+async def measure(operation) -> tuple[float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    await operation()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def run(versions: int, directory: Path) -> None:
+    token = CancellationToken()
+    repository = SqliteTradeRepository(str(directory / f"bench-{versions}.db"))
+    trade = build_trade(versions)
+    await repository.add(trade, token)
+    for name, operation in (("materialised", materialised), ("streamed", streamed)):
+        elapsed, peak = await measure(lambda: operation(repository, trade.trade_id, token))
+        print(f"{versions:>7} versions, {name:<12}: {elapsed * 1e3:9.1f} ms   peak heap {peak / 2**20:8.2f} MiB")
+    await repository.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--versions", type=int, nargs="+", default=[1_000, 20_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for versions in args.versions:
+            asyncio.run(run(versions, Path(directory)))
+
+
+if __name__ == "__main__":
+    main()
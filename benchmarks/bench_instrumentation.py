@@ -0,0 +1,111 @@
+"""
+Cost of the hot-path instrumentation on the command cycle create → submit → approve →
+send to execute, through the service over the in-memory repository. The executor answers
+at once, so no venue latency hides the overhead.
+
+- uninstrumented: commands unwrapped and adapters undecorated (the code before spans),
+- disabled: everything instrumented, no sink registered (the default),
+- histogram / histogram + otlp: spans recorded into the sinks.
+
+Run:  python -m benchmarks.bench_instrumentation --trades 20000
+"""
+import argparse
+import asyncio
+import time
+from contextlib import contextmanager
+
+from benchmarks.bench_transitions import DETAILS, NOW
+from trading_approval_process.application.commands.approve_command import ApproveCommand
+from trading_approval_process.application.commands.create_command import CreateCommand
+from trading_approval_process.application.commands.send_to_execute_command import SendToExecuteCommand
+from trading_approval_process.application.commands.submit_command import SubmitCommand
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumentation
+from trading_approval_process.core.span_sinks import HistogramSink, OtlpSpanExporter
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.infrastructure import (
+    InMemoryTradeRepository, InstrumentedTradeExecutor, InstrumentedTradeRepository)
+
+COMMANDS = (CreateCommand, SubmitCommand, ApproveCommand, SendToExecuteCommand)
+
+
+class FixedTime(ITimeProvider):
+
+    def now(self):
+        return NOW
+
+
+class InstantExecutor(ITradeExecutor):
+
+    async def send(self, trade, token):
+        return ExecutionReceipt(ticket_id=f"TICKET-{trade.trade_id}", sent_at=NOW, venue="BENCH", status="SENT",
+                                notes="")
+
+
+@contextmanager
+def unwrapped_commands():
+    """Run the commands' undecorated `run`, as they were before instrumentation."""
+    originals = {command: command.run for command in COMMANDS}
+    for command in COMMANDS:
+        command.run = command.run.__wrapped__
+    try:
+        yield
+    finally:
+        for command, run in originals.items():
+            command.run = run
+
+
+async def cycle(trades: int, instrumented: bool) -> float:
+    repository, executor = InMemoryTradeRepository(), InstantExecutor()
+    if instrumented:
+        repository, executor = InstrumentedTradeRepository(repository), InstrumentedTradeExecutor(executor)
+    service = TradeApprovalService(executor, repository, FixedTime())
+    token = CancellationToken()
+
+    started = time.perf_counter()
+    for _ in range(trades):
+        trade = await service.create("requester", DETAILS, token)
+        await service.submit("requester", trade.trade_id, token)
+        await service.approve("approver", trade.trade_id, token)
+        await service.send_to_execute("approver", trade.trade_id, token)
+    return time.perf_counter() - started
+
+
+def measure(label: str, trades: int, rounds: int, instrumented: bool, baseline: float | None = None) -> float:
+    best = min(asyncio.run(cycle(trades, instrumented)) for _ in range(rounds))
+    per_command = best / (trades * len(COMMANDS)) * 1e6
+    overhead = f"   {(best / baseline - 1) * 100:+6.1f} %" if baseline else ""
+    print(f"{label:<22}: {trades / best:8.0f} cycles/s   {per_command:6.2f} µs/command{overhead}")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trades", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=3, help="best of this many runs per mode")
+    args = parser.parse_args()
+
+    with unwrapped_commands():
+        baseline = measure("uninstrumented", args.trades, args.rounds, instrumented=False)
+    measure("disabled", args.trades, args.rounds, instrumented=True, baseline=baseline)
+
+    histogram = HistogramSink()
+    instrumentation.add_sink(histogram)
+    measure("histogram", args.trades, args.rounds, instrumented=True, baseline=baseline)
+    exporter = OtlpSpanExporter()
+    instrumentation.add_sink(exporter)
+    measure("histogram + otlp", args.trades, args.rounds, instrumented=True, baseline=baseline)
+    instrumentation.remove_sink(exporter)
+    instrumentation.remove_sink(histogram)
+
+    print(f"\n{len(histogram.durations)} span names; p50/p99 per command:")
+    for name, durations in sorted(histogram.durations.items()):
+        if name.endswith("Command.run"):
+            print(f"  {name:<24} {durations.quantile(0.5) * 1e6:7.1f} µs  {durations.quantile(0.99) * 1e6:7.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
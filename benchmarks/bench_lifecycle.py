@@ -0,0 +1,269 @@
+"""
+Load test of the full trade lifecycle: create → update → submit → approve →
+send_to_execute → book, driven through TradeApprovalService directly and through the
+FastAPI app over an in-process ASGI client.
+
+`--concurrency` clients each take the next trade and run its whole lifecycle. With
+`--contention` above 1, that many clients race to update the same trade at the update step,
+so those updates queue on the trade's lock. The venue answers after `--venue-latency`
+seconds.
+
+The report is one JSON document on stdout (or `--output`). It has a run per target, with
+throughput, and latency percentiles per step and per lifecycle, so results can be kept and
+compared across versions. Everything runs offline: in-memory (or SQLite) adapters and no
+network.
+
+Run:  python -m benchmarks.bench_lifecycle --trades 2000 --concurrency 32 --contention 4 --output lifecycle.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from benchmarks.bench_batch import DETAILS, build_repository
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.encoders import dumps
+from trading_approval_process.api.main import app
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.infrastructure import SqliteTradeRepository, SystemTime
+
+STEPS = ("create", "update", "submit", "approve", "send_to_execute", "book")
+REQUESTER, APPROVER = "requester", "approver"
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class StandInExecutor(ITradeExecutor):
+    """Venue answering every send after a fixed latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def send(self, trade, token):
+        await asyncio.sleep(self.latency)
+        return ExecutionReceipt(ticket_id=f"TICKET-{trade.trade_id}", sent_at=datetime.now(UTC), venue="STANDIN",
+                                status="SENT", notes="")
+
+
+def confirmation(trade_id) -> ExecutionConfirmation:
+    return ExecutionConfirmation(ticket_id=f"TICKET-{trade_id}", confirmation_id=f"CONF-{trade_id}",
+                                 counterparty=DETAILS.counterparty, strike=1.1, timestamp=datetime.now(UTC))
+
+
+class ServiceDriver:
+    """Lifecycle steps as calls on the service; a step fails by raising."""
+
+    def __init__(self, service: TradeApprovalService) -> None:
+        self._service = service
+        self._token = CancellationToken()
+
+    async def create(self):
+        return (await self._service.create(REQUESTER, DETAILS, self._token)).trade_id
+
+    async def update(self, trade_id, amount: float) -> None:
+        await self._service.update(REQUESTER, trade_id, replace(DETAILS, notional_amount=amount), self._token)
+
+    async def submit(self, trade_id) -> None:
+        await self._service.submit(REQUESTER, trade_id, self._token)
+
+    async def approve(self, trade_id) -> None:
+        await self._service.approve(APPROVER, trade_id, self._token)
+
+    async def send_to_execute(self, trade_id) -> None:
+        await self._service.send_to_execute(APPROVER, trade_id, self._token)
+
+    async def book(self, trade_id) -> None:
+        await self._service.book(REQUESTER, trade_id, confirmation(trade_id), self._token)
+
+
+class ApiDriver:
+    """Lifecycle steps as HTTP requests; a step fails on an error status."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def _post(self, path: str, user: str, body: object = None) -> httpx.Response:
+        content = dumps(body) if body is not None else None
+        response = await self._client.post(f"/api/trades/{path}", params={"user": user}, content=content,
+                                           headers={"content-type": "application/json"} if content else None)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{path}: {response.status_code} {response.text}")
+        return response
+
+    async def create(self):
+        return (await self._post("create", REQUESTER, DETAILS)).json()["trade_id"]
+
+    async def update(self, trade_id, amount: float) -> None:
+        await self._post(f"{trade_id}/update", REQUESTER, replace(DETAILS, notional_amount=amount))
+
+    async def submit(self, trade_id) -> None:
+        await self._post(f"{trade_id}/submit", REQUESTER)
+
+    async def approve(self, trade_id) -> None:
+        await self._post(f"{trade_id}/approve", APPROVER)
+
+    async def send_to_execute(self, trade_id) -> None:
+        await self._post(f"{trade_id}/send_to_execute", APPROVER)
+
+    async def book(self, trade_id) -> None:
+        await self._post(f"{trade_id}/book", REQUESTER, confirmation(trade_id))
+
+
+class Recorder:
+    """Latencies (seconds) and errors per step."""
+
+    def __init__(self) -> None:
+        self.latencies: dict[str, list[float]] = {step: [] for step in (*STEPS, "lifecycle")}
+        self.errors: dict[str, int] = dict.fromkeys(self.latencies, 0)
+        self.first_errors: dict[str, str] = {}
+
+    async def timed(self, step: str, operation) -> bool:
+        started = time.perf_counter()
+        try:
+            await operation
+        except Exception as ex:
+            self.errors[step] += 1
+            self.first_errors.setdefault(step, f"{type(ex).__name__}: {ex}")
+            return False
+        self.latencies[step].append(time.perf_counter() - started)
+        return True
+
+
+async def lifecycle(driver, recorder: Recorder, contention: int) -> bool:
+    started = time.perf_counter()
+    trade_id = None
+
+    async def create():
+        nonlocal trade_id
+        trade_id = await driver.create()
+
+    if not await recorder.timed("create", create()):
+        return False
+    updates = await asyncio.gather(*(recorder.timed("update", driver.update(trade_id, 1_000_000 + client))
+                                     for client in range(contention)))
+    if not all(updates):
+        return False
+    for step in STEPS[2:]:
+        if not await recorder.timed(step, getattr(driver, step)(trade_id)):
+            return False
+    recorder.latencies["lifecycle"].append(time.perf_counter() - started)
+    return True
+
+
+async def drive(driver, trades: int, concurrency: int, contention: int) -> tuple[Recorder, float]:
+    recorder, remaining = Recorder(), [trades]
+
+    async def client() -> None:
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            if not await lifecycle(driver, recorder, contention):
+                recorder.errors["lifecycle"] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return recorder, time.perf_counter() - started
+
+
+async def run_service(args, directory: Path) -> tuple[Recorder, float]:
+    repository = build_repository(args.store, directory)
+    service = TradeApprovalService(StandInExecutor(args.venue_latency), repository, SystemTime())
+    try:
+        return await drive(ServiceDriver(service), args.trades, args.concurrency, args.contention)
+    finally:
+        if isinstance(repository, SqliteTradeRepository):
+            await repository.close()
+
+
+async def run_api(args, directory: Path) -> tuple[Recorder, float]:
+    container = AppContainer(repository=build_repository(args.store, directory),
+                             executor=StandInExecutor(args.venue_latency))
+    app.state.container = container
+    await container.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            return await drive(ApiDriver(client), args.trades, args.concurrency, args.contention)
+    finally:
+        await container.shutdown()
+        del app.state.container
+        close = getattr(container.repository.inner.inner, "close", None)
+        if close is not None:
+            await close()
+
+
+def summary(latencies: list[float], errors: int) -> dict[str, object]:
+    ordered = sorted(latencies)
+    stats: dict[str, object] = {"count": len(ordered), "errors": errors}
+    if ordered:
+        stats["mean_ms"] = round(sum(ordered) / len(ordered) * 1e3, 4)
+        for percentile in PERCENTILES:
+            rank = min(len(ordered) - 1, max(0, int(len(ordered) * percentile / 100 + 0.5) - 1))
+            stats[f"p{percentile:g}_ms"] = round(ordered[rank] * 1e3, 4)
+        stats["max_ms"] = round(ordered[-1] * 1e3, 4)
+    return stats
+
+
+def report(target: str, recorder: Recorder, elapsed: float) -> dict[str, object]:
+    completed = len(recorder.latencies["lifecycle"])
+    operations = sum(len(recorder.latencies[step]) for step in STEPS)
+    return {
+        "target": target,
+        "elapsed_seconds": round(elapsed, 4),
+        "lifecycles": {"completed": completed, "failed": recorder.errors["lifecycle"]},
+        "throughput": {"lifecycles_per_second": round(completed / elapsed, 2),
+                       "operations_per_second": round(operations / elapsed, 2)},
+        "latency": {step: summary(latencies, recorder.errors[step])
+                    for step, latencies in recorder.latencies.items()},
+        "first_errors": recorder.first_errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=["service", "api", "both"], default="both")
+    parser.add_argument("--trades", type=int, default=2_000, help="lifecycles to run per target")
+    parser.add_argument("--concurrency", type=int, default=32, help="clients running lifecycles at once")
+    parser.add_argument("--contention", type=int, default=1, help="clients racing to update the same trade")
+    parser.add_argument("--venue-latency", type=float, default=0.0, help="seconds the venue takes to answer a send")
+    parser.add_argument("--store", choices=["inmemory", "sqlite"], default="inmemory")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    runners = {"service": run_service, "api": run_api}
+    targets = list(runners) if args.target == "both" else [args.target]
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for target in targets:
+            recorder, elapsed = asyncio.run(runners[target](args, Path(directory)))
+            runs.append(report(target, recorder, elapsed))
+
+    document = {
+        "benchmark": "lifecycle",
+        "started_at": started_at,
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "platform": platform.platform()},
+        "config": {"trades": args.trades, "concurrency": args.concurrency, "contention": args.contention,
+                   "venue_latency": args.venue_latency, "store": args.store, "steps": list(STEPS)},
+        "runs": runs,
+    }
+    text = json.dumps(document, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Trade listing: time to fetch one filtered page at the start and at the end of the listing,
+for growing store sizes. With keyset pagination both stay flat as the store grows.
+
+Run:  python -m benchmarks.bench_query --sizes 1000 10000 50000 --store inmemory
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import replace
+from datetime import date, datetime
+from pathlib import Path
+
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure import InMemoryTradeRepository, SqliteTradeRepository
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+NOW = datetime(2025, 1, 2)
+COUNTERPARTIES = [replace(DETAILS, counterparty=f"Bank{index}") for index in range(20)]
+
+
+def build_trades(count: int) -> list[Trade]:
+    trades = []
+    for index in range(count):
+        trade = Trade()
+        trade.requester = "requester"
+        trade.details = COUNTERPARTIES[index % len(COUNTERPARTIES)]
+        trade.change("requester", TradeAction.CREATE, NOW)
+        if index % 2:
+            trade.change("requester", TradeAction.SUBMIT, NOW)
+        trades.append(trade)
+    return trades
+
+
+async def page_times(repository, query: TradeQuery, token: CancellationToken, rounds: int) -> tuple[float, float]:
+    # Walk to the last page once to find its cursor, then time the first and the last page.
+    cursors, cursor = [None], None
+    while True:
+        page = await repository.query(replace(query, after=cursor), token)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+        cursors.append(cursor)
+
+    timings = []
+    for after in (cursors[0], cursors[-1]):
+        started = time.perf_counter()
+        for _ in range(rounds):
+            await repository.query(replace(query, after=after), token)
+        timings.append((time.perf_counter() - started) / rounds)
+    return timings[0], timings[1]
+
+
+async def run(store: str, size: int, rounds: int, directory: Path) -> tuple[float, float]:
+    token = CancellationToken()
+    if store == "sqlite":
+        repository = SqliteTradeRepository(str(directory / f"query-{size}.db"))
+    else:
+        repository = InMemoryTradeRepository()
+    await repository.add_many(build_trades(size), token)
+    query = TradeQuery(state=TradeState.PENDING_APPROVAL, counterparty="Bank3", limit=50)
+    try:
+        return await page_times(repository, query, token, rounds)
+    finally:
+        if isinstance(repository, SqliteTradeRepository):
+            await repository.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--store", choices=["inmemory", "sqlite"], default="inmemory")
+    args = parser.parse_args()
+
+    print(f"{args.store}: PENDING_APPROVAL trades of one counterparty, pages of 50")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            first, last = asyncio.run(run(args.store, size, args.rounds, Path(directory)))
+            print(f"  {size:>8} trades: first page {first * 1e6:8.0f} us   last page {last * 1e6:8.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Cost of one get_by_id → change → update cycle against audit trail length.
+
+Compares the former deep-copy clones with the structural-sharing snapshots of
+InMemoryTradeRepository. Deep copies grow linearly with the audit trail, snapshots stay flat.
+
+Run:  python -m benchmarks.bench_repository_snapshots --lengths 10 100 1000 10000
+"""
+import argparse
+import asyncio
+import copy
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure import InMemoryTradeRepository
+
+NOW = datetime(2025, 1, 2, tzinfo=timezone.utc)
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+
+
+class DeepCopyTradeRepository(InMemoryTradeRepository):
+    """The previous clone strategy, kept here as the baseline."""
+
+    def _clone_trade(self, trade: Trade) -> Trade:
+        clone = copy.copy(trade)
+        clone.details = copy.deepcopy(trade.details)
+        clone.audit = copy.deepcopy(trade.audit)
+        clone.execution_receipt = copy.deepcopy(trade.execution_receipt)
+        clone.execution_confirmation = copy.deepcopy(trade.execution_confirmation)
+        return clone
+
+
+def build_trade(audit_length: int) -> Trade:
+    trade = Trade()
+    trade.requester = "requester"
+    trade.details = DETAILS
+    trade.change("requester", TradeAction.CREATE, NOW)
+    for _ in range(audit_length - 1):
+        trade.change("requester", TradeAction.UPDATE, NOW)
+    return trade
+
+
+async def bench_cycle(repository: InMemoryTradeRepository, audit_length: int, cycles: int) -> float:
+    token = CancellationToken()
+    trade = build_trade(audit_length)
+    await repository.add(trade, token)
+
+    started = time.perf_counter()
+    for _ in range(cycles):
+        loaded = await repository.get_by_id(trade.trade_id, token)
+        loaded.change("requester", TradeAction.UPDATE, NOW)
+        await repository.update(loaded, token)
+    return (time.perf_counter() - started) / cycles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--cycles", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'audit length':>12} | {'deepcopy (us)':>14} | {'snapshot (us)':>14}")
+    for length in args.lengths:
+        deep = asyncio.run(bench_cycle(DeepCopyTradeRepository(), length, args.cycles))
+        shared = asyncio.run(bench_cycle(InMemoryTradeRepository(), length, args.cycles))
+        print(f"{length:>12} | {deep * 1e6:>14.1f} | {shared * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Serialising a trade response: the generic path (FastAPI's jsonable_encoder walk, then
+json.dumps, as the routes used to render) against the domain encoders behind
+DomainJSONResponse.
+
+Run:  python -m benchmarks.bench_serialization --records 1000
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from benchmarks.bench_changelog import build_trade
+from trading_approval_process.api.encoders import dumps
+
+
+def generic(content) -> bytes:
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def timed(operation, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    return (time.perf_counter() - started) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    for records in args.records:
+        trade = build_trade(records)
+        for name, payload in (("trade", trade), ("history", trade.to_history())):
+            assert generic(payload) == dumps(payload)
+            before = timed(lambda: generic(payload), args.rounds)
+            after = timed(lambda: dumps(payload), args.rounds)
+            print(f"{records:>6} records, {name:<8}: generic {before * 1e3:8.2f} ms   "
+                  f"domain encoders {after * 1e3:8.2f} ms   ({before / after:5.1f}x, {len(dumps(payload)):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Heap cost of live trades in the in-memory repository, measured with tracemalloc.
+
+Each trade gets its own TradeDetails and goes create → submit → approve (three audit
+records), with user ids arriving as fresh strings the way request parameters do.
+
+Run:  python -m benchmarks.bench_trade_memory --sizes 1000 100000 1000000
+"""
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from dataclasses import replace
+from datetime import date, datetime
+
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+from trading_approval_process.infrastructure import InMemoryTradeRepository
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+NOW = datetime(2025, 1, 2)
+
+
+def fresh(text: str) -> str:
+    """An equal but distinct string object, as decoded from a request."""
+    return "".join(list(text))
+
+
+def build_trade(index: int) -> Trade:
+    trade = Trade()
+    trade.requester = fresh("requester")
+    trade.details = replace(DETAILS, counterparty=fresh(f"Bank{index % 50}"), notional_amount=1_000_000 + index)
+    trade.change(fresh("requester"), TradeAction.CREATE, NOW)
+    trade.change(fresh("requester"), TradeAction.SUBMIT, NOW)
+    trade.approver = fresh("approver")
+    trade.change(fresh("approver"), TradeAction.APPROVE, NOW)
+    return trade
+
+
+async def fill(repository: InMemoryTradeRepository, count: int) -> None:
+    token = CancellationToken()
+    for start in range(0, count, 10_000):
+        await repository.add_many([build_trade(index) for index in range(start, min(count, start + 10_000))], token)
+
+
+def bytes_per_trade(count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    repository = InMemoryTradeRepository()
+    asyncio.run(fill(repository, count))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del repository
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        print(f"{size:>9} trades: {bytes_per_trade(size):8.0f} bytes/trade")
+
+
+if __name__ == "__main__":
+    main()
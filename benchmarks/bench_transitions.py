@@ -0,0 +1,66 @@
+"""
+Trade construction memory and per-transition latency: create → submit → approve for many
+trades, validating each action before applying it as the commands do.
+
+Run:  python -m benchmarks.bench_transitions --trades 1000000
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import date, datetime
+
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_style import TradeStyle
+
+DETAILS = TradeDetails(
+    trading_entity="BankA", counterparty="BankB", direction=TradeDirection.BUY, style=TradeStyle.FORWARD,
+    notional_currency="USD", notional_amount=1_000_000, underlying="USD/EUR",
+    trade_date=date(2025, 1, 2), value_date=date(2025, 1, 4), delivery_date=date(2025, 1, 7),
+)
+NOW = datetime(2025, 1, 2)
+
+
+def construction_bytes(sample: int) -> float:
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    trades = [Trade() for _ in range(sample)]
+    allocated = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    del trades
+    return allocated / sample
+
+
+def lifecycle_seconds(count: int) -> tuple[float, float]:
+    """Seconds to construct `count` trades, and to validate + change them through three actions."""
+    started = time.perf_counter()
+    trades = [Trade() for _ in range(count)]
+    constructed = time.perf_counter()
+    for trade in trades:
+        trade.requester = "requester"
+        trade.details = DETAILS
+        trade.validate("requester", TradeAction.CREATE)
+        trade.change("requester", TradeAction.CREATE, NOW)
+        trade.validate("requester", TradeAction.SUBMIT)
+        trade.change("requester", TradeAction.SUBMIT, NOW)
+        trade.validate("approver", TradeAction.APPROVE)
+        trade.change("approver", TradeAction.APPROVE, NOW)
+    return constructed - started, time.perf_counter() - constructed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trades", type=int, default=1_000_000)
+    parser.add_argument("--memory-sample", type=int, default=10_000)
+    args = parser.parse_args()
+
+    per_trade = construction_bytes(args.memory_sample)
+    construct, transitions = lifecycle_seconds(args.trades)
+    print(f"construction: {per_trade:8.0f} bytes/trade   {construct / args.trades * 1e6:6.2f} us/trade")
+    print(f"transitions : {transitions / (3 * args.trades) * 1e6:8.2f} us per validate + change")
+
+
+if __name__ == "__main__":
+    main()
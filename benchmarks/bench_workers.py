@@ -0,0 +1,167 @@
+"""
+Scaling of the production server (api/serve.py) with its number of worker processes.
+
+For each `--workers` count, starts `python -m trading_approval_process.api.serve` on a fresh
+SQLite file and a free local port, waits until it is live, then runs `--trades` lifecycles
+(see bench_lifecycle.py) over real HTTP from `--clients` client processes, so the load
+generator itself is not capped at one core. After the run it reads /metrics once to check
+the workers agree: every trade created must have reached the metrics of the worker asked,
+through its own saves or the change feed.
+
+The report is one JSON document on stdout (or `--output`), with a run per worker count.
+Scaling is bounded by the cores of the machine (reported) and by SQLite's single writer.
+
+Run:  python -m benchmarks.bench_workers --workers 1 2 4 8 --trades 2000 --clients 4 --output workers.json
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+from benchmarks.bench_lifecycle import STEPS, ApiDriver, Recorder, drive, report
+
+HOST = "127.0.0.1"
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind((HOST, 0))
+        return probe.getsockname()[1]
+
+
+def start_server(workers: int, database: Path, port: int) -> subprocess.Popen:
+    command = [sys.executable, "-m", "trading_approval_process.api.serve", "--workers", str(workers),
+               "--db", str(database), "--host", HOST, "--port", str(port), "--log-level", "warning",
+               # Every client shares one address: a limit it never reaches, so the counters are still kept.
+               "--rate-limit", "1000000/second"]
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def wait_until_live(server: subprocess.Popen, base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with {server.returncode}")
+        try:
+            if httpx.get(f"{base_url}/api/health/live", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server not live after {timeout}s")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    server.terminate()
+    try:
+        server.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def client_process(base_url: str, trades: int, concurrency: int, contention: int,
+                   results: multiprocessing.Queue) -> None:
+    async def run() -> tuple[Recorder, float]:
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+            return await drive(ApiDriver(client), trades, concurrency, contention)
+
+    recorder, _ = asyncio.run(run())
+    results.put((recorder.latencies, recorder.errors, recorder.first_errors))
+
+
+def load(base_url: str, args) -> tuple[Recorder, float]:
+    """Split the lifecycles over the client processes; merge their recordings."""
+    shares = [args.trades // args.clients + (1 if index < args.trades % args.clients else 0)
+              for index in range(args.clients)]
+    results = multiprocessing.Queue()
+    clients = [multiprocessing.Process(target=client_process,
+                                       args=(base_url, share, args.concurrency, args.contention, results))
+               for share in shares if share]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+    merged = Recorder()
+    for _ in clients:
+        latencies, errors, first_errors = results.get()
+        for step, values in latencies.items():
+            merged.latencies[step].extend(values)
+            merged.errors[step] += errors[step]
+        for step, error in first_errors.items():
+            merged.first_errors.setdefault(step, error)
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        client.join()
+    return merged, elapsed
+
+
+def booked_in_metrics(base_url: str) -> float:
+    """Trades the answering worker counts as booked, from its /metrics."""
+    for line in httpx.get(f"{base_url}/metrics", timeout=5.0).text.splitlines():
+        if line.startswith("trade_transitions_total") and 'action="BOOK"' in line:
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def run(workers: int, args, directory: Path) -> dict[str, object]:
+    port = free_port()
+    base_url = f"http://{HOST}:{port}"
+    server = start_server(workers, directory / f"trades-{workers}.db", port)
+    try:
+        wait_until_live(server, base_url)
+        recorder, elapsed = load(base_url, args)
+        time.sleep(0.5)  # a few change feed polls
+        booked = booked_in_metrics(base_url)
+    finally:
+        stop_server(server)
+    result = report(f"{workers} worker(s)", recorder, elapsed)
+    result["workers"] = workers
+    result["booked_in_metrics"] = {"expected": len(recorder.latencies["lifecycle"]), "reported": booked}
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="worker counts to run")
+    parser.add_argument("--trades", type=int, default=2_000, help="lifecycles to run per worker count")
+    parser.add_argument("--clients", type=int, default=4, help="client processes generating the load")
+    parser.add_argument("--concurrency", type=int, default=16, help="lifecycles at once per client process")
+    parser.add_argument("--contention", type=int, default=1, help="clients racing to update the same trade")
+    parser.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    started_at = datetime.now(UTC).isoformat(timespec="seconds")
+    with tempfile.TemporaryDirectory() as directory:
+        runs = [run(workers, args, Path(directory)) for workers in args.workers]
+
+    document = {
+        "benchmark": "workers",
+        "started_at": started_at,
+        "environment": {"python": platform.python_version(), "implementation": platform.python_implementation(),
+                        "platform": platform.platform(), "cpu_count": os.cpu_count()},
+        "config": {"workers": args.workers, "trades": args.trades, "clients": args.clients,
+                   "concurrency": args.concurrency, "contention": args.contention, "store": "sqlite",
+                   "steps": list(STEPS)},
+        "runs": runs,
+    }
+    text = json.dumps(document, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestAnalyticsEndpoints:
+
+    def setup_method(self):
+        app.state.container = AppContainer()
+
+    def teardown_method(self):
+        del app.state.container
+
+    def test_aggregates_follow_the_saved_trades(self):
+        with TestClient(app) as client:
+            ids = [client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                   for _ in range(3)]
+            client.post("/api/trades/create", params={"user": "alice"},
+                        json={**DETAILS, "notional_currency": "EUR", "notional_amount": 5})
+            client.post(f"/api/trades/{ids[0]}/submit", params={"user": "alice"})
+            client.post(f"/api/trades/{ids[0]}/approve", params={"user": "bob"})
+            client.post(f"/api/trades/{ids[1]}/cancel", params={"user": "alice"})
+
+            by_currency = client.get("/api/analytics/notional", params={"group_by": ["currency", "state"]})
+            drafts = client.get("/api/analytics/notional", params={"state": "DRAFT", "from": "2025-01-02"})
+            turnaround = client.get("/api/analytics/approval-turnaround").json()
+            cancellations = client.get("/api/analytics/cancellations", params={"currency": "USD"}).json()
+            invalid = client.get("/api/analytics/notional", params={"group_by": "notional_amount"})
+
+        assert by_currency.status_code == 200
+        assert by_currency.json()["groups"] == [
+            {"group": {"currency": "USD", "state": 2}, "trades": 1, "notional": 1_000_000.0},
+            {"group": {"currency": "USD", "state": 5}, "trades": 1, "notional": 1_000_000.0},
+            {"group": {"currency": "USD", "state": 8}, "trades": 1, "notional": 1_000_000.0},
+            {"group": {"currency": "EUR", "state": 2}, "trades": 1, "notional": 5.0},
+        ]
+        assert drafts.json()["groups"] == [{"group": {}, "trades": 2, "notional": 1_000_005.0}]
+        assert [item["approver"] for item in turnaround["approvers"]] == ["bob"]
+        assert cancellations["counterparties"] == [
+            {"counterparty": "BankB", "trades": 3, "cancelled": 1, "cancellation_ratio": 1 / 3}]
+        assert invalid.status_code == 422
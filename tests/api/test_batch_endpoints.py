@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestBatchEndpoints:
+
+    def test_batch_lifecycle_reports_per_item_results(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                invalid = {**DETAILS, "notional_amount": -1}
+                created = client.post("/api/trades/batch/create", params={"user": "requester"},
+                                      json=[DETAILS, invalid, DETAILS])
+                ids = [item["trade_id"] for item in created.json() if item["error"] is None]
+
+                submitted = client.post("/api/trades/batch/submit", params={"user": "requester"}, json=ids)
+                approved = client.post("/api/trades/batch/approve", params={"user": "approver"},
+                                       json=ids + ["00000000-0000-0000-0000-000000000000"])
+                cancelled = client.post("/api/trades/batch/cancel", params={"user": "approver"}, json=ids[:1])
+
+            assert created.status_code == 201
+            assert [item["error"] is None for item in created.json()] == [True, False, True]
+            assert [item["state"] for item in submitted.json()] == [3, 3]
+            assert [item["error"] is None for item in approved.json()] == [True, True, False]
+            assert cancelled.json()[0]["state"] == 8
+        finally:
+            del app.state.container
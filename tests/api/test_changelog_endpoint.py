@@ -0,0 +1,39 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestChangelogEndpoint:
+
+    def test_changelog_reports_each_version(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                client.post(f"/api/trades/{trade_id}/update", params={"user": "alice"},
+                            json={**DETAILS, "notional_amount": 2_000_000})
+                changelog = client.get(f"/api/trades/{trade_id}/changelog").json()
+
+            assert [entry["version"] for entry in changelog["entries"]] == [1, 2]
+            assert changelog["entries"][1]["changes"] == {"notional_amount": ["1000000.0", "2000000.0"]}
+        finally:
+            del app.state.container
+
+    def test_unknown_trade_is_not_found(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                missing = uuid.uuid4()
+                assert client.get(f"/api/trades/{missing}/changelog").status_code == 404
+                assert client.get(f"/api/trades/{missing}/history").status_code == 404
+        finally:
+            del app.state.container
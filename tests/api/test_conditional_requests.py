@@ -0,0 +1,57 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestConditionalRequests:
+
+    def setup_method(self):
+        app.state.container = AppContainer()
+
+    def teardown_method(self):
+        del app.state.container
+
+    def test_reads_are_not_modified_until_the_trade_changes(self):
+        with TestClient(app) as client:
+            created = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS)
+            trade_id, etag = created.json()["trade_id"], created.headers["ETag"]
+
+            fetched = client.get(f"/api/trades/{trade_id}")
+            history = client.get(f"/api/trades/{trade_id}/history", headers={"If-None-Match": etag})
+            client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"})
+            changed = client.get(f"/api/trades/{trade_id}/history", headers={"If-None-Match": etag})
+
+        assert etag == f'"{trade_id}-1"'
+        assert fetched.status_code == 200 and fetched.headers["ETag"] == etag
+        assert history.status_code == 304 and history.content == b""
+        assert changed.status_code == 200 and changed.headers["ETag"] == f'"{trade_id}-2"'
+
+    def test_writes_with_a_stale_if_match_are_rejected(self):
+        with TestClient(app) as client:
+            created = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS)
+            trade_id, etag = created.json()["trade_id"], created.headers["ETag"]
+
+            submitted = client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"},
+                                    headers={"If-Match": etag})
+            stale = client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"},
+                                headers={"If-Match": etag})
+            foreign = client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"},
+                                  headers={"If-Match": '"another-trade-2"'})
+            current = client.get(f"/api/trades/{trade_id}").json()
+
+        assert submitted.status_code == 200
+        assert (stale.status_code, foreign.status_code) == (412, 412)
+        assert current["version"] == 2
+
+    def test_unknown_trade_is_not_found(self):
+        with TestClient(app) as client:
+            response = client.get("/api/trades/00000000-0000-0000-0000-000000000000")
+
+        assert response.status_code == 404
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.dependencies import get_trade_service, get_history_service
+from trading_approval_process.api.main import app
+from trading_approval_process.api.settings import DATABASE_ENV
+from trading_approval_process.infrastructure import SqliteTradeRepository
+
+
+class TestAppContainer:
+
+    def test_services_share_the_same_repository(self):
+        container = AppContainer()
+
+        assert container.trade_service._repository is container.repository
+        assert container.history_service._repository is container.repository
+        assert container.trade_service._executor is container.executor
+
+    async def test_hooks_run_in_order_on_startup_and_in_reverse_order_on_shutdown(self):
+        container = AppContainer()
+        calls = []
+
+        async def open_pool(): calls.append("open_pool")
+        async def start_worker(): calls.append("start_worker")
+        async def drain_pool(): calls.append("drain_pool")
+        async def stop_worker(): calls.append("stop_worker")
+
+        container.on_startup(open_pool)
+        container.on_startup(start_worker)
+        container.on_shutdown(drain_pool)
+        container.on_shutdown(stop_worker)
+
+        await container.startup()
+        await container.shutdown()
+
+        assert calls == ["open_pool", "start_worker", "stop_worker", "drain_pool"]
+
+    async def test_failing_shutdown_hook_does_not_block_the_others(self):
+        container = AppContainer()
+        calls = []
+
+        async def drain(): calls.append("drain")
+        async def broken(): raise RuntimeError("boom")
+
+        container.on_shutdown(drain)
+        container.on_shutdown(broken)
+
+        await container.startup()
+        await container.shutdown()
+
+        assert calls == ["drain"]
+        assert not container.started
+
+    def test_following_changes_needs_a_repository_that_records_them(self, tmp_path):
+        with pytest.raises(ValueError):
+            AppContainer(follow_changes=True)
+
+    async def test_from_environment_shares_the_database_file_when_one_is_configured(self, tmp_path):
+        assert AppContainer.from_environment({}).change_feed is None
+
+        container = AppContainer.from_environment({DATABASE_ENV: str(tmp_path / "trades.db")})
+        await container.startup()
+        await container.shutdown()
+
+        assert isinstance(container.repository.inner.inner, SqliteTradeRepository)
+        assert container.change_feed is not None
+
+    def test_lifespan_hands_out_cached_singletons(self):
+        container = AppContainer()
+        app.state.container = container
+        try:
+            with TestClient(app):
+                assert container.started
+                assert get_trade_service(container) is container.trade_service
+                assert get_history_service(container) is container.history_service
+            assert not container.started
+        finally:
+            del app.state.container
+
+    def test_trades_created_in_one_request_are_visible_in_the_next(self):
+        app.state.container = AppContainer()
+        details = {
+            "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+            "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+            "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+        }
+        try:
+            with TestClient(app) as client:
+                created = client.post("/api/trades/create", params={"user": "requester"}, json=details)
+                trade_id = created.json()["trade_id"]
+
+                history = client.get(f"/api/trades/{trade_id}/history")
+
+                assert created.status_code == 201
+                assert history.status_code == 200
+                assert history.json()["records"][0]["user_id"] == "requester"
+        finally:
+            del app.state.container
@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestDifferencesEndpoint:
+
+    def test_differences_between_versions_are_cached(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                client.post(f"/api/trades/{trade_id}/update", params={"user": "alice"},
+                            json={**DETAILS, "notional_amount": 2_000_000})
+
+                first = client.get(f"/api/trades/{trade_id}/differences", params={"from": 1, "to": 2})
+                second = client.get(f"/api/trades/{trade_id}/differences", params={"from": 1, "to": 2})
+                missing = client.get(f"/api/trades/{trade_id}/differences", params={"from": 1, "to": 9})
+                stats = client.get("/api/health/stats").json()["differences_cache"]
+
+            assert first.status_code == 200
+            assert first.json() == second.json()
+            assert "notional_amount" in first.json()["changes"]
+            assert missing.status_code == 404
+            assert (stats["hits"], stats["size"]) == (1, 1)
+        finally:
+            del app.state.container
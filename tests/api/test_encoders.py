@@ -0,0 +1,17 @@
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from tests.fixture import Fixture
+from trading_approval_process.api.encoders import dumps
+
+
+class TestEncoders:
+
+    def test_output_matches_the_generic_encoder(self):
+        trade = Fixture().build_valid_executed()
+
+        for payload in (trade, trade.to_history(), trade.get_differences(1, trade.version),
+                        {"items": [trade], "next_cursor": 7}):
+            expected = json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":"))
+            assert dumps(payload).decode() == expected
@@ -0,0 +1,38 @@
+from fastapi.testclient import TestClient
+
+from tests.fixture import Fixture
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+from trading_approval_process.api.sse import stream_events
+from trading_approval_process.infrastructure.events.trade_event_bus import TradeEventBus
+
+
+class TestEventStream:
+
+    async def test_frames_carry_ids_and_end_when_the_subscription_closes(self):
+        fixture = Fixture()
+        bus = TradeEventBus(history=1)
+        bus.on_saved([fixture.build_valid_draft_trade(), fixture.build_valid_draft_trade()])
+        subscription = bus.subscribe(last_event_id=0)
+        frames = stream_events(bus, subscription, keepalive=0.01)
+
+        resync = await anext(frames)
+        trade = await anext(frames)
+        keepalive = await anext(frames)
+        subscription.close()
+        rest = [frame async for frame in frames]
+
+        assert resync.startswith("event: resync\n")
+        assert trade.startswith("id: 2\nevent: trade\ndata: {")
+        assert keepalive == ": keepalive\n\n"
+        assert rest == []
+        assert len(bus) == 0
+
+    def test_unknown_state_filter_is_rejected(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                response = client.get("/api/trades/events", params={"state": "NOPE"})
+            assert response.status_code == 422
+        finally:
+            del app.state.container
@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class DownExecutor(ITradeExecutor):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def send(self, trade, token):
+        self.calls += 1
+        raise ConnectionError("venue down")
+
+
+class TestExecutionUnavailable:
+
+    def test_sends_to_a_failing_venue_answer_503_and_stop_reaching_it(self):
+        executor = DownExecutor()
+        app.state.container = AppContainer(executor=executor)
+        try:
+            with TestClient(app) as client:
+                responses = []
+                for _ in range(6):
+                    trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                    client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"})
+                    client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"})
+                    responses.append(client.post(f"/api/trades/{trade_id}/send_to_execute", params={"user": "bob"}))
+                trade = client.get(f"/api/trades/{trade_id}").json()
+                stats = client.get("/api/health/stats").json()
+
+            assert [response.status_code for response in responses] == [503] * 6
+            assert "circuit open" in responses[-1].json()["detail"]
+            assert int(responses[-1].headers["Retry-After"]) == 10
+            assert executor.calls == 5
+            assert trade["state"] == 5  # still approved: nothing was sent
+            assert stats["execution_venues"]["BankB"]["state"] == "open"
+        finally:
+            del app.state.container
@@ -0,0 +1,56 @@
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestHistoryExport:
+
+    def setup_method(self):
+        app.state.container = AppContainer()
+
+    def teardown_method(self):
+        del app.state.container
+
+    def test_streams_a_trail_as_ndjson_and_csv(self):
+        with TestClient(app) as client:
+            trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+            client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"})
+
+            ndjson = client.get(f"/api/trades/{trade_id}/history/stream")
+            as_csv = client.get(f"/api/trades/{trade_id}/history/stream", params={"format": "csv"})
+            history = client.get(f"/api/trades/{trade_id}/history").json()
+
+        assert ndjson.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in ndjson.text.splitlines()]
+        assert [{key: value for key, value in line.items() if key != "trade_id"} for line in lines] == history["records"]
+        rows = list(csv.DictReader(io.StringIO(as_csv.text)))
+        assert [(row["step"], row["action"], row["counterparty"]) for row in rows] == [
+            ("1", "CREATE", "BankB"), ("2", "SUBMIT", "BankB")]
+
+    def test_exports_all_trades_in_a_time_range(self):
+        with TestClient(app) as client:
+            ids = {client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                   for _ in range(3)}
+
+            everything = client.get("/api/trades/history/export", params={"from": "2000-01-01T00:00:00"})
+            nothing = client.get("/api/trades/history/export", params={"to": "2000-01-01T00:00:00"})
+
+        assert {json.loads(line)["trade_id"] for line in everything.text.splitlines()} == ids
+        assert nothing.status_code == 200 and nothing.text == ""
+
+    def test_unknown_trade_is_not_found(self):
+        with TestClient(app) as client:
+            response = client.get("/api/trades/00000000-0000-0000-0000-000000000000/history/stream")
+
+        assert response.status_code == 404
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+from trading_approval_process.infrastructure import InmemoryTradeExecutor
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class CountingExecutor(InmemoryTradeExecutor):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def send(self, trade, token):
+        self.calls += 1
+        return await super().send(trade, token)
+
+
+class TestIdempotencyKeys:
+
+    def setup_method(self):
+        self.executor = CountingExecutor()
+        app.state.container = AppContainer(executor=self.executor)
+
+    def teardown_method(self):
+        del app.state.container
+
+    def test_a_retried_create_returns_the_first_trade(self):
+        headers = {"Idempotency-Key": "create-1"}
+        with TestClient(app) as client:
+            first = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS, headers=headers)
+            retry = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS, headers=headers)
+            other = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS)
+            listed = client.get("/api/trades", params={"limit": 10}).json()
+
+        assert retry.status_code == first.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["ETag"] == first.headers["ETag"]
+        assert retry.headers["Idempotent-Replayed"] == "true" and "Idempotent-Replayed" not in first.headers
+        assert other.json()["trade_id"] != first.json()["trade_id"]
+        assert len(listed["items"]) == 2
+
+    def test_a_key_reused_with_another_body_is_refused(self):
+        with TestClient(app) as client:
+            client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS, headers={"Idempotency-Key": "k"})
+            reused = client.post("/api/trades/create", params={"user": "alice"},
+                                 json={**DETAILS, "notional_amount": 5}, headers={"Idempotency-Key": "k"})
+
+        assert reused.status_code == 422
+        assert "already used" in reused.json()["detail"]
+
+    def test_the_same_key_from_another_user_is_a_new_request(self):
+        headers = {"Idempotency-Key": "shared"}
+        with TestClient(app) as client:
+            alices = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS, headers=headers)
+            bobs = client.post("/api/trades/create", params={"user": "bob"}, json=DETAILS, headers=headers)
+
+        assert alices.status_code == bobs.status_code == 201
+        assert "Idempotent-Replayed" not in bobs.headers
+        assert bobs.json()["trade_id"] != alices.json()["trade_id"]
+        assert bobs.json()["requester"] == "bob"
+
+    async def test_concurrent_duplicate_sends_reach_the_venue_once(self):
+        container = app.state.container
+        await container.startup()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            trade_id = (await client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS)).json()["trade_id"]
+            await client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"})
+            await client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"})
+
+            sends = await asyncio.gather(*(client.post(f"/api/trades/{trade_id}/send_to_execute", params={"user": "bob"},
+                                                       headers={"Idempotency-Key": "send-1"}) for _ in range(5)))
+        await container.shutdown()
+
+        assert [response.status_code for response in sends] == [200] * 5
+        assert len({response.json()["execution_receipt"]["ticket_id"] for response in sends}) == 1
+        assert self.executor.calls == 1
+        assert container.idempotency.stats().joined == 4
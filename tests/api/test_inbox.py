@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestInboxEndpoint:
+
+    def test_inbox_lists_trades_waiting_for_the_user(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                created = client.post("/api/trades/batch/create", params={"user": "alice"}, json=[DETAILS] * 3)
+                ids = [item["trade_id"] for item in created.json()]
+                client.post("/api/trades/batch/submit", params={"user": "alice"}, json=ids)
+                client.post(f"/api/trades/{ids[0]}/approve", params={"user": "bob"})
+
+                bob = client.get("/api/trades/inbox", params={"user": "bob", "limit": 1}).json()
+                bob_next = client.get("/api/trades/inbox",
+                                      params={"user": "bob", "limit": 1, "cursor": bob["next_cursor"]}).json()
+                alice = client.get("/api/trades/inbox", params={"user": "alice"}).json()
+
+            assert [item["trade_id"] for item in bob["items"] + bob_next["items"]] == ids[1:]
+            assert bob_next["next_cursor"] is None
+            assert alice["items"] == []
+        finally:
+            del app.state.container
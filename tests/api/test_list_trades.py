@@ -0,0 +1,33 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestListTrades:
+
+    def test_pending_trades_for_counterparty_are_paged_by_cursor(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                created = client.post("/api/trades/batch/create", params={"user": "requester"},
+                                      json=[DETAILS, {**DETAILS, "counterparty": "BankC"}] * 3)
+                ids = [item["trade_id"] for item in created.json()]
+                client.post("/api/trades/batch/submit", params={"user": "requester"}, json=ids[1::2])
+
+                filters = {"state": "PENDING_APPROVAL", "counterparty": "BankC", "limit": 2}
+                first = client.get("/api/trades", params=filters).json()
+                second = client.get("/api/trades", params={**filters, "cursor": first["next_cursor"]}).json()
+                too_large = client.get("/api/trades", params={"limit": 100_000})
+
+            assert [item["trade_id"] for item in first["items"] + second["items"]] == ids[1::2]
+            assert second["next_cursor"] is None
+            assert too_large.status_code == 422
+        finally:
+            del app.state.container
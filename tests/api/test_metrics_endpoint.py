@@ -0,0 +1,58 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app
+from trading_approval_process.core.instrumentation import instrumentation
+from trading_approval_process.core.span_sinks import HistogramSink
+
+DETAILS = {
+    "trading_entity": "BankA", "counterparty": "BankB", "direction": 1, "style": 1,
+    "notional_currency": "USD", "notional_amount": 1_000_000, "underlying": "USD/EUR",
+    "trade_date": "2025-01-02", "value_date": "2025-01-04", "delivery_date": "2025-01-07",
+}
+
+
+class TestMetricsEndpoint:
+
+    def test_prometheus_exposition_of_workflow_metrics(self):
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                client.post(f"/api/trades/{trade_id}/submit", params={"user": "alice"})
+                client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"})
+                response = client.get("/metrics")
+        finally:
+            del app.state.container
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert "# TYPE trade_state_dwell_seconds histogram" in lines
+        assert 'trade_state_dwell_seconds_bucket{state="DRAFT",le="1"} 1' in lines
+        assert 'trade_state_dwell_seconds_count{state="PENDING_APPROVAL"} 1' in lines
+        assert 'trade_approval_latency_seconds_bucket{approver="bob",le="+Inf"} 1' in lines
+        assert 'trade_transitions_total{action="APPROVE"} 1' in lines
+        assert "trade_approval_sla_breaches_total 0" in lines
+        assert "trade_differences_cache_entries 0" in lines
+        assert 'trade_execution_circuit_open{venue="BankB"} 0' not in lines  # nothing sent yet
+
+    def test_span_histograms_are_exported_while_the_app_runs(self):
+        sink = HistogramSink()
+        app.state.container = AppContainer(span_sinks=[sink])
+        try:
+            with TestClient(app) as client:
+                assert instrumentation.sinks == (sink,)
+                trade_id = client.post("/api/trades/create", params={"user": "alice"}, json=DETAILS).json()["trade_id"]
+                client.post(f"/api/trades/{trade_id}/approve", params={"user": "bob"})  # not submitted: rejected
+                response = client.get("/metrics")
+        finally:
+            del app.state.container
+
+        assert instrumentation.sinks == ()
+        lines = response.text.splitlines()
+        assert "# TYPE trade_span_duration_seconds histogram" in lines
+        assert 'trade_span_duration_seconds_count{span="CreateCommand.run"} 1' in lines
+        assert 'trade_span_duration_seconds_count{span="CreateCommand.run.save"} 1' in lines
+        assert 'trade_span_duration_seconds_count{span="repository.add"} 1' in lines
+        assert 'trade_span_errors_total{span="ApproveCommand.run"} 1' in lines
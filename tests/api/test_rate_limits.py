@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.main import app, limiter
+from trading_approval_process.api.rate_limits import RateLimiter
+from trading_approval_process.api.settings import RATE_LIMIT_ENV, RATE_LIMIT_STORAGE_ENV
+
+
+class TestRateLimits:
+
+    def test_workers_sharing_the_storage_enforce_one_limit_per_client(self, tmp_path):
+        environ = {RATE_LIMIT_ENV: "3/minute", RATE_LIMIT_STORAGE_ENV: f"sqlite:///{tmp_path / 'rate-limits.db'}"}
+        # Two worker processes: each builds its own limiter over the same file.
+        workers = [RateLimiter.from_environment(environ), RateLimiter.from_environment(environ)]
+        app.state.container = AppContainer()
+        try:
+            with TestClient(app) as client:
+                statuses = []
+                for request in range(5):
+                    app.state.limiter = workers[request % 2]
+                    statuses.append(client.get("/api/trades").status_code)
+        finally:
+            app.state.limiter = limiter
+            del app.state.container
+
+        assert statuses == [200, 200, 200, 429, 429]
+
+    def test_health_probes_and_metrics_are_never_limited(self):
+        app.state.container = AppContainer()
+        app.state.limiter = RateLimiter("1/minute")
+        try:
+            with TestClient(app) as client:
+                assert client.get("/api/trades").status_code == 200
+                assert client.get("/api/trades").status_code == 429
+                assert all(client.get(path).status_code == 200
+                           for path in ("/api/health/live", "/metrics") for _ in range(5))
+        finally:
+            app.state.limiter = limiter
+            del app.state.container
+
+    def test_no_limit_is_enforced_unless_configured(self):
+        app.state.container = AppContainer()
+        app.state.limiter = RateLimiter.from_environment({})
+        try:
+            with TestClient(app) as client:
+                assert all(client.get("/api/trades").status_code == 200 for _ in range(20))
+        finally:
+            app.state.limiter = limiter
+            del app.state.container
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.application.views.approval_inbox import ApprovalInbox
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import (
+    EventSourcedTradeRepository, InmemoryTradeExecutor, InMemoryTradeRepository, ObservedTradeRepository,
+    SqliteTradeRepository)
+
+
+def build(fixture: Fixture, repository: ObservedTradeRepository) -> tuple[TradeApprovalService, ApprovalInbox]:
+    inbox = ApprovalInbox()
+    repository.subscribe(inbox)
+    return TradeApprovalService(InmemoryTradeExecutor(), repository, fixture.time_mock), inbox
+
+
+def ids(page) -> list:
+    return [item.trade_id for item in page.items]
+
+
+class TestApprovalInbox:
+
+    async def test_inbox_follows_state_transitions(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        service, inbox = build(fixture, ObservedTradeRepository(InMemoryTradeRepository()))
+        details = fixture.build_valid_details()
+
+        first = await service.create("alice", details, token)
+        second = await service.create("bob", details, token)
+        assert len(inbox) == 0
+        await service.submit("alice", first.trade_id, token)
+        await service.submit("bob", second.trade_id, token)
+
+        assert ids(inbox.page("carol")) == [first.trade_id, second.trade_id]
+        assert ids(inbox.page("alice")) == [second.trade_id]
+
+        # An approver's update sends the trade back to its requester for reapproval.
+        await service.update("carol", first.trade_id, details, token)
+        assert ids(inbox.page("carol")) == [second.trade_id]
+        assert [(item.trade_id, item.state) for item in inbox.page("alice").items] == [
+            (second.trade_id, TradeState.PENDING_APPROVAL), (first.trade_id, TradeState.NEEDS_REAPPROVAL)]
+
+        await service.approve("alice", first.trade_id, token)
+        await service.cancel("carol", second.trade_id, token)
+        assert len(inbox) == 0
+        assert inbox.page("alice").items == []
+
+    async def test_pages_and_rejected_saves(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        service, inbox = build(fixture, ObservedTradeRepository(InMemoryTradeRepository()))
+        created = await service.create_many("alice", [fixture.build_valid_details()] * 5, token)
+        trade_ids = [result.trade_id for result in created]
+        await service.submit_many("alice", trade_ids, token)
+
+        first = inbox.page("bob", limit=3)
+        second = inbox.page("bob", limit=3, after=first.next_cursor)
+        assert ids(first) + ids(second) == trade_ids
+        assert second.next_cursor is None
+
+        # Not authorised: nothing is saved, so the inbox does not move.
+        results = await service.approve_many("alice", trade_ids[:1], token)
+        assert results[0].error is not None
+        assert len(inbox) == 5
+
+    async def test_trades_that_stopped_waiting_are_forgotten_beyond_capacity(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        repository = ObservedTradeRepository(InMemoryTradeRepository())
+        inbox = ApprovalInbox(departed_capacity=2)
+        repository.subscribe(inbox)
+        service = TradeApprovalService(InmemoryTradeExecutor(), repository, fixture.time_mock)
+        created = await service.create_many("alice", [fixture.build_valid_details()] * 5, token)
+        submitted = [await service.submit("alice", result.trade_id, token) for result in created]
+        for trade in submitted:
+            await service.approve("bob", trade.trade_id, token)
+
+        assert len(inbox) == 0
+        assert len(inbox._departed) == 2
+        inbox.on_saved([submitted[-1]])  # a late notification of the waiting version
+        assert len(inbox) == 0
+
+    async def test_rebuild_from_repository(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        store = InMemoryTradeRepository()
+        service, live = build(fixture, ObservedTradeRepository(store))
+        created = await service.create_many("alice", [fixture.build_valid_details()] * 3, token)
+        trade_ids = [result.trade_id for result in created]
+        await service.submit_many("alice", trade_ids, token)
+        await service.update("bob", trade_ids[1], fixture.build_valid_details(), token)
+
+        rebuilt = ApprovalInbox()
+        await rebuilt.rebuild(store, token)
+
+        for user in ("alice", "bob"):
+            assert ids(rebuilt.page(user)) == ids(live.page(user))
+
+    @pytest.mark.parametrize("store", ["inmemory", "sqlite", "event_sourced"])
+    async def test_a_cancelled_save_leaves_store_and_inbox_in_step(self, tmp_path, store):
+        fixture = Fixture()
+        token, cancelled = CancellationToken(), CancellationToken()
+        cancelled.cancel()
+        inner = {"inmemory": lambda: InMemoryTradeRepository(),
+                 "sqlite": lambda: SqliteTradeRepository(str(tmp_path / "trades.db")),
+                 "event_sourced": lambda: EventSourcedTradeRepository(str(tmp_path))}[store]()
+        repository = ObservedTradeRepository(inner)
+        inbox = ApprovalInbox()
+        repository.subscribe(inbox)
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        loaded = await repository.get_by_id(trade.trade_id, token)
+        loaded.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        with pytest.raises(asyncio.CancelledError):
+            await repository.update(loaded, cancelled)
+        with pytest.raises(asyncio.CancelledError):
+            await repository.add_many([fixture.build_valid_draft_trade()], cancelled)
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        await repository.close()
+        assert stored.state == TradeState.DRAFT
+        assert len(inbox) == 0
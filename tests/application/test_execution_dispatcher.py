@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.services.execution_dispatcher import ExecutionDispatcher
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.application.views.execution_outbox import ExecutionOutbox
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.retry_policy import RetryPolicy
+from trading_approval_process.domain.exceptions import ValidationException
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import (
+    InmemoryTradeExecutor, InMemoryTradeRepository, ObservedTradeRepository)
+
+
+class FlakyExecutor(InmemoryTradeExecutor):
+    """Fails the first `failures` sends, then records what it sends."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.sent: list = []
+
+    async def send(self, trade, token):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("venue unavailable")
+        self.sent.append((trade.trade_id, trade.version))
+        return await super().send(trade, token)
+
+
+def build(fixture: Fixture, executor: FlakyExecutor, repository: ObservedTradeRepository | None = None):
+    repository = repository or ObservedTradeRepository(InMemoryTradeRepository())
+    outbox = ExecutionOutbox()
+    repository.subscribe(outbox)
+    service = TradeApprovalService(executor, repository, fixture.time_mock, deferred_execution=True)
+    dispatcher = ExecutionDispatcher(outbox, executor, service, repository, concurrency=2,
+                                     retry_policy=RetryPolicy(attempts=3, base_delay=0, retry_on=(Exception,)))
+    return service, outbox, dispatcher, repository
+
+
+async def approved_trade(fixture: Fixture, service: TradeApprovalService, token: CancellationToken):
+    trade = await service.create(fixture.requester, fixture.build_valid_details(), token)
+    await service.submit(fixture.requester, trade.trade_id, token)
+    return await service.approve(fixture.none_requester, trade.trade_id, token)
+
+
+async def drained(outbox: ExecutionOutbox) -> None:
+    while len(outbox):
+        await asyncio.sleep(0.005)
+
+
+class TestExecutionDispatcher:
+
+    async def test_send_returns_before_the_receipt_is_recorded_once(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        executor = FlakyExecutor(failures=2)
+        service, outbox, dispatcher, repository = build(fixture, executor)
+        trade = await approved_trade(fixture, service, token)
+
+        sent = await service.send_to_execute(fixture.none_requester, trade.trade_id, token)
+        assert (sent.state, sent.execution_receipt, len(outbox)) == (TradeState.SENT_TO_COUNTERPARTY, None, 1)
+
+        await dispatcher.start()
+        await drained(outbox)
+        await dispatcher.stop()
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert stored.execution_receipt is not None
+        assert stored.audit[-1].action == TradeAction.RECORD_RECEIPT
+        assert stored.version == sent.version + 1
+        assert executor.sent == [(trade.trade_id, sent.version)]
+        stats = dispatcher.stats()
+        assert (stats.dispatched, stats.superseded, stats.depth) == (1, 0, 0)
+
+    async def test_trade_cancelled_before_dispatch_is_not_sent(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        executor = FlakyExecutor()
+        service, outbox, dispatcher, repository = build(fixture, executor)
+        trade = await approved_trade(fixture, service, token)
+        await service.send_to_execute(fixture.none_requester, trade.trade_id, token)
+        await service.cancel(fixture.none_requester, trade.trade_id, token)
+
+        await dispatcher.start()
+        await drained(outbox)
+        await dispatcher.stop()
+
+        assert executor.sent == []
+        assert dispatcher.stats().superseded == 1
+
+    async def test_trade_cannot_be_booked_before_it_is_dispatched(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        executor = FlakyExecutor()
+        service, outbox, dispatcher, repository = build(fixture, executor)
+        trade = await approved_trade(fixture, service, token)
+        sent = await service.send_to_execute(fixture.none_requester, trade.trade_id, token)
+
+        with pytest.raises(ValidationException):
+            await service.book(fixture.requester, trade.trade_id, fixture.build_execution_confirmation(sent), token)
+
+        await dispatcher.start()
+        await drained(outbox)
+        await dispatcher.stop()
+
+        assert executor.sent == [(trade.trade_id, sent.version)]
+        dispatched = await repository.get_by_id(trade.trade_id, token)
+        booked = await service.book(fixture.requester, trade.trade_id,
+                                    fixture.build_execution_confirmation(dispatched), token)
+        assert booked.state == TradeState.EXECUTED
+
+    async def test_intent_for_a_trade_that_is_gone_is_dropped_not_retried(self):
+        fixture = Fixture()
+        executor = FlakyExecutor()
+        _, outbox, dispatcher, _ = build(fixture, executor)
+        missing = fixture.build_valid_sent_to_counterparty()
+        missing.execution_receipt = None
+        outbox.on_saved([missing])  # queued, but never stored
+
+        await dispatcher.start()
+        await asyncio.wait_for(drained(outbox), timeout=1)
+        await dispatcher.stop()
+
+        assert executor.sent == []
+        stats = dispatcher.stats()
+        assert (stats.superseded, stats.failures) == (1, 0)
+
+    async def test_rebuild_queues_intents_left_by_a_restart(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        executor = FlakyExecutor()
+        service, outbox, dispatcher, repository = build(fixture, executor)
+        trade = await approved_trade(fixture, service, token)
+        await service.send_to_execute(fixture.none_requester, trade.trade_id, token)
+
+        # A new process over the same store: its outbox only knows what rebuild finds.
+        _, restarted_outbox, restarted, _ = build(fixture, executor, ObservedTradeRepository(repository.inner))
+        await restarted_outbox.rebuild(repository, token)
+        await restarted_outbox.rebuild(repository, token)
+        assert len(restarted_outbox) == 1
+
+        await restarted.start()
+        await drained(restarted_outbox)
+        await restarted.stop()
+
+        assert len(executor.sent) == 1
+        assert (await repository.get_by_id(trade.trade_id, token)).execution_receipt is not None
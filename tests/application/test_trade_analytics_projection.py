@@ -0,0 +1,109 @@
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.views.trade_analytics_projection import TradeAnalyticsProjection
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_analytics import AnalyticsFilter
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import InMemoryTradeRepository
+
+
+def with_details(trade, **changes):
+    trade.details = replace(trade.details, **changes)
+    return trade
+
+
+def approved_after(fixture: Fixture, approver: str, minutes: int):
+    trade = fixture.build_valid_pending_approval()
+    trade.approver = approver
+    trade.change(approver, TradeAction.APPROVE, fixture.fixed_now + timedelta(minutes=minutes))
+    return trade
+
+
+class TestTradeAnalyticsProjection:
+
+    def setup_method(self):
+        self.fixture = Fixture()
+        self.analytics = TradeAnalyticsProjection(capacity=2)  # grows while the tests add trades
+
+    def test_notional_by_currency_and_state(self):
+        f = self.fixture
+        self.analytics.on_saved([
+            f.build_valid_draft_trade(),
+            with_details(f.build_valid_draft_trade(), notional_amount=500),
+            with_details(f.build_valid_draft_trade(), notional_currency="EUR", notional_amount=7),
+            f.build_valid_cancelled(),
+        ])
+
+        groups = self.analytics.notional(("currency", "state"))
+
+        assert [(g.group, g.trades, g.notional) for g in groups] == [
+            ({"currency": "USD", "state": TradeState.DRAFT}, 2, 1_000_500),
+            ({"currency": "USD", "state": TradeState.CANCELLED}, 1, 1_000_000),
+            ({"currency": "EUR", "state": TradeState.DRAFT}, 1, 7),
+        ]
+        assert self.analytics.notional((), AnalyticsFilter(states=(TradeState.DRAFT,), currency="USD"))[0].trades == 2
+        assert self.analytics.notional(("state",), AnalyticsFilter(currency="JPY")) == []
+
+    def test_later_saves_replace_a_trades_row(self):
+        trade = self.fixture.build_valid_draft_trade()
+        self.analytics.on_saved([trade])
+        stale = trade.__copy__()
+        trade.change(self.fixture.requester, TradeAction.CANCEL, self.fixture.fixed_now)
+
+        self.analytics.on_saved([trade])
+        self.analytics.on_saved([stale])  # overtaken notification
+
+        assert len(self.analytics) == 1
+        assert self.analytics.notional(("state",))[0].group == {"state": TradeState.CANCELLED}
+
+    def test_group_by_dates_and_filter_by_trade_date_range(self):
+        f = self.fixture
+        first, second = date(2025, 3, 1), date(2025, 3, 2)
+        self.analytics.on_saved([
+            with_details(f.build_valid_draft_trade(), trade_date=first),
+            with_details(f.build_valid_draft_trade(), trade_date=second),
+            with_details(f.build_valid_draft_trade(), trade_date=second),
+        ])
+
+        groups = self.analytics.notional(("trade_date",), AnalyticsFilter(trade_date_from=second, trade_date_to=second))
+
+        assert [(g.group, g.trades) for g in groups] == [({"trade_date": second}, 2)]
+
+    def test_unknown_group_fields_are_refused(self):
+        with pytest.raises(ValueError):
+            self.analytics.notional(("notional",))
+
+    def test_approval_turnaround_per_approver(self):
+        f = self.fixture
+        self.analytics.on_saved([approved_after(f, "alice", 10), approved_after(f, "alice", 30),
+                                 approved_after(f, "bob", 5), f.build_valid_pending_approval()])
+
+        turnaround = self.analytics.approval_turnaround()
+
+        assert [(t.approver, t.approvals, t.average_seconds, t.max_seconds) for t in turnaround] == [
+            ("alice", 2, 1200.0, 1800.0), ("bob", 1, 300.0, 300.0)]
+
+    def test_cancellations_per_counterparty(self):
+        f = self.fixture
+        self.analytics.on_saved([f.build_valid_cancelled(), f.build_valid_draft_trade(),
+                                 with_details(f.build_valid_draft_trade(), counterparty="BankC")])
+
+        cancellations = self.analytics.cancellations()
+
+        assert [(c.counterparty, c.trades, c.cancelled, c.cancellation_ratio) for c in cancellations] == [
+            ("BankB", 2, 1, 0.5), ("BankC", 1, 0, 0.0)]
+
+    async def test_rebuild_projects_every_trade_in_the_repository(self):
+        repository, token = InMemoryTradeRepository(), CancellationToken()
+        for trade in (self.fixture.build_valid_draft_trade(), self.fixture.build_valid_executed()):
+            await repository.add(trade, token)
+
+        await self.analytics.rebuild(repository, token)
+
+        assert {g.group["state"]: g.trades for g in self.analytics.notional(("state",))} == {
+            TradeState.DRAFT: 1, TradeState.EXECUTED: 1}
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.views.workflow_metrics import WorkflowMetrics
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import InMemoryTradeRepository
+
+
+class TestWorkflowMetrics:
+
+    def setup_method(self):
+        self.fixture = Fixture()
+        self.start = self.fixture.fixed_now
+        self.time = Mock(spec=ITimeProvider)
+        self.time.now.return_value = self.start
+        self.metrics = WorkflowMetrics(self.time, sla_seconds=3600, tick=1.0)
+
+    def at(self, minutes: float):
+        return self.start + timedelta(minutes=minutes)
+
+    def draft(self) -> Trade:
+        trade = Trade()
+        trade.requester = self.fixture.requester
+        trade.details = self.fixture.build_valid_details()
+        trade.change(self.fixture.requester, TradeAction.CREATE, self.at(0))
+        return trade
+
+    def test_dwell_times_and_approval_latency_follow_the_transitions(self):
+        trade = self.draft()
+        self.metrics.on_saved([trade])
+        trade.change(self.fixture.requester, TradeAction.SUBMIT, self.at(10))
+        self.metrics.on_saved([trade])
+        trade.approver = "bob"
+        trade.change("bob", TradeAction.APPROVE, self.at(40))
+        self.metrics.on_saved([trade])
+        self.metrics.on_saved([trade])  # repeated notification
+
+        assert self.metrics.dwell[TradeState.DRAFT].sum == pytest.approx(600)
+        assert self.metrics.dwell[TradeState.PENDING_APPROVAL].count == 1
+        assert self.metrics.approval_latency["bob"].quantile(0.5) == pytest.approx(1800, rel=1 / 32)
+        assert self.metrics.transitions == {TradeAction.CREATE: 1, TradeAction.SUBMIT: 1, TradeAction.APPROVE: 1}
+
+    def test_trades_waiting_past_the_sla_are_reported_once(self):
+        waiting, approved = self.draft(), self.draft()
+        for trade in (waiting, approved):
+            trade.change(self.fixture.requester, TradeAction.SUBMIT, self.at(0))
+        self.metrics.on_saved([waiting, approved])
+        approved.approver = "bob"
+        approved.change("bob", TradeAction.APPROVE, self.at(30))
+        self.metrics.on_saved([approved])
+
+        self.time.now.return_value = self.at(59)
+        assert self.metrics.check_sla() == []
+        self.time.now.return_value = self.at(61)
+        assert self.metrics.check_sla() == [waiting.trade_id]
+        assert self.metrics.check_sla() == []
+        stats = self.metrics.sla_stats()
+        assert (stats.watched, stats.breached, stats.breaches_total) == (0, 1, 1)
+
+        waiting.change(self.fixture.none_requester, TradeAction.CANCEL, self.at(62))
+        self.metrics.on_saved([waiting])
+        assert self.metrics.sla_stats().breached == 0
+
+    def test_a_finished_trade_delivered_again_is_not_counted_twice(self):
+        trade = self.draft()
+        trade.change(self.fixture.requester, TradeAction.SUBMIT, self.at(10))
+        self.metrics.on_saved([trade])
+        trade.change(self.fixture.none_requester, TradeAction.CANCEL, self.at(20))
+        self.metrics.on_saved([trade])
+        self.metrics.on_saved([trade])  # e.g. the change feed after a rebuild
+
+        assert self.metrics.transitions == {TradeAction.CREATE: 1, TradeAction.SUBMIT: 1, TradeAction.CANCEL: 1}
+        assert self.metrics.dwell[TradeState.PENDING_APPROVAL].count == 1
+
+    async def test_rebuild_replays_the_audit_trails(self):
+        repository, token = InMemoryTradeRepository(), CancellationToken()
+        await repository.add(self.fixture.build_valid_executed(), token)
+        await repository.add(self.fixture.build_valid_pending_approval(), token)
+
+        await self.metrics.rebuild(repository, token)
+
+        assert self.metrics.transitions[TradeAction.CREATE] == 2
+        assert self.metrics.approval_latency[self.fixture.none_requester].count == 1
+        assert self.metrics.sla_stats().watched == 1
@@ -0,0 +1,75 @@
+from tests.fixture import Fixture
+from trading_approval_process.application.commands.batch_approve_command import BatchApproveCommand
+from trading_approval_process.application.commands.batch_cancel_command import BatchCancelCommand
+from trading_approval_process.application.commands.batch_create_command import BatchCreateCommand
+from trading_approval_process.application.commands.batch_submit_command import BatchSubmitCommand
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+class TestBatchCommands:
+
+    async def test_create_saves_valid_items_once_and_reports_invalid_ones(self):
+        fixture = Fixture()
+        cmd = BatchCreateCommand(fixture.repo_mock, fixture.time_mock)
+        items = [fixture.build_valid_details(), fixture.build_invalid_details_wrong_dates(), fixture.build_valid_details()]
+
+        results = await cmd.run(fixture.requester, items, CancellationToken())
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].trade_id is None
+        assert "TradeDate" in results[1].error
+        fixture.repo_mock.add_many.assert_awaited_once()
+        saved = fixture.repo_mock.add_many.await_args.args[0]
+        assert [trade.trade_id for trade in saved] == [results[0].trade_id, results[2].trade_id]
+        assert all(trade.state == TradeState.DRAFT for trade in saved)
+
+    async def test_submit_loads_and_saves_in_bulk(self):
+        fixture = Fixture()
+        drafts = [fixture.build_valid_draft_trade() for _ in range(3)]
+        fixture.repo_mock.get_many.return_value = drafts
+        cmd = BatchSubmitCommand(fixture.repo_mock, fixture.time_mock)
+
+        results = await cmd.run(fixture.requester, [trade.trade_id for trade in drafts], CancellationToken())
+
+        assert all(result.ok and result.state == TradeState.PENDING_APPROVAL for result in results)
+        fixture.repo_mock.get_many.assert_awaited_once()
+        fixture.repo_mock.update_many.assert_awaited_once()
+        fixture.repo_mock.get_by_id.assert_not_awaited()
+
+    async def test_approve_sets_the_approver_and_skips_unauthorised_items(self):
+        fixture = Fixture()
+        pending = fixture.build_valid_pending_approval()
+        draft = fixture.build_valid_draft_trade()
+        fixture.repo_mock.get_many.return_value = [pending, draft, None]
+        cmd = BatchApproveCommand(fixture.repo_mock, fixture.time_mock)
+
+        results = await cmd.run(fixture.none_requester, [pending.trade_id, draft.trade_id, "missing"], CancellationToken())
+
+        assert [result.ok for result in results] == [True, False, False]
+        assert "TRADE_INVALID_TRANSITION" in results[1].error
+        assert "TRADE_NOT_FOUND" in results[2].error
+        saved = fixture.repo_mock.update_many.await_args.args[0]
+        assert saved == [pending]
+        assert pending.approver == fixture.none_requester
+
+    async def test_duplicate_ids_are_rejected_after_the_first(self):
+        fixture = Fixture()
+        draft = fixture.build_valid_draft_trade()
+        fixture.repo_mock.get_many.return_value = [draft, draft]
+        cmd = BatchCancelCommand(fixture.repo_mock, fixture.time_mock)
+
+        results = await cmd.run(fixture.requester, [draft.trade_id, draft.trade_id], CancellationToken())
+
+        assert [result.ok for result in results] == [True, False]
+        assert draft.version == 2
+
+    async def test_nothing_is_saved_when_every_item_fails(self):
+        fixture = Fixture()
+        fixture.repo_mock.get_many.return_value = [fixture.build_valid_draft_trade()]
+        cmd = BatchApproveCommand(fixture.repo_mock, fixture.time_mock)
+
+        results = await cmd.run(fixture.requester, ["any"], CancellationToken())
+
+        assert not results[0].ok
+        fixture.repo_mock.update_many.assert_not_awaited()
@@ -0,0 +1,25 @@
+from tests.fixture import Fixture
+from trading_approval_process.application.commands.changelog_command import ChangelogCommand
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+class TestChangelogCommand:
+
+    async def test_changelog_lists_every_version_with_its_changes(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_needs_reapproval()
+        fixture.repo_mock.get_by_id.return_value = trade
+        cmd = ChangelogCommand(fixture.repo_mock)
+        token = CancellationToken()
+
+        changelog = await cmd.run(trade.trade_id, token)
+
+        assert changelog.trade_id == trade.trade_id
+        assert [entry.version for entry in changelog.entries] == [record.step for record in trade.audit]
+        assert changelog.entries[-1].action == TradeAction.UPDATE
+        assert changelog.entries[-1].changes == {"notional_amount": (str(1_000_000), str(2_000_000))}
+        assert all(entry.changes == {} for entry in changelog.entries[:-1])
+        # Each consecutive pair agrees with get_differences
+        for entry in changelog.entries[1:]:
+            assert entry.changes == trade.get_differences(entry.version - 1, entry.version).changes
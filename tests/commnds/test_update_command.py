@@ -31,6 +31,18 @@ class TestUpdateCommand:
         with pytest.raises(ValidationException):
             await cmd.run(fixture.none_requester, trade.trade_id, invalid_details, token)
 
+    async def test_rejects_a_stale_expected_version(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_draft_trade()
+        details = fixture.build_valid_details()
+        fixture.repo_mock.get_by_id.return_value = trade
+        cmd = UpdateCommand(fixture.repo_mock, fixture.time_mock)
+        token = CancellationToken()
+
+        with pytest.raises(PreconditionFailedException):
+            await cmd.run(fixture.requester, trade.trade_id, details, token, expected_version=trade.version - 1)
+        fixture.repo_mock.update.assert_not_awaited()
+
     async def test_rejects_invalid_state_transition(self):
         fixture = Fixture()
         trade = fixture.build_valid_init_trade()
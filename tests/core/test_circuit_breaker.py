@@ -0,0 +1,83 @@
+import pytest
+
+from trading_approval_process.core.bulkhead import Bulkhead, BulkheadFullError
+from trading_approval_process.core.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+
+    def test_opens_after_consecutive_failures_only(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=FakeClock())
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after == 10
+        assert breaker.stats().rejected == 1
+
+    def test_lets_one_probe_through_after_the_reset_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # the probe is still out
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED and breaker.allow()
+
+    def test_a_failed_probe_opens_the_circuit_again(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after == 10
+        assert breaker.stats().opened == 2
+
+    def test_an_abandoned_probe_frees_the_probe_slot(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow()
+
+        breaker.record_abandoned()
+
+        assert breaker.allow()
+
+
+class TestBulkhead:
+
+    def test_refuses_calls_over_the_limit(self):
+        bulkhead = Bulkhead(limit=1)
+        with bulkhead.enter():
+            with pytest.raises(BulkheadFullError):
+                with bulkhead.enter():
+                    pass
+            assert bulkhead.in_flight == 1
+        with bulkhead.enter():
+            pass
+
+        assert (bulkhead.in_flight, bulkhead.rejected) == (0, 1)
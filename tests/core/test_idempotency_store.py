@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from trading_approval_process.core.idempotency_store import IdempotencyKeyReusedError, IdempotencyStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIdempotencyStore:
+
+    async def test_concurrent_duplicates_share_one_execution(self):
+        store, calls = IdempotencyStore(), []
+
+        async def operation():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        results = await asyncio.gather(*(store.run("k", "f", operation) for _ in range(5)))
+        replay = await store.run("k", "f", operation)
+
+        assert calls == [1]
+        assert results == [(1, False)] + [(1, True)] * 4
+        assert replay == (1, True)
+        stats = store.stats()
+        assert (stats.executed, stats.joined, stats.replayed) == (1, 4, 1)
+
+    async def test_a_key_reused_for_another_request_is_refused(self):
+        store = IdempotencyStore()
+        await store.run("k", "create", lambda: asyncio.sleep(0, "trade"))
+
+        with pytest.raises(IdempotencyKeyReusedError):
+            await store.run("k", "approve", lambda: asyncio.sleep(0, "other"))
+
+    async def test_failures_and_unkept_outcomes_are_run_again(self):
+        store, calls = IdempotencyStore(), []
+
+        async def fail():
+            calls.append("fail")
+            raise ConnectionError("venue down")
+
+        with pytest.raises(ConnectionError):
+            await store.run("k", "f", fail)
+        assert await store.run("k", "f", lambda: asyncio.sleep(0, 503), keep=lambda status: status < 500) == (503, False)
+        assert await store.run("k", "f", lambda: asyncio.sleep(0, 200)) == (200, False)
+
+        assert calls == ["fail"]
+        assert len(store) == 1
+
+    async def test_outcomes_expire_after_the_ttl_and_the_oldest_are_evicted(self):
+        clock = FakeClock()
+        store = IdempotencyStore(maxsize=2, ttl=60, clock=clock)
+        for key in ("a", "b", "c"):
+            await store.run(key, "f", lambda: asyncio.sleep(0, key))
+        assert len(store) == 2  # "a" was evicted
+
+        clock.now = 60
+
+        assert await store.run("b", "f", lambda: asyncio.sleep(0, "again")) == ("again", False)
+        assert len(store) == 1
@@ -0,0 +1,158 @@
+import itertools
+import logging
+import uuid
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import Span, SpanSink, instrumentation, instrumented, phase
+from trading_approval_process.core.span_sinks import HistogramSink, LogSink, OtlpSpanExporter
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.infrastructure import (
+    InMemoryTradeRepository, InmemoryTradeExecutor, InstrumentedTradeExecutor, InstrumentedTradeRepository)
+
+
+class RecordingSink(SpanSink):
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self.events: list[tuple[str, dict, Span | None]] = []
+
+    def on_span(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def on_event(self, name, attributes, span) -> None:
+        self.events.append((name, attributes, span))
+
+    def named(self, name: str) -> Span:
+        return next(span for span in self.spans if span.name == name)
+
+
+@pytest.fixture
+def sink():
+    sink = RecordingSink()
+    instrumentation.add_sink(sink)
+    yield sink
+    instrumentation.remove_sink(sink)
+
+
+class TestInstrumentation:
+
+    def setup_method(self):
+        self.fixture = Fixture()
+        self.service = TradeApprovalService(InstrumentedTradeExecutor(InmemoryTradeExecutor()),
+                                            InstrumentedTradeRepository(InMemoryTradeRepository()),
+                                            self.fixture.time_mock)
+
+    async def test_commands_are_split_into_phases_around_repository_calls(self, sink):
+        trade = await self.service.create("alice", self.fixture.build_valid_details(), CancellationToken())
+        sink.spans.clear()
+        sink.events.clear()
+
+        await self.service.submit("alice", trade.trade_id, CancellationToken())
+
+        command = sink.named("SubmitCommand.run")
+        assert command.parent is None and command.error is None
+        phases = [span.name for span in sink.spans if span.parent is command]
+        assert phases == ["SubmitCommand.run.load", "SubmitCommand.run.validate", "SubmitCommand.run.change",
+                          "SubmitCommand.run.save"]
+        assert sink.named("repository.get_by_id").parent.name == "SubmitCommand.run.load"
+        assert sink.named("repository.update").parent.name == "SubmitCommand.run.save"
+        assert sum(span.duration for span in sink.spans if span.parent is command) <= command.duration
+
+        name, attributes, span = sink.events[0]
+        assert name == "trade.changed" and span.name == "SubmitCommand.run.change"
+        assert attributes["action"] == "SUBMIT" and attributes["state"] == "PENDING_APPROVAL"
+        assert attributes["trade_id"] == trade.trade_id
+
+    async def test_sends_are_timed_by_counterparty_and_failures_are_marked(self, sink):
+        trade = await self.service.create("alice", self.fixture.build_valid_details(), CancellationToken())
+        await self.service.submit("alice", trade.trade_id, CancellationToken())
+        await self.service.approve("bob", trade.trade_id, CancellationToken())
+        await self.service.send_to_execute("bob", trade.trade_id, CancellationToken())
+
+        send = sink.named("executor.send")
+        assert send.attributes == {"counterparty": trade.details.counterparty}
+        assert send.parent.name == "SendToExecuteCommand.run.change"
+
+        with pytest.raises(NotFoundException):
+            await self.service.approve("bob", uuid.uuid4(), CancellationToken())
+        assert sink.spans[-1].name == "ApproveCommand.run" and sink.spans[-1].error == "NotFoundException"
+        assert sink.spans[-2].name == "ApproveCommand.run.load" and sink.spans[-2].error == "NotFoundException"
+
+    async def test_nothing_is_recorded_without_sinks(self):
+        calls = []
+
+        @instrumented(phased=True)
+        async def command():
+            phase("load")
+            calls.append(instrumentation.span("inner"))
+            return 42
+
+        assert not instrumentation.enabled
+        assert await command() == 42
+        with calls[0] as span:
+            assert span is None
+
+    async def test_a_failing_sink_does_not_fail_the_operation(self, sink, caplog):
+        class Broken(SpanSink):
+            def on_span(self, span):
+                raise RuntimeError("boom")
+
+        broken = Broken()
+        instrumentation.add_sink(broken)
+        try:
+            with caplog.at_level(logging.ERROR):
+                with instrumentation.span("work"):
+                    pass
+        finally:
+            instrumentation.remove_sink(broken)
+
+        assert sink.named("work").duration >= 0
+        assert "failed on span work" in caplog.text
+
+
+class TestSpanSinks:
+
+    span_ids = itertools.count(1)
+
+    def span(self, name="repository.get_by_id", duration=0.002, parent=None, error=None) -> Span:
+        span = Span(name, parent, {"trades": 3}, 100.0, next(self.span_ids), duration=duration, error=error)
+        span.events.append((span.started_at + 0.001, "trade.changed", {"state": "APPROVED"}))
+        return span
+
+    def test_histogram_sink_keeps_durations_and_errors_per_name(self):
+        sink = HistogramSink()
+        for duration in (0.001, 0.002, 0.004):
+            sink.on_span(self.span(duration=duration))
+        sink.on_span(self.span(duration=0.01, error="TimeoutError"))
+
+        histogram = sink.durations["repository.get_by_id"]
+        assert histogram.count == 4
+        assert histogram.quantile(0.5) == pytest.approx(0.002, rel=0.02)
+        assert sink.errors == {"repository.get_by_id": 1}
+
+    def test_log_sink_logs_structured_fields(self, caplog):
+        with caplog.at_level(logging.DEBUG, logger="trading_approval_process.spans"):
+            LogSink().on_span(self.span())
+
+        record = caplog.records[0]
+        assert record.getMessage() == "span repository.get_by_id 2.000 ms"
+        assert record.duration_ms == pytest.approx(2.0) and record.trades == 3
+
+    def test_otlp_exporter_batches_spans_in_otlp_shape(self):
+        exporter = OtlpSpanExporter(batch_size=2)
+        parent = self.span("ApproveCommand.run", error="NotFoundException")
+        exporter.on_span(self.span(parent=parent))
+        assert not exporter.exported
+        exporter.on_span(parent)
+
+        child, root = exporter.exported
+        assert child["traceId"] == root["traceId"] == f"{parent.span_id:032x}"
+        assert child["parentSpanId"] == root["spanId"] and "parentSpanId" not in root
+        assert child["endTimeUnixNano"] - child["startTimeUnixNano"] == 2_000_000
+        assert child["attributes"] == [{"key": "trades", "value": {"intValue": "3"}}]
+        assert child["events"][0]["name"] == "trade.changed"
+        assert root["status"] == {"code": 2, "message": "NotFoundException"} and child["status"] == {"code": 1}
@@ -0,0 +1,51 @@
+import asyncio
+
+from trading_approval_process.core.keyed_lock import KeyedLock
+
+
+class TestKeyedLock:
+
+    async def test_same_key_is_serialised(self):
+        locks = KeyedLock()
+        inside = 0
+        overlaps = 0
+
+        async def work():
+            nonlocal inside, overlaps
+            async with locks.acquire("trade"):
+                inside += 1
+                overlaps += inside > 1
+                await asyncio.sleep(0)
+                inside -= 1
+
+        await asyncio.gather(*(work() for _ in range(20)))
+
+        assert overlaps == 0
+
+    async def test_different_keys_do_not_contend(self):
+        locks = KeyedLock()
+        held = asyncio.Event()
+
+        async def hold_a():
+            async with locks.acquire("a"):
+                await held.wait()
+
+        holder = asyncio.create_task(hold_a())
+        await asyncio.sleep(0)
+        async with locks.acquire("b"):
+            held.set()
+        await holder
+
+    async def test_idle_locks_are_evicted(self):
+        locks = KeyedLock()
+
+        async with locks.acquire("a"):
+            assert len(locks) == 1
+        await asyncio.gather(*(self._touch(locks, key) for key in range(100)))
+
+        assert len(locks) == 0
+
+    @staticmethod
+    async def _touch(locks: KeyedLock, key: int) -> None:
+        async with locks.acquire(key):
+            await asyncio.sleep(0)
@@ -0,0 +1,29 @@
+import pytest
+
+from trading_approval_process.core.log_histogram import LogHistogram
+
+
+class TestLogHistogram:
+
+    def test_quantiles_keep_their_relative_precision_across_magnitudes(self):
+        histogram = LogHistogram(resolution=0.001, precision_bits=6)
+        for value in (0.2, 0.5, 30, 3600, 86_400):
+            histogram.record(value)
+
+        for q, expected in ((0.2, 0.2), (0.4, 0.5), (0.6, 30), (0.8, 3600), (1.0, 86_400)):
+            assert histogram.quantile(q) == pytest.approx(expected, rel=1 / 32)
+        assert (histogram.count, histogram.sum, histogram.max) == (5, pytest.approx(90_030.7), 86_400)
+
+    def test_cumulative_counts_for_exposition_buckets(self):
+        histogram = LogHistogram()
+        for value in (0.5, 2, 2, 40, 7200):
+            histogram.record(value)
+
+        assert histogram.cumulative([60, 1, 3600, 10]) == [(1, 1), (10, 3), (60, 4), (3600, 4)]
+
+    def test_buckets_are_contiguous(self):
+        histogram = LogHistogram(resolution=1, precision_bits=3)
+        bounds = [histogram._bounds(index) for index in range(40)]
+
+        assert all(upper == following[0] for (_, upper), following in zip(bounds, bounds[1:]))
+        assert all(histogram._index(int(low)) == index for index, (low, _) in enumerate(bounds))
@@ -0,0 +1,23 @@
+import pytest
+
+from trading_approval_process.core.lru_cache import LruCache
+
+
+class TestLruCache:
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LruCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now the least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (3, 1, 2)
+        assert stats.hit_ratio == 0.75
+
+    def test_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            LruCache(maxsize=0)
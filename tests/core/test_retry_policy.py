@@ -0,0 +1,50 @@
+import pytest
+
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.retry_policy import RetryPolicy
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+
+
+class TestRetryPolicy:
+
+    async def test_retries_until_the_operation_succeeds(self):
+        policy = RetryPolicy(attempts=3, base_delay=0, retry_on=(ConcurrencyException,))
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConcurrencyException("conflict")
+            return "done"
+
+        assert await policy.run(flaky, CancellationToken()) == "done"
+        assert len(calls) == 3
+
+    async def test_gives_up_after_the_last_attempt(self):
+        policy = RetryPolicy(attempts=2, base_delay=0, retry_on=(ConcurrencyException,))
+
+        async def always_conflicts():
+            raise ConcurrencyException("conflict")
+
+        with pytest.raises(ConcurrencyException):
+            await policy.run(always_conflicts, CancellationToken())
+
+    async def test_other_errors_are_not_retried(self):
+        policy = RetryPolicy(attempts=5, base_delay=0, retry_on=(ConcurrencyException,))
+        calls = []
+
+        async def broken():
+            calls.append(1)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            await policy.run(broken, CancellationToken())
+        assert len(calls) == 1
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(base_delay=0.01, max_delay=0.05)
+
+        delays = [policy.backoff(attempt) for attempt in range(1, 10) for _ in range(50)]
+
+        assert all(0 <= delay <= 0.05 for delay in delays)
+        assert len(set(delays)) > 1
@@ -0,0 +1,41 @@
+from trading_approval_process.core.timer_wheel import TimerWheel
+
+
+class TestTimerWheel:
+
+    def test_timers_fire_once_when_due_and_never_early(self):
+        wheel = TimerWheel(tick=1.0, slots=8)
+        wheel.schedule("b", 3.5)
+        wheel.schedule("a", 2.0)
+        wheel.schedule("later", 21.0)  # more than a turn ahead
+
+        assert wheel.advance(1.9) == []
+        assert wheel.advance(3.0) == ["a"]
+        assert wheel.advance(4.0) == ["b"]
+        assert wheel.advance(13.0) == []  # "later" shares a slot already visited
+        assert wheel.advance(21.0) == ["later"]
+        assert len(wheel) == 0
+
+    def test_rescheduling_and_cancelling(self):
+        wheel = TimerWheel(tick=1.0, slots=8)
+        wheel.schedule("a", 2)
+        wheel.schedule("b", 2)
+        wheel.schedule("a", 5)
+
+        assert wheel.cancel("b") and not wheel.cancel("b")
+        assert wheel.advance(4) == []
+        assert wheel.advance(5) == ["a"]
+
+    def test_a_long_pause_fires_everything_due_in_deadline_order(self):
+        wheel = TimerWheel(tick=1.0, slots=4)
+        for key, deadline in (("c", 9), ("a", 2), ("b", 6), ("d", 30)):
+            wheel.schedule(key, deadline)
+
+        assert wheel.advance(20) == ["a", "b", "c"]
+        assert "d" in wheel
+
+    def test_past_deadlines_fire_on_the_next_advance(self):
+        wheel = TimerWheel(tick=1.0, slots=8, now=100)
+        wheel.schedule("late", 50)
+
+        assert wheel.advance(101) == ["late"]
@@ -0,0 +1,49 @@
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.domain.models.audit_trail import AuditTrail
+
+
+class TestAuditTrail:
+
+    def test_fork_shares_records_without_copying(self):
+        trade = Fixture().build_valid_pending_approval()
+
+        fork = trade.audit.fork()
+
+        assert len(fork) == len(trade.audit)
+        assert fork[0] is trade.audit[0]
+        assert fork[-1] is trade.audit[-1]
+
+    def test_appends_are_invisible_to_other_forks(self):
+        fixture = Fixture()
+        records = list(fixture.build_valid_executed().audit)
+        base = AuditTrail(records[:2])
+        left = base.fork()
+        right = base.fork()
+
+        left.append(records[2])
+        right.append(records[3])
+
+        assert list(base) == records[:2]
+        assert list(left) == records[:3]
+        assert list(right) == records[:2] + [records[3]]
+
+    def test_index_out_of_the_visible_prefix_raises(self):
+        records = list(Fixture().build_valid_pending_approval().audit)
+        longer = AuditTrail(records)
+        shorter = longer.fork()
+        longer.append(records[0])
+
+        with pytest.raises(IndexError):
+            _ = shorter[2]
+        assert shorter[-1] is records[-1]
+        assert shorter[:] == records
+
+    def test_at_step_finds_versions_within_the_visible_prefix(self):
+        records = list(Fixture().build_valid_executed().audit)
+        trail = AuditTrail(records[:3])
+
+        assert [trail.at_step(step).step for step in (1, 2, 3)] == [1, 2, 3]
+        assert trail.at_step(0) is None
+        assert trail.at_step(4) is None
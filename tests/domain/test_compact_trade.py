@@ -0,0 +1,46 @@
+import copy
+from dataclasses import replace
+
+from tests.fixture import Fixture
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+def fresh(text: str) -> str:
+    return "".join(list(text))
+
+
+class TestCompactTrade:
+
+    def test_trade_and_records_have_no_instance_dict(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_draft_trade()
+        for value in (trade, trade.details, trade.audit[0]):
+            assert not hasattr(value, "__dict__")
+
+    def test_repeated_strings_are_interned(self):
+        fixture = Fixture()
+        first, second = fixture.build_valid_draft_trade(), fixture.build_valid_draft_trade()
+        second.details = replace(second.details, counterparty=fresh("BankB"))
+        second.requester = fresh(fixture.requester)
+        second.change(fresh(fixture.requester), TradeAction.SUBMIT, fixture.fixed_now)
+
+        assert second.details.counterparty is first.details.counterparty
+        assert second.requester is first.requester
+        assert second.audit[-1].user_id is first.audit[0].user_id
+
+    def test_unchanged_details_reference_the_previous_record(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_draft_trade()
+        trade.details = replace(trade.details)  # equal value, new instance
+        trade.change(fixture.requester, TradeAction.UPDATE, fixture.fixed_now)
+
+        assert trade.audit[1].details is trade.audit[0].details
+        assert trade.details is trade.audit[0].details
+
+    def test_copy_is_shallow(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_draft_trade()
+        clone = copy.copy(trade)
+        assert clone is not trade
+        assert clone.trade_id == trade.trade_id and clone.details is trade.details
+        assert clone.audit is trade.audit
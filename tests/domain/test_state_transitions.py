@@ -0,0 +1,29 @@
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.domain.exceptions import InvalidTransitionException
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.domain.models.trade_state_transitions import TRANSITIONS, StateTransitions
+
+
+class TestStateTransitions:
+
+    def test_table_matches_the_definition(self):
+        for state in TradeState:
+            for action in TradeAction:
+                expected = StateTransitions._DEFINITION.get(state, {}).get(action)
+                assert TRANSITIONS.lookup(state, action) == expected
+
+    def test_trades_share_the_compiled_table(self):
+        first, second = Trade(), Trade()
+        assert first._transitions is second._transitions is TRANSITIONS
+        assert "_transitions" not in Trade.__slots__
+
+    def test_change_rejects_an_unavailable_action(self):
+        fixture = Fixture()
+        trade = fixture.build_valid_draft_trade()
+        with pytest.raises(InvalidTransitionException):
+            trade.change(fixture.requester, TradeAction.BOOK, fixture.fixed_now)
+        assert trade.version == 1
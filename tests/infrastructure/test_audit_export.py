@@ -0,0 +1,77 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import (
+    EventSourcedTradeRepository, InMemoryTradeRepository, SqliteTradeRepository)
+from trading_approval_process.infrastructure.reository import sqlite_trade_repository
+
+START = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+@pytest.fixture(params=["inmemory", "sqlite", "event_sourced"])
+async def repository(request, tmp_path, monkeypatch):
+    # Small pages so that streams cross several round trips.
+    monkeypatch.setattr(sqlite_trade_repository, "_STREAM_PAGE_SIZE", 3)
+    if request.param == "inmemory":
+        yield InMemoryTradeRepository()
+        return
+    if request.param == "sqlite":
+        repository = SqliteTradeRepository(str(tmp_path / "trades.db"))
+    else:
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=4)
+    yield repository
+    await repository.close()
+
+
+def build_trade(fixture: Fixture, versions: int, offset: int) -> Trade:
+    """A draft updated `versions - 1` times, version n timestamped `offset + n` minutes after START."""
+    trade = Trade()
+    trade.requester = fixture.requester
+    trade.details = fixture.build_valid_details()
+    trade.change(fixture.requester, TradeAction.CREATE, START + timedelta(minutes=offset + 1))
+    for version in range(2, versions + 1):
+        trade.details = replace(trade.details, notional_amount=version)
+        trade.change(fixture.requester, TradeAction.UPDATE, START + timedelta(minutes=offset + version))
+    return trade
+
+
+async def collect(rows) -> list:
+    return [row async for row in rows]
+
+
+class TestAuditExport:
+
+    async def test_streams_a_trail_in_step_order(self, repository):
+        token = CancellationToken()
+        trade = build_trade(Fixture(), versions=10, offset=0)
+        await repository.add(trade, token)
+
+        records = await collect(repository.stream_audit(trade.trade_id, token))
+
+        assert records == list(trade.audit)
+
+    async def test_streaming_an_unknown_trade_fails(self, repository):
+        with pytest.raises(NotFoundException):
+            await collect(repository.stream_audit(Trade().trade_id, CancellationToken()))
+
+    async def test_exports_the_records_in_range(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        first, second = build_trade(fixture, versions=5, offset=0), build_trade(fixture, versions=5, offset=2)
+        await repository.add_many([first, second], token)
+
+        rows = await collect(repository.export_audit(START + timedelta(minutes=3), START + timedelta(minutes=6), token))
+
+        exported = sorted((str(trade_id), record.step) for trade_id, record in rows)
+        assert exported == sorted([(str(first.trade_id), 3), (str(first.trade_id), 4), (str(first.trade_id), 5),
+                                   (str(second.trade_id), 1), (str(second.trade_id), 2), (str(second.trade_id), 3)])
+        for trade in (first, second):
+            steps = [record.step for trade_id, record in rows if str(trade_id) == str(trade.trade_id)]
+            assert steps == sorted(steps)
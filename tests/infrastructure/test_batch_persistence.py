@@ -0,0 +1,69 @@
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import (
+    EventSourcedTradeRepository, InMemoryTradeRepository, SqliteTradeRepository)
+
+
+@pytest.fixture(params=["inmemory", "sqlite", "event_sourced"])
+async def repository(request, tmp_path):
+    if request.param == "inmemory":
+        yield InMemoryTradeRepository()
+        return
+    if request.param == "sqlite":
+        repository = SqliteTradeRepository(str(tmp_path / "trades.db"))
+    else:
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+    yield repository
+    await repository.close()
+
+
+class TestBatchPersistence:
+
+    async def test_add_get_and_update_many(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trades = [fixture.build_valid_draft_trade() for _ in range(3)]
+        await repository.add_many(trades, token)
+
+        loaded = await repository.get_many([trades[2].trade_id, "missing", trades[0].trade_id], token)
+        assert loaded[1] is None
+        assert [trade.trade_id for trade in (loaded[0], loaded[2])] == [trades[2].trade_id, trades[0].trade_id]
+
+        for trade in (loaded[0], loaded[2]):
+            trade.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        await repository.update_many([loaded[0], loaded[2]], token)
+
+        stored = await repository.get_many([trade.trade_id for trade in trades], token)
+        assert [trade.version for trade in stored] == [2, 1, 2]
+        assert [len(trade.audit) for trade in stored] == [2, 1, 2]
+
+    async def test_update_many_is_all_or_nothing(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trades = [fixture.build_valid_draft_trade() for _ in range(2)]
+        await repository.add_many(trades, token)
+
+        fresh, stale = await repository.get_many([trade.trade_id for trade in trades], token)
+        fresh.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        stale.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        stale.change(fixture.requester, TradeAction.CANCEL, fixture.fixed_now)
+
+        with pytest.raises(ConcurrencyException):
+            await repository.update_many([fresh, stale], token)
+        stored = await repository.get_many([trade.trade_id for trade in trades], token)
+        assert [trade.version for trade in stored] == [1, 1]
+
+    async def test_add_many_rejects_existing_ids(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        existing = fixture.build_valid_draft_trade()
+        await repository.add(existing, token)
+        new = fixture.build_valid_draft_trade()
+
+        with pytest.raises(ValueError):
+            await repository.add_many([new, existing], token)
+        assert (await repository.get_many([new.trade_id], token)) == [None]
@@ -0,0 +1,188 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.infrastructure import BatchingTradeExecutor, TcpTradeExecutor
+from trading_approval_process.infrastructure.executor.venue_protocol import VenueAddress
+from trading_approval_process.infrastructure.executor.venue_server import StandInVenueServer
+
+
+@pytest.fixture
+async def venues():
+    """Two stand-in venues: the default one, and one serving BankC."""
+    default, bank_c = StandInVenueServer("DEFAULT", latency=0.005), StandInVenueServer("BANKC", latency=0.005)
+    addresses = (VenueAddress("DEFAULT", "127.0.0.1", await default.start()),
+                 VenueAddress("BANKC", "127.0.0.1", await bank_c.start()))
+    yield (default, bank_c), addresses
+    await default.close()
+    await bank_c.close()
+
+
+def build_trades(count: int, counterparty: str = "BankB") -> list[Trade]:
+    trades = []
+    for _ in range(count):
+        trade = Fixture().build_valid_approved_from_pending_approval()
+        trade.details = replace(trade.details, counterparty=counterparty)
+        trades.append(trade)
+    return trades
+
+
+async def test_concurrent_sends_share_one_venue_request(venues):
+    (server, _), (default, _) = venues
+    tcp = TcpTradeExecutor(default, pool_size=2)
+    executor = BatchingTradeExecutor(tcp, window=0.01, max_batch=100)
+    trades = build_trades(20)
+
+    receipts = await asyncio.gather(*(executor.send(trade, CancellationToken()) for trade in trades))
+
+    assert [receipt.ticket_id for receipt in receipts] == [f"DEFAULT-{t.trade_id}-{t.version}" for t in trades]
+    assert server.requests == 1 and server.trades == 20
+    assert executor.batches == 1
+    await executor.close()
+    await tcp.close()
+
+
+async def test_full_batches_flush_without_waiting_for_the_window(venues):
+    (server, _), (default, _) = venues
+    tcp = TcpTradeExecutor(default)
+    executor = BatchingTradeExecutor(tcp, window=60, max_batch=5)
+
+    receipts = await asyncio.wait_for(
+        asyncio.gather(*(executor.send(trade, CancellationToken()) for trade in build_trades(10))), timeout=5)
+
+    assert len(receipts) == 10
+    assert server.requests == 2
+    await tcp.close()
+
+
+async def test_batches_are_per_counterparty_and_routed_to_its_venue(venues):
+    (default_server, bank_c_server), (default, bank_c) = venues
+    tcp = TcpTradeExecutor(default, venues={"BankC": bank_c})
+    executor = BatchingTradeExecutor(tcp, window=0.01)
+    trades = build_trades(3, "BankB") + build_trades(4, "BankC")
+
+    receipts = await asyncio.gather(*(executor.send(trade, CancellationToken()) for trade in trades))
+
+    assert [receipt.venue for receipt in receipts] == ["DEFAULT"] * 3 + ["BANKC"] * 4
+    assert (default_server.trades, bank_c_server.trades) == (3, 4)
+    assert executor.batches == 2
+    await tcp.close()
+
+
+async def test_pool_reuses_connections_up_to_its_size(venues):
+    (server, _), (default, _) = venues
+    tcp = TcpTradeExecutor(default, pool_size=3)
+
+    for _ in range(3):
+        await asyncio.gather(*(tcp.send(trade, CancellationToken()) for trade in build_trades(10)))
+
+    assert server.requests == 30
+    assert server.connections == 3
+    await tcp.close()
+
+
+async def test_pool_reconnects_after_the_venue_restarts(venues):
+    _, (default, _) = venues
+    server = StandInVenueServer("RESTARTED")
+    port = await server.start()
+    tcp = TcpTradeExecutor(VenueAddress("RESTARTED", "127.0.0.1", port), pool_size=1)
+    await tcp.send(build_trades(1)[0], CancellationToken())
+    await server.close()
+    await asyncio.sleep(0)
+
+    with pytest.raises((ConnectionError, OSError)):
+        await tcp.send(build_trades(1)[0], CancellationToken())
+    await server.start(port=port)
+    receipt = await tcp.send(build_trades(1)[0], CancellationToken())
+
+    assert receipt.venue == "RESTARTED"
+    assert server.connections == 2
+    await tcp.close()
+    await server.close()
+
+
+class FailingExecutor(ITradeExecutor):
+    async def send(self, trade, token):
+        raise ConnectionError("venue down")
+
+
+async def test_a_failed_batch_fails_every_caller():
+    executor = BatchingTradeExecutor(FailingExecutor(), window=0.001)
+
+    results = await asyncio.gather(*(executor.send(trade, CancellationToken()) for trade in build_trades(3)),
+                                   return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_close_flushes_open_batches(venues):
+    (server, _), (default, _) = venues
+    tcp = TcpTradeExecutor(default)
+    executor = BatchingTradeExecutor(tcp, window=60)
+    pending = asyncio.ensure_future(executor.send(build_trades(1)[0], CancellationToken()))
+    await asyncio.sleep(0)
+
+    await executor.close()
+
+    assert (await pending).venue == "DEFAULT"
+    assert server.trades == 1
+    await tcp.close()
+
+
+async def test_a_cancelled_caller_stops_waiting_but_its_trade_is_still_sent(venues):
+    (server, _), (default, _) = venues
+    tcp = TcpTradeExecutor(default)
+    executor = BatchingTradeExecutor(tcp, window=60)
+    token = CancellationToken()
+    pending = asyncio.ensure_future(executor.send(build_trades(1)[0], token))
+    await asyncio.sleep(0)
+
+    token.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(pending, timeout=1)
+    await executor.close()
+
+    assert server.trades == 1
+    await tcp.close()
+
+
+class ShortExecutor(ITradeExecutor):
+    """Answers a batch with one receipt too few."""
+
+    async def send(self, trade, token):
+        return Fixture().build_execution_receipt()
+
+    async def send_many(self, trades, token):
+        return [await self.send(trade, token) for trade in trades[1:]]
+
+
+class HangingExecutor(ITradeExecutor):
+    async def send(self, trade, token):
+        await asyncio.Event().wait()
+
+
+async def test_callers_left_without_a_receipt_fail_instead_of_waiting():
+    executor = BatchingTradeExecutor(ShortExecutor(), window=0.001)
+
+    results = await asyncio.wait_for(asyncio.gather(
+        *(executor.send(trade, CancellationToken()) for trade in build_trades(3)), return_exceptions=True), timeout=1)
+
+    assert sum(isinstance(result, RuntimeError) for result in results) == 1
+
+
+async def test_callers_of_a_cancelled_batch_are_cancelled_too():
+    executor = BatchingTradeExecutor(HangingExecutor(), window=0.001)
+    pending = asyncio.ensure_future(executor.send(build_trades(1)[0], CancellationToken()))
+    while not executor._in_flight:
+        await asyncio.sleep(0.001)
+
+    for task in list(executor._in_flight):
+        task.cancel()
+
+    await asyncio.wait([pending], timeout=1)
+    assert pending.cancelled()
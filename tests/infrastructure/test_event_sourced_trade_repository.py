@@ -0,0 +1,135 @@
+import json
+from dataclasses import replace
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import EventSourcedTradeRepository
+
+
+async def save_lifecycle(repository: EventSourcedTradeRepository, fixture: Fixture):
+    """Persist every step of an executed trade as a separate save."""
+    token = CancellationToken()
+    executed = fixture.build_valid_executed()
+    draft = fixture.build_valid_draft_trade()
+    draft.trade_id = executed.trade_id
+    await repository.add(draft, token)
+
+    for record in list(executed.audit)[1:]:
+        trade = await repository.get_by_id(executed.trade_id, token)
+        trade.details = record.details
+        if record.action == TradeAction.APPROVE:
+            trade.approver = executed.approver
+        if record.action == TradeAction.SEND_TO_EXECUTE:
+            trade.execution_receipt = executed.execution_receipt
+        if record.action == TradeAction.BOOK:
+            trade.execution_confirmation = executed.execution_confirmation
+        trade.change(record.user_id, record.action, record.timestamp)
+        await repository.update(trade, token)
+    return executed
+
+
+class TestEventSourcedTradeRepository:
+
+    @pytest.mark.parametrize("snapshot_every", [1, 2, 100])
+    async def test_replay_rebuilds_the_aggregate(self, tmp_path, snapshot_every):
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=snapshot_every)
+        executed = await save_lifecycle(repository, Fixture())
+
+        loaded = await repository.get_by_id(executed.trade_id, CancellationToken())
+        await repository.close()
+
+        assert loaded.state == executed.state
+        assert loaded.state_before == executed.state_before
+        assert loaded.version == executed.version
+        assert loaded.requester == executed.requester
+        assert loaded.approver == executed.approver
+        assert loaded.details == executed.details
+        assert loaded.execution_receipt == executed.execution_receipt
+        assert loaded.execution_confirmation == executed.execution_confirmation
+        assert list(loaded.audit) == list(executed.audit)
+
+    async def test_snapshots_bound_the_events_replayed(self, tmp_path):
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+        executed = await save_lifecycle(repository, Fixture())
+
+        stream = repository._streams[str(executed.trade_id)]
+        await repository.close()
+
+        assert stream.snapshot is not None
+        assert len(stream.events) < 2
+
+    async def test_snapshots_hold_only_the_records_since_the_previous_one(self, tmp_path):
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+        executed = await save_lifecycle(repository, Fixture())
+        await repository.close()
+
+        snapshots = [json.loads(line) for path in sorted(tmp_path.glob("snapshots-*.log"))
+                     for line in path.read_bytes().splitlines()]
+        steps = [record["step"] for snapshot in snapshots for record in snapshot["audit"]]
+
+        assert len(snapshots) > 1
+        assert steps == list(range(1, len(steps) + 1))  # every record stored once
+        assert all(len(snapshot["audit"]) <= 2 for snapshot in snapshots)
+        reopened = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+        assert list((await reopened.get_by_id(executed.trade_id, CancellationToken())).audit) == list(executed.audit)
+        await reopened.close()
+
+    async def test_reopening_recovers_the_index(self, tmp_path):
+        first = EventSourcedTradeRepository(str(tmp_path), snapshot_every=3)
+        executed = await save_lifecycle(first, Fixture())
+        await first.close()
+
+        second = EventSourcedTradeRepository(str(tmp_path), snapshot_every=3)
+        loaded = await second.get_by_id(executed.trade_id, CancellationToken())
+        await second.close()
+
+        assert loaded.version == executed.version
+        assert list(loaded.audit) == list(executed.audit)
+
+    async def test_torn_trailing_write_is_discarded_on_recovery(self, tmp_path):
+        fixture = Fixture()
+        token = CancellationToken()
+        repository = EventSourcedTradeRepository(str(tmp_path))
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+        await repository.close()
+        with open(tmp_path / "events-000001.log", "ab") as log:
+            log.write(b'{"trade_id": "torn')
+
+        reopened = EventSourcedTradeRepository(str(tmp_path))
+        loaded = await reopened.get_by_id(trade.trade_id, token)
+        loaded.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        await reopened.update(loaded, token)
+        await reopened.close()
+
+        recovered = EventSourcedTradeRepository(str(tmp_path))
+        assert (await recovered.get_by_id(trade.trade_id, token)).version == 2
+        await recovered.close()
+
+    async def test_stale_and_unknown_updates_are_rejected(self, tmp_path):
+        fixture = Fixture()
+        token = CancellationToken()
+        repository = EventSourcedTradeRepository(str(tmp_path))
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        first = await repository.get_by_id(trade.trade_id, token)
+        second = await repository.get_by_id(trade.trade_id, token)
+        first.details = replace(first.details, notional_amount=7)
+        first.change(fixture.requester, TradeAction.UPDATE, fixture.fixed_now)
+        second.change(fixture.requester, TradeAction.CANCEL, fixture.fixed_now)
+        await repository.update(first, token)
+
+        with pytest.raises(ConcurrencyException):
+            await repository.update(second, token)
+        with pytest.raises(ValueError):
+            await repository.add(trade, token)
+        with pytest.raises(NotFoundException):
+            await repository.get_by_id("missing", token)
+        assert (await repository.get_by_id(trade.trade_id, token)).details.notional_amount == 7
+        await repository.close()
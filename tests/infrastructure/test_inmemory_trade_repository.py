@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import InMemoryTradeRepository
+
+
+class TestInMemoryTradeRepository:
+
+    async def test_changes_on_a_loaded_trade_do_not_leak_into_the_store(self):
+        fixture = Fixture()
+        repository = InMemoryTradeRepository()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        loaded = await repository.get_by_id(trade.trade_id, token)
+        loaded.details = replace(loaded.details, notional_amount=5)
+        loaded.change(fixture.requester, TradeAction.UPDATE, fixture.fixed_now)
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert stored.version == 1
+        assert len(stored.audit) == 1
+        assert stored.details.notional_amount == 1_000_000
+
+    async def test_changes_on_the_added_trade_do_not_leak_into_the_store(self):
+        fixture = Fixture()
+        repository = InMemoryTradeRepository()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        trade.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert stored.version == 1
+        assert len(stored.audit) == 1
+
+    async def test_concurrent_writers_on_the_same_version_conflict(self):
+        fixture = Fixture()
+        repository = InMemoryTradeRepository()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        first = await repository.get_by_id(trade.trade_id, token)
+        second = await repository.get_by_id(trade.trade_id, token)
+        first.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        second.change(fixture.requester, TradeAction.CANCEL, fixture.fixed_now)
+        await repository.update(first, token)
+
+        with pytest.raises(ConcurrencyException):
+            await repository.update(second, token)
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert [record.action for record in stored.audit] == [TradeAction.CREATE, TradeAction.SUBMIT]
+
+    async def test_a_cancelled_save_stores_nothing(self):
+        fixture = Fixture()
+        repository = InMemoryTradeRepository()
+        token, cancelled = CancellationToken(), CancellationToken()
+        cancelled.cancel()
+        trade, other = fixture.build_valid_draft_trade(), fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        loaded = await repository.get_by_id(trade.trade_id, token)
+        loaded.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        with pytest.raises(asyncio.CancelledError):
+            await repository.update(loaded, cancelled)
+        with pytest.raises(asyncio.CancelledError):
+            await repository.update_many([loaded], cancelled)
+        with pytest.raises(asyncio.CancelledError):
+            await repository.add_many([other], cancelled)
+
+        assert (await repository.get_by_id(trade.trade_id, token)).version == 1
+        assert await repository.get_many([other.trade_id], token) == [None]
+        await repository.update(loaded, token)  # the retry goes through, no version conflict
+
+    async def test_unknown_trade_is_not_found(self):
+        repository = InMemoryTradeRepository()
+
+        with pytest.raises(NotFoundException):
+            await repository.get_by_id("missing", CancellationToken())
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import ExecutionUnavailableException
+from trading_approval_process.infrastructure import InmemoryTradeExecutor, ResilientTradeExecutor
+
+
+class ScriptedExecutor(ITradeExecutor):
+    """Answers like InmemoryTradeExecutor, after `delay` seconds, or fails while `failing`."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.failing = False
+        self.calls = 0
+
+    async def send(self, trade, token):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failing:
+            raise ConnectionError("venue down")
+        return await InmemoryTradeExecutor().send(trade, token)
+
+
+def approved():
+    return Fixture().build_valid_approved_from_pending_approval()
+
+
+async def test_a_send_past_its_deadline_fails_fast():
+    executor = ResilientTradeExecutor(ScriptedExecutor(delay=10), timeout=0.05)
+
+    with pytest.raises(ExecutionUnavailableException, match="no answer within"):
+        await asyncio.wait_for(executor.send(approved(), CancellationToken()), timeout=1)
+
+
+async def test_failures_open_the_circuit_and_later_sends_are_not_attempted():
+    inner = ScriptedExecutor()
+    inner.failing = True
+    executor = ResilientTradeExecutor(inner, failure_threshold=2, reset_timeout=30)
+    for _ in range(2):
+        with pytest.raises(ExecutionUnavailableException):
+            await executor.send(approved(), CancellationToken())
+
+    with pytest.raises(ExecutionUnavailableException, match="circuit open") as refused:
+        await executor.send(approved(), CancellationToken())
+
+    assert inner.calls == 2
+    assert refused.value.retry_after > 29
+    assert executor.stats()["BankB"].state == "open"
+
+
+async def test_bulkhead_bounds_the_sends_in_flight_per_venue():
+    executor = ResilientTradeExecutor(ScriptedExecutor(delay=0.05), max_in_flight=2)
+
+    results = await asyncio.gather(*(executor.send(approved(), CancellationToken()) for _ in range(3)),
+                                   return_exceptions=True)
+
+    assert sum(isinstance(result, ExecutionUnavailableException) for result in results) == 1
+    assert executor.stats()["BankB"].state == "closed"
+
+
+async def test_cancellation_by_the_caller_is_not_a_venue_failure():
+    executor = ResilientTradeExecutor(ScriptedExecutor(delay=10), failure_threshold=1)
+    token = CancellationToken()
+    token.cancel("client disconnected")
+
+    with pytest.raises(asyncio.CancelledError):
+        await executor.send(approved(), token)
+    send = asyncio.create_task(executor.send(approved(), CancellationToken()))
+    await asyncio.sleep(0.01)
+    send.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await send
+
+    assert executor.stats()["BankB"].consecutive_failures == 0
@@ -0,0 +1,78 @@
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import SqliteTradeRepository
+from trading_approval_process.infrastructure.events.sqlite_change_feed import SqliteChangeFeed
+
+
+class Recorder(ITradeListener):
+
+    def __init__(self):
+        self.saved = []
+
+    def on_saved(self, trades):
+        self.saved.extend((str(trade.trade_id), trade.version) for trade in trades)
+
+
+@pytest.fixture
+async def workers(tmp_path):
+    """Two repositories on one file, as two worker processes would have."""
+    path = str(tmp_path / "trades.db")
+    first = SqliteTradeRepository(path, record_changes=True, origin="first")
+    second = SqliteTradeRepository(path, record_changes=True, origin="second")
+    yield first, second
+    await first.close()
+    await second.close()
+
+
+class TestSqliteChangeFeed:
+
+    def setup_method(self):
+        self.fixture = Fixture()
+        self.token = CancellationToken()
+
+    async def test_delivers_the_latest_version_of_trades_saved_by_other_processes(self, workers):
+        first, second = workers
+        feed, recorder = SqliteChangeFeed(second), Recorder()
+        feed.subscribe(recorder)
+        await feed.prime()
+
+        theirs = self.fixture.build_valid_draft_trade()
+        await first.add(theirs, self.token)
+        theirs.change(self.fixture.requester, TradeAction.SUBMIT, self.fixture.fixed_now)
+        await first.update(theirs, self.token)
+        await second.add(self.fixture.build_valid_draft_trade(), self.token)  # its own save: not delivered
+
+        assert await feed.poll() == 1
+        assert recorder.saved == [(str(theirs.trade_id), 2)]
+        assert await feed.poll() == 0
+        assert feed.stats().cursor == 3
+
+    async def test_prime_skips_changes_the_rebuild_already_covers(self, workers):
+        first, second = workers
+        await first.add(self.fixture.build_valid_draft_trade(), self.token)
+        feed, recorder = SqliteChangeFeed(second, batch_size=2), Recorder()
+        feed.subscribe(recorder)
+        await feed.prime()
+
+        trades = [self.fixture.build_valid_draft_trade() for _ in range(5)]
+        await first.add_many(trades, self.token)
+
+        assert await feed.poll() == 5  # read over three pages
+        assert sorted(recorder.saved) == sorted((str(trade.trade_id), 1) for trade in trades)
+
+    async def test_changes_are_logged_only_when_enabled_and_pruned_by_age(self, tmp_path, workers):
+        first, _ = workers
+        await first.add(self.fixture.build_valid_draft_trade(), self.token)
+        assert await first.last_change() == 1
+        assert await first.prune_changes(older_than=3600) == 0
+        assert await first.prune_changes(older_than=-1) == 1
+        assert await first.changes_after(0) == []
+
+        plain = SqliteTradeRepository(str(tmp_path / "plain.db"))
+        await plain.add(self.fixture.build_valid_draft_trade(), self.token)
+        assert await plain.last_change() == 0
+        await plain.close()
@@ -0,0 +1,37 @@
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+
+from trading_approval_process.infrastructure.rate_limit.sqlite_rate_limit_storage import SqliteRateLimitStorage
+
+
+class TestSqliteRateLimitStorage:
+
+    def test_workers_opening_the_same_file_share_one_count(self, tmp_path):
+        uri = f"sqlite:///{tmp_path / 'rate-limits.db'}"
+        first, second = storage_from_string(uri), storage_from_string(uri)
+        limit = parse("3/minute")
+
+        try:
+            assert isinstance(first, SqliteRateLimitStorage)
+            assert FixedWindowRateLimiter(first).hit(limit, "client")
+            assert FixedWindowRateLimiter(second).hit(limit, "client")
+            assert FixedWindowRateLimiter(first).hit(limit, "client")
+            assert not FixedWindowRateLimiter(second).hit(limit, "client")
+            assert FixedWindowRateLimiter(second).hit(limit, "other client")
+            assert second.get(limit.key_for("client")) == 4  # the rejected hit is counted too
+        finally:
+            first.close()
+            second.close()
+
+    def test_an_expired_window_restarts_the_count(self, tmp_path):
+        storage = SqliteRateLimitStorage(f"sqlite:///{tmp_path / 'rate-limits.db'}")
+        try:
+            assert storage.incr("key", expiry=-1) == 1
+            assert storage.get("key") == 0
+            assert storage.incr("key", expiry=60, amount=2) == 2
+            assert storage.incr("key", expiry=60) == 3
+            storage.clear("key")
+            assert storage.get("key") == 0
+        finally:
+            storage.close()
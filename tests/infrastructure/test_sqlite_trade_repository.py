@@ -0,0 +1,134 @@
+import sqlite3
+from dataclasses import replace
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.infrastructure import SqliteTradeRepository
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    repository = SqliteTradeRepository(str(tmp_path / "trades.db"))
+    yield repository
+    await repository.close()
+
+
+class TestSqliteTradeRepository:
+
+    async def test_round_trips_a_full_lifecycle(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trade = fixture.build_valid_executed()
+
+        await repository.add(trade, token)
+        loaded = await repository.get_by_id(trade.trade_id, token)
+
+        assert loaded.trade_id == trade.trade_id
+        assert loaded.requester == trade.requester
+        assert loaded.approver == trade.approver
+        assert loaded.state == trade.state
+        assert loaded.state_before == trade.state_before
+        assert loaded.version == trade.version
+        assert loaded.details == trade.details
+        assert loaded.execution_receipt == trade.execution_receipt
+        assert loaded.execution_confirmation == trade.execution_confirmation
+        assert list(loaded.audit) == list(trade.audit)
+
+    async def test_update_appends_only_new_audit_rows(self, repository, tmp_path):
+        fixture = Fixture()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        loaded = await repository.get_by_id(trade.trade_id, token)
+        loaded.details = replace(loaded.details, notional_amount=5)
+        loaded.change(fixture.requester, TradeAction.UPDATE, fixture.fixed_now)
+        await repository.update(loaded, token)
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert stored.version == 2
+        assert stored.details.notional_amount == 5
+        assert [record.step for record in stored.audit] == [1, 2]
+        with sqlite3.connect(tmp_path / "trades.db") as connection:
+            assert connection.execute("SELECT COUNT(*) FROM audit_records").fetchone()[0] == 2
+
+    async def test_header_and_trail_are_read_from_one_snapshot(self, tmp_path):
+        fixture = Fixture()
+        token = CancellationToken()
+        path = tmp_path / "trades.db"
+        repository = SqliteTradeRepository(str(path), pool_size=1)
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+        other_worker = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        key = str(trade.trade_id)
+
+        def save_between_the_reads(statement: str) -> None:
+            # Another process saves version 2 just before the trail is read.
+            if "FROM audit_records" in statement:
+                other_worker.execute("UPDATE trades SET version = 2 WHERE trade_id = ?", (key,))
+                other_worker.execute("INSERT INTO audit_records SELECT trade_id, 2, action, user_id, state_before, "
+                                     "state_after, details, timestamp, notes FROM audit_records WHERE trade_id = ?",
+                                     (key,))
+
+        repository._connections[0].set_trace_callback(save_between_the_reads)
+        try:
+            loaded = await repository.get_by_id(trade.trade_id, token)
+        finally:
+            repository._connections[0].set_trace_callback(None)
+            other_worker.close()
+            await repository.close()
+
+        assert loaded.version == 1
+        assert [record.step for record in loaded.audit] == [1]
+
+    async def test_stale_update_is_rejected(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        first = await repository.get_by_id(trade.trade_id, token)
+        second = await repository.get_by_id(trade.trade_id, token)
+        first.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+        second.change(fixture.requester, TradeAction.CANCEL, fixture.fixed_now)
+        await repository.update(first, token)
+
+        with pytest.raises(ConcurrencyException):
+            await repository.update(second, token)
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert [record.action for record in stored.audit] == [TradeAction.CREATE, TradeAction.SUBMIT]
+
+    async def test_duplicate_and_missing_trades_are_rejected(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trade = fixture.build_valid_draft_trade()
+        await repository.add(trade, token)
+
+        with pytest.raises(ValueError):
+            await repository.add(trade, token)
+        with pytest.raises(NotFoundException):
+            await repository.get_by_id("missing", token)
+        with pytest.raises(NotFoundException):
+            await repository.update(fixture.build_valid_pending_approval(), token)
+
+    async def test_trades_survive_a_restart(self, tmp_path):
+        token = CancellationToken()
+        trade = Fixture().build_valid_pending_approval()
+        path = str(tmp_path / "trades.db")
+        first = SqliteTradeRepository(path)
+        await first.add(trade, token)
+        await first.close()
+
+        second = SqliteTradeRepository(path)
+        try:
+            loaded = await second.get_by_id(trade.trade_id, token)
+        finally:
+            await second.close()
+
+        assert loaded.version == trade.version
+        assert list(loaded.audit) == list(trade.audit)
@@ -0,0 +1,83 @@
+import asyncio
+
+from tests.fixture import Fixture
+from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_event import TradeEventFilter
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import (
+    InmemoryTradeExecutor, InMemoryTradeRepository, ObservedTradeRepository)
+from trading_approval_process.infrastructure.events.trade_event_bus import OverflowPolicy, TradeEventBus
+
+
+def build(fixture: Fixture, bus: TradeEventBus) -> TradeApprovalService:
+    repository = ObservedTradeRepository(InMemoryTradeRepository(), [bus])
+    return TradeApprovalService(InmemoryTradeExecutor(), repository, fixture.time_mock)
+
+
+async def drain(subscription) -> list:
+    events = []
+    while (event := await subscription.get(timeout=0)) is not None:
+        events.append(event)
+    return events
+
+
+class TestTradeEventBus:
+
+    async def test_committed_changes_fan_out_to_matching_subscribers(self):
+        fixture = Fixture()
+        token = CancellationToken()
+        bus = TradeEventBus()
+        service = build(fixture, bus)
+        everything = bus.subscribe()
+        pending = bus.subscribe(TradeEventFilter(states=frozenset({TradeState.PENDING_APPROVAL})))
+        bob = bus.subscribe(TradeEventFilter(user="bob"))
+
+        trade = await service.create("alice", fixture.build_valid_details(), token)
+        await service.submit("alice", trade.trade_id, token)
+        await service.approve("bob", trade.trade_id, token)
+
+        assert [event.action for event in await drain(everything)] == [
+            TradeAction.CREATE, TradeAction.SUBMIT, TradeAction.APPROVE]
+        assert [event.version for event in await drain(pending)] == [2]
+        assert [event.action for event in await drain(bob)] == [TradeAction.APPROVE]
+
+    async def test_waiting_subscriber_is_woken(self):
+        bus = TradeEventBus()
+        subscription = bus.subscribe()
+        fixture = Fixture()
+        waiter = asyncio.create_task(subscription.get(timeout=1))
+        await asyncio.sleep(0)
+        bus.on_saved([fixture.build_valid_draft_trade()])
+        event = await waiter
+        assert event.event_id == 1 and event.state_after == TradeState.DRAFT
+
+    async def test_resume_replays_retained_history_and_flags_gaps(self):
+        fixture = Fixture()
+        bus = TradeEventBus(history=3)
+        for _ in range(5):
+            bus.on_saved([fixture.build_valid_draft_trade()])
+
+        resumed = bus.subscribe(last_event_id=3)
+        too_old = bus.subscribe(last_event_id=1)
+
+        assert [event.event_id for event in await drain(resumed)] == [4, 5]
+        assert not resumed.gap
+        assert [event.event_id for event in await drain(too_old)] == [3, 4, 5]
+        assert too_old.gap
+
+    async def test_slow_subscribers_are_cut_off_or_lose_oldest_events(self):
+        fixture = Fixture()
+        trades = [fixture.build_valid_draft_trade() for _ in range(4)]
+        disconnecting = TradeEventBus(queue_size=2)
+        dropping = TradeEventBus(queue_size=2, policy=OverflowPolicy.DROP_OLDEST)
+        cut_off, lossy = disconnecting.subscribe(), dropping.subscribe()
+
+        disconnecting.on_saved(trades)
+        dropping.on_saved(trades)
+
+        assert [event.event_id for event in await drain(cut_off)] == [1, 2]
+        assert cut_off.closed
+        assert [event.event_id for event in await drain(lossy)] == [3, 4]
+        assert lossy.dropped == 2 and not lossy.closed
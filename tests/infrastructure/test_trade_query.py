@@ -0,0 +1,98 @@
+from dataclasses import replace
+
+import pytest
+
+from tests.fixture import Fixture
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure import (
+    EventSourcedTradeRepository, InMemoryTradeRepository, SqliteTradeRepository)
+
+
+@pytest.fixture(params=["inmemory", "sqlite", "event_sourced"])
+async def repository(request, tmp_path):
+    if request.param == "inmemory":
+        yield InMemoryTradeRepository()
+        return
+    if request.param == "sqlite":
+        repository = SqliteTradeRepository(str(tmp_path / "trades.db"))
+    else:
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+    yield repository
+    await repository.close()
+
+
+async def seed(repository, fixture: Fixture, token: CancellationToken) -> list:
+    """Six drafts alternating counterparty BankB / BankC; the BankC ones are then submitted."""
+    trades = []
+    for index in range(6):
+        trade = fixture.build_valid_draft_trade()
+        if index % 2:
+            trade.details = replace(trade.details, counterparty="BankC")
+        trades.append(trade)
+    await repository.add_many(trades, token)
+    for trade in trades[1::2]:
+        trade.change(fixture.requester, TradeAction.SUBMIT, fixture.fixed_now)
+    await repository.update_many(trades[1::2], token)
+    return trades
+
+
+class TestTradeQuery:
+
+    async def test_filters_combine_and_follow_updates(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trades = await seed(repository, fixture, token)
+
+        pending = await repository.query(TradeQuery(state=TradeState.PENDING_APPROVAL), token)
+        bank_c = await repository.query(TradeQuery(state=TradeState.PENDING_APPROVAL, counterparty="BankC"), token)
+        drafts_c = await repository.query(TradeQuery(state=TradeState.DRAFT, counterparty="BankC"), token)
+        usd_today = await repository.query(
+            TradeQuery(notional_currency="USD", trade_date=trades[0].details.trade_date, requester=fixture.requester), token)
+
+        assert [trade.trade_id for trade in pending.items] == [trade.trade_id for trade in trades[1::2]]
+        assert [trade.trade_id for trade in bank_c.items] == [trade.trade_id for trade in trades[1::2]]
+        assert drafts_c.items == []
+        assert len(usd_today.items) == 6
+
+    async def test_keyset_pages_cover_the_listing_once(self, repository):
+        fixture = Fixture()
+        token = CancellationToken()
+        trades = await seed(repository, fixture, token)
+
+        seen, cursor = [], None
+        while True:
+            page = await repository.query(TradeQuery(limit=4, after=cursor), token)
+            seen.extend(trade.trade_id for trade in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert seen == [trade.trade_id for trade in trades]
+
+        first = await repository.query(TradeQuery(counterparty="BankB", limit=2), token)
+        rest = await repository.query(TradeQuery(counterparty="BankB", limit=2, after=first.next_cursor), token)
+        assert [trade.trade_id for trade in first.items + rest.items] == [trade.trade_id for trade in trades[0::2]]
+        assert rest.next_cursor is None
+
+
+class TestEventSourcedIndexRecovery:
+
+    async def test_reopened_store_rebuilds_secondary_indexes(self, tmp_path):
+        fixture = Fixture()
+        token = CancellationToken()
+        repository = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+        trades = await seed(repository, fixture, token)
+        await repository.close()
+
+        reopened = EventSourcedTradeRepository(str(tmp_path), snapshot_every=2)
+        try:
+            everything = await reopened.query(TradeQuery(), token)
+            pending = await reopened.query(TradeQuery(state=TradeState.PENDING_APPROVAL, counterparty="BankC"), token)
+        finally:
+            await reopened.close()
+
+        assert [trade.trade_id for trade in everything.items] == [trade.trade_id for trade in trades]
+        assert [trade.trade_id for trade in pending.items] == [trade.trade_id for trade in trades[1::2]]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import timedelta
 from dataclasses import replace
 import pytest
@@ -84,4 +85,32 @@ class TestApprovalService:
 
         # CANCEL
         with pytest.raises(InvalidTransitionException):
-            await service.cancel("user2", trade.trade_id, token)
\ No newline at end of file
+            await service.cancel("user2", trade.trade_id, token)
+
+    async def test_concurrent_updates_on_the_same_trade_all_succeed(self):
+        time: ITimeProvider = SystemTime()
+        repository = InMemoryTradeRepository()
+        service = TradeApprovalService(InmemoryTradeExecutor(), repository, time)
+        token = CancellationToken()
+        details = TradeDetails(
+            trading_entity="BankA",
+            counterparty="BankB",
+            direction=TradeDirection.BUY,
+            style=TradeStyle.FORWARD,
+            notional_currency="USD",
+            notional_amount=1_000_000,
+            underlying="USD/EUR",
+            trade_date=time.now(),
+            value_date=time.now() + timedelta(days=2),
+            delivery_date=time.now() + timedelta(days=5),
+        )
+        trade = await service.create("user1", details, token)
+
+        await asyncio.gather(*(
+            service.update("user1", trade.trade_id, replace(details, notional_amount=amount), token)
+            for amount in range(1, 51)
+        ))
+
+        stored = await repository.get_by_id(trade.trade_id, token)
+        assert stored.version == 51
+        assert [record.step for record in stored.audit] == list(range(1, 52))
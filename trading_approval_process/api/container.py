@@ -0,0 +1,196 @@
+import logging
+import os
+from typing import Awaitable, Callable, Mapping
+
+from ..application.interfaces.i_time_provider import ITimeProvider
+from ..application.interfaces.i_trade_executor import ITradeExecutor
+from ..application.interfaces.i_trade_repository import ITradeRepository
+from ..application.services.execution_dispatcher import ExecutionDispatcher
+from ..application.services.trade_approval_service import TradeApprovalService
+from ..application.services.trade_history_service import TradeHistoryService
+from ..application.views.approval_inbox import ApprovalInbox
+from ..application.views.execution_outbox import ExecutionOutbox
+from ..application.views.workflow_metrics import WorkflowMetrics
+from ..core.cancellation_token import CancellationToken
+from ..core.idempotency_store import IdempotencyStore
+from ..core.instrumentation import SpanSink, instrumentation
+from ..infrastructure import (
+    InmemoryTradeExecutor, SystemTime, InMemoryTradeRepository, ObservedTradeRepository, ResilientTradeExecutor,
+    InstrumentedTradeRepository, InstrumentedTradeExecutor, SqliteTradeRepository)
+from ..infrastructure.events.sqlite_change_feed import SqliteChangeFeed
+from ..infrastructure.events.trade_event_bus import TradeEventBus
+from .settings import DATABASE_ENV
+
+try:
+    from ..application.views.trade_analytics_projection import TradeAnalyticsProjection
+except ImportError:  # optional: NumPy backs the analytics endpoints, which answer 503 without it
+    TradeAnalyticsProjection = None
+
+Hook = Callable[[], Awaitable[None]]
+
+
+class AppContainer:
+    """
+    Process-wide composition root.
+
+    Builds the adapters and services once, wires them together and owns their lifecycle:
+    - Startup hooks run in registration order (open pools, warm caches, start workers).
+    - Shutdown hooks run in reverse order, so resources are drained before their dependencies.
+
+    With `deferred_execution`, sends to the counterparty leave the request path: an outbox
+    of pending sends is kept from the saved trades and drained by a background dispatcher.
+
+    The executor is wrapped in a ResilientTradeExecutor (deadline, bulkhead and circuit
+    breaker per counterparty), so a degraded venue fails its sends fast instead of holding
+    requests for as long as it takes to answer.
+
+    Commands, repository calls and sends report spans to `span_sinks` (see
+    core.instrumentation) while the application runs; without sinks they are not timed.
+
+    With `follow_changes`, the repository is a SqliteTradeRepository shared with other
+    processes: a change feed delivers their saves to this process's views (inbox, event
+    bus, metrics, analytics), and the container closes the repository on shutdown. The
+    execution outbox is not fed by it: each process dispatches the intents it saved.
+    """
+
+    def __init__(
+        self,
+        repository: ITradeRepository | None = None,
+        executor: ITradeExecutor | None = None,
+        time: ITimeProvider | None = None,
+        deferred_execution: bool = False,
+        dispatch_concurrency: int = 8,
+        execution_timeout: float = 5.0,
+        max_sends_per_venue: int = 32,
+        idempotency_ttl: float = 24 * 3600,
+        approval_sla: float = 4 * 3600,
+        span_sinks: list[SpanSink] | None = None,
+        follow_changes: bool = False,
+    ) -> None:
+        # Every save goes through the observed repository, which keeps the derived views current.
+        self.repository = ObservedTradeRepository(InstrumentedTradeRepository(repository or InMemoryTradeRepository()))
+        self.executor = ResilientTradeExecutor(InstrumentedTradeExecutor(executor or InmemoryTradeExecutor()),
+                                               timeout=execution_timeout, max_in_flight=max_sends_per_venue)
+        self.time: ITimeProvider = time or SystemTime()
+
+        self.trade_service = TradeApprovalService(self.executor, self.repository, self.time,
+                                                  deferred_execution=deferred_execution)
+        self.history_service = TradeHistoryService(self.repository, self.time)
+        # Responses of POSTs carrying an Idempotency-Key, replayed to retries (see api/idempotency.py).
+        self.idempotency = IdempotencyStore(ttl=idempotency_ttl)
+
+        self.inbox = ApprovalInbox()
+        self.repository.subscribe(self.inbox)
+        self.events = TradeEventBus()
+        self.repository.subscribe(self.events)
+
+        self._startup_hooks: list[Hook] = []
+        self._shutdown_hooks: list[Hook] = []
+        self._started = False
+
+        # Sinks listen only while the application runs; a stopped container leaves no hooks behind.
+        self.span_sinks: tuple[SpanSink, ...] = tuple(span_sinks or ())
+        if self.span_sinks:
+            self.on_startup(self._add_span_sinks)
+            self.on_shutdown(self._remove_span_sinks)
+
+        # Primed before the views are rebuilt, started after: saves made meanwhile are not missed.
+        self.change_feed: SqliteChangeFeed | None = None
+        if follow_changes:
+            if not isinstance(repository, SqliteTradeRepository) or not repository.record_changes:
+                raise ValueError("follow_changes needs a SqliteTradeRepository with record_changes.")
+            self.change_feed = SqliteChangeFeed(repository)
+            self.on_startup(self.change_feed.prime)
+            self.on_shutdown(repository.close)
+            for view in (self.inbox, self.events):
+                self.change_feed.subscribe(view)
+
+        self.on_startup(lambda: self.inbox.rebuild(self.repository, CancellationToken()))
+
+        # Time-in-state histograms and the approval SLA timers, exported at /metrics.
+        self.metrics = WorkflowMetrics(self.time, sla_seconds=approval_sla)
+        self.repository.subscribe(self.metrics)
+        if self.change_feed is not None:
+            self.change_feed.subscribe(self.metrics)
+        self.on_startup(lambda: self.metrics.rebuild(self.repository, CancellationToken()))
+        self.on_startup(self.metrics.start)
+        self.on_shutdown(self.metrics.stop)
+
+        self.analytics = TradeAnalyticsProjection() if TradeAnalyticsProjection is not None else None
+        if self.analytics is not None:
+            self.repository.subscribe(self.analytics)
+            if self.change_feed is not None:
+                self.change_feed.subscribe(self.analytics)
+            self.on_startup(lambda: self.analytics.rebuild(self.repository, CancellationToken()))
+
+        self.outbox: ExecutionOutbox | None = None
+        self.dispatcher: ExecutionDispatcher | None = None
+        if deferred_execution:
+            self.outbox = ExecutionOutbox()
+            self.repository.subscribe(self.outbox)
+            self.dispatcher = ExecutionDispatcher(self.outbox, self.executor, self.trade_service, self.repository,
+                                                  concurrency=dispatch_concurrency)
+            self.on_startup(lambda: self.outbox.rebuild(self.repository, CancellationToken()))
+            self.on_startup(self.dispatcher.start)
+            self.on_shutdown(self.dispatcher.stop)
+
+        if self.change_feed is not None:
+            self.on_startup(self.change_feed.start)
+            self.on_shutdown(self.change_feed.stop)
+
+    @classmethod
+    def from_environment(cls, environ: Mapping[str, str] = os.environ) -> "AppContainer":
+        """
+        The container of a server process, configured by environment (see api/settings.py).
+
+        With a database file, trades are stored in it and the saves of the other processes
+        sharing it are followed; otherwise they are kept in memory.
+        """
+        path = environ.get(DATABASE_ENV)
+        if not path:
+            return cls()
+        return cls(repository=SqliteTradeRepository(path, record_changes=True), follow_changes=True)
+
+    # ---------------------------
+    # Lifecycle hooks
+    # ---------------------------
+    def on_startup(self, hook: Hook) -> Hook:
+        """Register a coroutine function to run when the application starts."""
+        self._startup_hooks.append(hook)
+        return hook
+
+    def on_shutdown(self, hook: Hook) -> Hook:
+        """Register a coroutine function to run when the application stops."""
+        self._shutdown_hooks.append(hook)
+        return hook
+
+    async def _add_span_sinks(self) -> None:
+        for sink in self.span_sinks:
+            instrumentation.add_sink(sink)
+
+    async def _remove_span_sinks(self) -> None:
+        for sink in self.span_sinks:
+            instrumentation.remove_sink(sink)
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    async def startup(self) -> None:
+        """Run startup hooks in registration order."""
+        if self._started:
+            return
+        for hook in self._startup_hooks:
+            await hook()
+        self._started = True
+
+    async def shutdown(self) -> None:
+        """Run shutdown hooks in reverse order; a failing hook does not stop the others."""
+        if not self._started:
+            return
+        self._started = False
+        for hook in reversed(self._shutdown_hooks):
+            try:
+                await hook()
+            except Exception:
+                logging.exception("AppContainer: shutdown hook %r failed.", hook)
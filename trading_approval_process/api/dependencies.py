@@ -1,12 +1,34 @@
-from ..application.interfaces.i_trade_executor import ITradeExecutor
-from ..application.interfaces.i_time_provider import  ITimeProvider
-from ..application.interfaces.i_trade_repository import ITradeRepository
+from fastapi import Depends, HTTPException, Request
+
 from ..application.services.trade_approval_service import TradeApprovalService
-from ..infrastructure import InmemoryTradeExecutor, SystemTime, InMemoryTradeRepository
+from ..application.services.trade_history_service import TradeHistoryService
+from ..application.views.approval_inbox import ApprovalInbox
+from ..infrastructure.events.trade_event_bus import TradeEventBus
+from .container import AppContainer
+
+
+def get_container(request: Request) -> AppContainer:
+    """Return the process-wide container created by the application lifespan."""
+    return request.app.state.container
+
+
+def get_trade_service(container: AppContainer = Depends(get_container)) -> TradeApprovalService:
+    return container.trade_service
+
+
+def get_history_service(container: AppContainer = Depends(get_container)) -> TradeHistoryService:
+    return container.history_service
+
+
+def get_inbox(container: AppContainer = Depends(get_container)) -> ApprovalInbox:
+    return container.inbox
+
+
+def get_event_bus(container: AppContainer = Depends(get_container)) -> TradeEventBus:
+    return container.events
 
 
-def get_trade_service() -> TradeApprovalService:
-    repo: ITradeRepository = InMemoryTradeRepository()
-    executor: ITradeExecutor = InmemoryTradeExecutor()
-    time:ITimeProvider = SystemTime()
-    return TradeApprovalService(repo, time, executor)
+def get_analytics(container: AppContainer = Depends(get_container)):
+    if container.analytics is None:
+        raise HTTPException(status_code=503, detail="Analytics need NumPy, which is not installed.")
+    return container.analytics
@@ -0,0 +1,54 @@
+import json
+from typing import Any, Callable
+
+from fastapi.encoders import ENCODERS_BY_TYPE, jsonable_encoder
+
+from ..domain.models.audit_trail import AuditTrail
+from ..domain.models.trade import Trade
+
+try:
+    import orjson
+except ImportError:  # optional: responses fall back to the generic encoder and json
+    orjson = None
+
+# Public state of the slotted Trade, resolved once.
+_TRADE_FIELDS = tuple(name for name in Trade.__slots__ if not name.startswith("_"))
+
+
+def encode_trade(trade: Trade) -> dict[str, Any]:
+    return {name: getattr(trade, name) for name in _TRADE_FIELDS}
+
+
+def encode_audit_trail(trail: AuditTrail) -> list:
+    return list(trail)
+
+
+# Encoders for the domain types orjson cannot serialise itself. The rest of the payload
+# (TradeHistory, AuditRecord, TradeDetails, TradeDiff, ExecutionReceipt and the other
+# dataclasses, with their enum, UUID, date and datetime fields) it serialises natively.
+ENCODERS: dict[type, Callable[[Any], Any]] = {
+    Trade: encode_trade,
+    AuditTrail: encode_audit_trail,
+}
+
+
+def _default(value: Any) -> Any:
+    encoder = ENCODERS.get(type(value))
+    return encoder(value) if encoder is not None else jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialise a response payload to JSON bytes.
+
+    The output matches `jsonable_encoder` followed by compact `json.dumps`, without first
+    building the intermediate tree of dicts and strings.
+    """
+    if orjson is None:
+        return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(content, default=_default)
+
+
+# The generic encoder still serves payloads that do not go through `dumps`.
+ENCODERS_BY_TYPE[AuditTrail] = lambda trail: jsonable_encoder(encode_audit_trail(trail))
+ENCODERS_BY_TYPE[Trade] = lambda trade: jsonable_encoder(encode_trade(trade))
@@ -0,0 +1,37 @@
+import uuid
+
+from ..domain.exceptions import PreconditionFailedException
+
+
+def trade_etag(trade_id: uuid.UUID | str, version: int, *suffix: int) -> str:
+    """
+    Strong entity tag of a trade representation.
+
+    Every change bumps the trade's version, so `(trade_id, version)` identifies its content
+    exactly; representations of fixed versions (e.g. a diff) append those versions instead.
+    """
+    return '"' + "-".join(map(str, (trade_id, version, *suffix))) + '"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """Does an If-None-Match header match the current tag (weak comparison, RFC 9110 13.1.2)?"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def expected_version(if_match: str | None, trade_id: uuid.UUID) -> int | None:
+    """
+    The trade version an If-Match header requires, or None when any version will do.
+
+    Only a single strong tag of this trade can match, since a trade is at one version.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    tag = if_match.strip()
+    prefix = f'"{trade_id}-'
+    if tag.startswith(prefix) and tag.endswith('"') and tag[len(prefix):-1].isdigit():
+        return int(tag[len(prefix):-1])
+    raise PreconditionFailedException(f"If-Match {tag} does not name a version of trade '{trade_id}'.")
@@ -0,0 +1,99 @@
+import csv
+import io
+import uuid
+from dataclasses import fields
+from enum import Enum
+from typing import AsyncIterator, TypeVar
+
+from ..domain.models.audit_record import AuditRecord
+from ..domain.models.trade_details import TradeDetails
+from .encoders import dumps
+
+T = TypeVar("T")
+
+# Rows encoded into one chunk of the response body.
+CHUNK_ROWS = 256
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+_DETAIL_FIELDS = tuple(field.name for field in fields(TradeDetails))
+CSV_COLUMNS = ("trade_id", "step", "action", "user_id", "state_before", "state_after", "timestamp", "notes",
+               *_DETAIL_FIELDS)
+
+
+async def prefetch(rows: AsyncIterator[T]) -> AsyncIterator[T]:
+    """
+    Start a row stream before the response does.
+
+    The first row is fetched right away, so a failure to open the stream (e.g. an unknown
+    trade) can still be answered with an error status instead of a truncated body.
+    """
+    try:
+        first = await anext(rows)
+    except StopAsyncIteration:
+        return _empty()
+    return _resumed(first, rows)
+
+
+async def _empty() -> AsyncIterator:
+    return
+    yield
+
+
+async def _resumed(first: T, rows: AsyncIterator[T]) -> AsyncIterator[T]:
+    yield first
+    async for row in rows:
+        yield row
+
+
+async def ndjson_chunks(rows: AsyncIterator[tuple[uuid.UUID, AuditRecord]]) -> AsyncIterator[bytes]:
+    """One JSON object per line: the audit record as the history endpoint renders it, plus its trade id."""
+    lines: list[bytes] = []
+    async for trade_id, record in rows:
+        lines.append(dumps({"trade_id": trade_id, **_record_fields(record)}))
+        if len(lines) == CHUNK_ROWS:
+            yield b"\n".join(lines) + b"\n"
+            lines.clear()
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+async def csv_chunks(rows: AsyncIterator[tuple[uuid.UUID, AuditRecord]]) -> AsyncIterator[bytes]:
+    """A header line, then one line per record with its details flattened into columns."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    async for trade_id, record in rows:
+        writer.writerow(_csv_row(trade_id, record))
+        count += 1
+        if count == CHUNK_ROWS:
+            yield _drain(buffer)
+            count = 0
+    yield _drain(buffer)
+
+
+def _record_fields(record: AuditRecord) -> dict[str, object]:
+    return {name: getattr(record, name) for name in AuditRecord.__slots__}
+
+
+def _csv_row(trade_id: uuid.UUID, record: AuditRecord) -> list[object]:
+    details = record.details
+    return [
+        trade_id, record.step, record.action.name, record.user_id, record.state_before.name,
+        record.state_after.name, record.timestamp.isoformat(), record.notes,
+        *(_csv_value(getattr(details, name)) if details is not None else None for name in _DETAIL_FIELDS),
+    ]
+
+
+def _csv_value(value: object) -> object:
+    if isinstance(value, Enum):
+        return value.name
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    chunk = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
@@ -0,0 +1,119 @@
+import hashlib
+from dataclasses import dataclass
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.idempotency_store import IdempotencyKeyReusedError
+from .encoders import dumps
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+MAX_KEY_LENGTH = 255
+
+# Outcomes a retry could change are not replayed: rate limiting, timeouts and server errors.
+_TRANSIENT_STATUSES = frozenset({408, 425, 429})
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    @property
+    def replayable(self) -> bool:
+        return self.status < 500 and self.status not in _TRANSIENT_STATUSES
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key support for the POST endpoints under `prefix`.
+
+    A request carrying the header runs once per key (see IdempotencyStore): a retry of it,
+    or a duplicate arriving while it runs, is answered with the stored response, marked by
+    an `Idempotent-Replayed: true` header. Keys are scoped to the requesting user and the
+    method and path, so clients picking the same key never see each other's responses; the
+    same key on the same endpoint with another query or body is refused with 422. Requests
+    without the header are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, prefix: str = "/api/trades") -> None:
+        self.app = app
+        self.prefix = prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].startswith(self.prefix):
+            return await self.app(scope, receive, send)
+        key = dict(scope["headers"]).get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return await self.app(scope, receive, send)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return await _send_error(send, 400, f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters.")
+
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(b"\0".join(
+            (scope["method"].encode(), scope["path"].encode(), scope["query_string"], body))).hexdigest()
+        store = scope["app"].state.container.idempotency
+
+        async def execute() -> StoredResponse:
+            return await _capture(self.app, scope, _replay(body, receive))
+
+        try:
+            response, replayed = await store.run(_scoped_key(scope, key), fingerprint, execute,
+                                                 keep=lambda stored: stored.replayable)
+        except IdempotencyKeyReusedError as ex:
+            return await _send_error(send, 422, str(ex))
+
+        headers = response.headers + [(REPLAYED_HEADER, b"true")] if replayed else response.headers
+        await send({"type": "http.response.start", "status": response.status, "headers": headers})
+        await send({"type": "http.response.body", "body": response.body})
+
+
+def _scoped_key(scope: Scope, key: bytes) -> str:
+    """The client's key within the requesting user's and endpoint's namespace."""
+    user = parse_qs(scope["query_string"].decode("latin-1")).get("user", [""])[0]
+    return "\0".join((user, scope["method"], scope["path"], key.decode("latin-1")))
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+def _replay(body: bytes, receive: Receive) -> Receive:
+    """A receive channel yielding the body already read, then the client's later messages (e.g. a disconnect)."""
+    pending = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def replayed() -> Message:
+        return pending.pop() if pending else await receive()
+
+    return replayed
+
+
+async def _capture(app: ASGIApp, scope: Scope, receive: Receive) -> StoredResponse:
+    start: Message = {}
+    chunks: list[bytes] = []
+
+    async def capture(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            start.update(message)
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, capture)
+    return StoredResponse(start["status"], list(start.get("headers", [])), b"".join(chunks))
+
+
+async def _send_error(send: Send, status: int, detail: str) -> None:
+    body = dumps({"detail": detail})
+    await send({"type": "http.response.start", "status": status, "headers": [
+        (b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+    await send({"type": "http.response.body", "body": body})
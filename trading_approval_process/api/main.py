@@ -1,27 +1,45 @@
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from starlette.responses import JSONResponse
-from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
-from trading_approval_process.api.dependencies import get_trade_service
+from trading_approval_process.api import encoders  # noqa: F401  (registers domain encoders)
+from trading_approval_process.api.container import AppContainer
+from trading_approval_process.api.idempotency import IdempotencyMiddleware
+from trading_approval_process.api.rate_limits import RateLimiter, RateLimitMiddleware
+from trading_approval_process.api.responses import DomainJSONResponse
 from trading_approval_process.api.routes.trades_router import router as trades_router
 from trading_approval_process.api.routes.health_router import router as health_router
+from trading_approval_process.api.routes.analytics_router import router as analytics_router
+from trading_approval_process.api.routes.metrics_router import router as metrics_router
 
 # --- Rate limiter setup ---
-limiter = Limiter(key_func=get_remote_address)
+# Applies to every route but the health probes and /metrics, per client address; workers sharing its storage keep one count per client.
+limiter = RateLimiter.from_environment()
+
+# --- Application container ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A container may be pre-seeded on app.state (e.g. by tests) before startup.
+    container: AppContainer = getattr(app.state, "container", None) or AppContainer.from_environment()
+    app.state.container = container
+    await container.startup()
+    try:
+        yield
+    finally:
+        await container.shutdown()
 
-app = FastAPI( title="Trade Approval API", version="1.0.0", docs_url="/api/docs", redoc_url="/api/redoc" )
+app = FastAPI( title="Trade Approval API", version="1.0.0", docs_url="/api/docs", redoc_url="/api/redoc", lifespan=lifespan,
+               default_response_class=DomainJSONResponse )
 
 # --- Middlewares ---
 app.state.limiter = limiter
 app.add_middleware( CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"] )
-
-@app.exception_handler(429)
-async def rate_limit_handler(request: Request, exc):
-    return JSONResponse(status_code=HTTP_429_TOO_MANY_REQUESTS, content={"error": "Too many requests"})
+app.add_middleware( IdempotencyMiddleware, prefix="/api/trades" )
+app.add_middleware( RateLimitMiddleware, exempt=("/api/health", "/metrics") )
 
 # --- Routers ---
 app.include_router(health_router, prefix="/api/health", tags=["Health"])
 app.include_router(trades_router, prefix="/api/trades", tags=["Trades"])
+app.include_router(analytics_router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(metrics_router, tags=["Metrics"])
@@ -0,0 +1,129 @@
+from typing import Iterable
+
+from ..core.log_histogram import LogHistogram
+from ..core.span_sinks import HistogramSink
+from .container import AppContainer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Exposition buckets of the duration histograms, in seconds: from a second to a week.
+DURATION_BUCKETS = (1, 5, 15, 30, 60, 300, 900, 1800, 3600, 4 * 3600, 8 * 3600, 24 * 3600, 3 * 24 * 3600,
+                    7 * 24 * 3600)
+
+# Buckets of the span histograms, in seconds: from 50 microseconds to 5 seconds.
+SPAN_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+class _Exposition:
+    """Builder of the Prometheus text exposition format (0.0.4)."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, **labels: object) -> None:
+        self._lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(self, name: str, histogram: LogHistogram, bounds: Iterable[float], **labels: object) -> None:
+        for bound, count in histogram.cumulative(bounds):
+            self.sample(f"{name}_bucket", count, **labels, le=_number(bound))
+        self.sample(f"{name}_bucket", histogram.count, **labels, le="+Inf")
+        self.sample(f"{name}_sum", histogram.sum, **labels)
+        self.sample(f"{name}_count", histogram.count, **labels)
+
+    def render(self) -> bytes:
+        return ("\n".join(self._lines) + "\n").encode("utf-8")
+
+
+def _labels(labels: dict[str, object]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_metrics(container: AppContainer) -> bytes:
+    out = _Exposition()
+
+    metrics = container.metrics
+    out.family("trade_state_dwell_seconds", "histogram", "Time trades spent in a state before leaving it.")
+    for state, histogram in sorted(metrics.dwell.items(), key=lambda item: item[0].value):
+        out.histogram("trade_state_dwell_seconds", histogram, DURATION_BUCKETS, state=state.name)
+    out.family("trade_approval_latency_seconds", "histogram",
+               "Time from a trade starting to wait for approval to its approval, by approver.")
+    for approver, histogram in sorted(metrics.approval_latency.items()):
+        out.histogram("trade_approval_latency_seconds", histogram, DURATION_BUCKETS, approver=approver)
+    out.family("trade_transitions_total", "counter", "Audit records written, by action.")
+    for action, count in sorted(metrics.transitions.items(), key=lambda item: item[0].value):
+        out.sample("trade_transitions_total", count, action=action.name)
+
+    metrics.check_sla()
+    sla = metrics.sla_stats()
+    out.family("trade_approval_sla_seconds", "gauge", "Longest a trade may wait for approval.")
+    out.sample("trade_approval_sla_seconds", sla.threshold_seconds)
+    out.family("trade_approval_waiting", "gauge", "Trades waiting for approval within the SLA.")
+    out.sample("trade_approval_waiting", sla.watched)
+    out.family("trade_approval_sla_breached", "gauge", "Trades waiting for approval past the SLA.")
+    out.sample("trade_approval_sla_breached", sla.breached)
+    out.family("trade_approval_sla_breaches_total", "counter", "Trades that exceeded the approval SLA.")
+    out.sample("trade_approval_sla_breaches_total", sla.breaches_total)
+
+    cache = container.history_service.differences_cache.stats()
+    out.family("trade_differences_cache_hits_total", "counter", "Version differences served from the cache.")
+    out.sample("trade_differences_cache_hits_total", cache.hits)
+    out.family("trade_differences_cache_misses_total", "counter", "Version differences computed.")
+    out.sample("trade_differences_cache_misses_total", cache.misses)
+    out.family("trade_differences_cache_entries", "gauge", "Version differences cached.")
+    out.sample("trade_differences_cache_entries", cache.size)
+
+    idempotency = container.idempotency.stats()
+    out.family("trade_idempotent_requests_total", "counter", "Requests with an Idempotency-Key, by outcome.")
+    for outcome in ("executed", "replayed", "joined", "conflicts"):
+        out.sample("trade_idempotent_requests_total", getattr(idempotency, outcome), outcome=outcome)
+
+    out.family("trade_execution_circuit_open", "gauge", "1 while sends to a venue are refused by its circuit breaker.")
+    out.family("trade_execution_rejected_total", "counter", "Sends refused by a venue's circuit breaker.")
+    for venue, breaker in sorted(container.executor.stats().items()):
+        out.sample("trade_execution_circuit_open", int(breaker.state != "closed"), venue=venue)
+        out.sample("trade_execution_rejected_total", breaker.rejected, venue=venue)
+
+    if container.dispatcher is not None:
+        dispatch = container.dispatcher.stats()
+        out.family("trade_execution_outbox_depth", "gauge", "Sends queued or in flight.")
+        out.sample("trade_execution_outbox_depth", dispatch.depth)
+        out.family("trade_execution_outbox_in_flight", "gauge", "Sends in flight.")
+        out.sample("trade_execution_outbox_in_flight", dispatch.in_flight)
+        out.family("trade_execution_dispatched_total", "counter", "Receipts recorded by the dispatcher.")
+        out.sample("trade_execution_dispatched_total", dispatch.dispatched)
+        out.family("trade_execution_dispatch_failures_total", "counter", "Sends requeued after exhausting retries.")
+        out.sample("trade_execution_dispatch_failures_total", dispatch.failures)
+
+    if container.change_feed is not None:
+        feed = container.change_feed.stats()
+        out.family("trade_change_feed_delivered_total", "counter", "Trades saved by other workers delivered to the views.")
+        out.sample("trade_change_feed_delivered_total", feed.delivered)
+        out.family("trade_change_feed_position", "gauge", "Sequence number of the last change log entry read.")
+        out.sample("trade_change_feed_position", feed.cursor)
+
+    for sink in container.span_sinks:
+        if isinstance(sink, HistogramSink):
+            out.family("trade_span_duration_seconds", "histogram",
+                       "Duration of commands, their phases, repository calls and sends.")
+            for name, histogram in sorted(sink.durations.items()):
+                out.histogram("trade_span_duration_seconds", histogram, SPAN_BUCKETS, span=name)
+            out.family("trade_span_errors_total", "counter", "Spans that ended with an exception.")
+            for name, count in sorted(sink.errors.items()):
+                out.sample("trade_span_errors_total", count, span=name)
+            break
+
+    return out.render()
@@ -0,0 +1,60 @@
+import asyncio
+import os
+from typing import Mapping
+
+from limits import parse_many
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..infrastructure.rate_limit import sqlite_rate_limit_storage  # noqa: F401  (registers sqlite://)
+from .encoders import dumps
+from .settings import RATE_LIMIT_ENV, RATE_LIMIT_STORAGE_ENV
+
+
+class RateLimiter:
+    """
+    Fixed-window request limits per client address, counted in a `limits` storage.
+
+    Workers configured with the same shared storage (e.g. `sqlite:///<path>`) keep one count
+    per client between them. Without limits every request is allowed and nothing is counted.
+    """
+
+    def __init__(self, limits: str | None = None, storage_uri: str = "memory://") -> None:
+        self.limits = parse_many(limits) if limits else []
+        self._strategy = FixedWindowRateLimiter(storage_from_string(storage_uri))
+
+    @classmethod
+    def from_environment(cls, environ: Mapping[str, str] = os.environ) -> "RateLimiter":
+        """The limiter of a server process, configured by environment (see api/settings.py)."""
+        return cls(environ.get(RATE_LIMIT_ENV), environ.get(RATE_LIMIT_STORAGE_ENV, "memory://"))
+
+    def hit(self, client: str) -> bool:
+        """Count one request of `client`; False once it is over any limit."""
+        return all(self._strategy.hit(limit, client) for limit in self.limits)
+
+
+class RateLimitMiddleware:
+    """
+    Answers 429 to the HTTP requests of a client over the limits of `app.state.limiter`.
+
+    Requests under the `exempt` prefixes (probes, scrapes) are never counted. A check may
+    write to the shared storage, so it runs in a worker thread, off the event loop.
+    """
+
+    def __init__(self, app: ASGIApp, exempt: tuple[str, ...] = ("/api/health", "/metrics")) -> None:
+        self.app = app
+        self.exempt = exempt
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt):
+            return await self.app(scope, receive, send)
+        limiter: RateLimiter = scope["app"].state.limiter
+        client = scope.get("client")
+        if limiter.limits and not await asyncio.to_thread(limiter.hit, client[0] if client else "127.0.0.1"):
+            body = dumps({"error": "Too many requests"})
+            await send({"type": "http.response.start", "status": 429,
+                        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]})
+            await send({"type": "http.response.body", "body": body})
+            return
+        await self.app(scope, receive, send)
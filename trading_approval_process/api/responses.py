@@ -0,0 +1,17 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from .encoders import dumps
+
+
+class DomainJSONResponse(JSONResponse):
+    """
+    JSON response that serialises domain objects directly (see `encoders.dumps`).
+
+    FastAPI runs `jsonable_encoder` over whatever a route returns before rendering it, so
+    routes returning trades build this response themselves to skip that walk.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
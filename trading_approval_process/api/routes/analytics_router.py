@@ -0,0 +1,48 @@
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ...domain.models.trade_analytics import GROUP_FIELDS, AnalyticsFilter
+from ...domain.models.trade_state import TradeState
+from ..dependencies import get_analytics
+from ..responses import DomainJSONResponse
+
+router = APIRouter()
+
+
+def get_filter(
+    state: Annotated[list[str] | None, Query(description="Current state names")] = None,
+    currency: Annotated[str | None, Query(description="Notional currency")] = None,
+    counterparty: Annotated[str | None, Query()] = None,
+    trade_date_from: Annotated[date | None, Query(alias="from", description="Trade date on or after")] = None,
+    trade_date_to: Annotated[date | None, Query(alias="to", description="Trade date on or before")] = None,
+) -> AnalyticsFilter:
+    unknown = [name for name in state or [] if name not in TradeState.__members__]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown state(s): {', '.join(unknown)}")
+    return AnalyticsFilter(states=tuple(TradeState[name] for name in state or []), currency=currency,
+                           counterparty=counterparty, trade_date_from=trade_date_from, trade_date_to=trade_date_to)
+
+
+@router.get("/notional")
+async def notional(
+    group_by: Annotated[list[str] | None, Query(description=f"Fields to group by: {', '.join(GROUP_FIELDS)}")] = None,
+    where: AnalyticsFilter = Depends(get_filter),
+    analytics=Depends(get_analytics),
+):
+    try:
+        groups = analytics.notional(tuple(group_by or ()), where)
+    except ValueError as ex:
+        raise HTTPException(status_code=422, detail=str(ex))
+    return DomainJSONResponse({"groups": groups})
+
+
+@router.get("/approval-turnaround")
+async def approval_turnaround(where: AnalyticsFilter = Depends(get_filter), analytics=Depends(get_analytics)):
+    return DomainJSONResponse({"approvers": analytics.approval_turnaround(where)})
+
+
+@router.get("/cancellations")
+async def cancellations(where: AnalyticsFilter = Depends(get_filter), analytics=Depends(get_analytics)):
+    return DomainJSONResponse({"counterparties": analytics.cancellations(where)})
@@ -1,4 +1,7 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from ..container import AppContainer
+from ..dependencies import get_container
 
 router = APIRouter()
 
@@ -9,3 +12,15 @@ async def liveness():
 @router.get("/ready")
 async def readiness():
     return {"status": "ready"}
+
+@router.get("/stats")
+async def stats(container: AppContainer = Depends(get_container)):
+    cache = container.history_service.differences_cache.stats()
+    stats = {"differences_cache": {**vars(cache), "hit_ratio": cache.hit_ratio}}
+    stats["idempotency"] = vars(container.idempotency.stats())
+    stats["execution_venues"] = {venue: vars(breaker) for venue, breaker in container.executor.stats().items()}
+    if container.dispatcher is not None:
+        stats["execution_outbox"] = vars(container.dispatcher.stats())
+    if container.change_feed is not None:
+        stats["change_feed"] = vars(container.change_feed.stats())
+    return stats
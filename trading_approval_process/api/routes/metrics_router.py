@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Depends, Response
+
+from ..container import AppContainer
+from ..dependencies import get_container
+from ..metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter()
+
+@router.get("/metrics")
+async def metrics(container: AppContainer = Depends(get_container)):
+    """Prometheus scrape endpoint (text exposition format)."""
+    return Response(render_metrics(container), media_type=CONTENT_TYPE)
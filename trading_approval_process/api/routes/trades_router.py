@@ -1,26 +1,231 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from uuid import UUID
-from typing import Annotated
+from datetime import date, datetime, timezone
+from typing import Annotated, AsyncIterator, Literal
 import asyncio
+import math
 
 from trading_approval_process.application.services.trade_approval_service import TradeApprovalService
+from trading_approval_process.application.services.trade_history_service import TradeHistoryService
+from trading_approval_process.application.views.approval_inbox import ApprovalInbox
 from ...domain.models.trade_details import TradeDetails
 from ...domain.models.execution_confirmation import ExecutionConfirmation
+from ...domain.models.trade_event import TradeEventFilter
+from ...domain.models.trade_query import TradeQuery
+from ...domain.models.trade_state import TradeState
 from ...core.cancellation_token import CancellationToken
-from ..dependencies import get_trade_service
+from ...domain.exceptions import ExecutionUnavailableException, NotFoundException, PreconditionFailedException
+from ...domain.models.trade import Trade
+from ...infrastructure.events.trade_event_bus import TradeEventBus
+from ..dependencies import get_trade_service, get_history_service, get_inbox, get_event_bus
+from ..export import MEDIA_TYPES, csv_chunks, ndjson_chunks, prefetch
+from ..etags import expected_version, is_not_modified, trade_etag
+from ..responses import DomainJSONResponse
+from ..sse import stream_events
 
 router = APIRouter()
 
 # --- Cancellation token dependency ---
-async def get_cancellation_token(request: Request) -> CancellationToken:
+DISCONNECT_POLL_INTERVAL = 0.25
+
+async def get_cancellation_token(request: Request) -> AsyncIterator[CancellationToken]:
     token = CancellationToken()
     async def cancel_on_disconnect():
-        await request.is_disconnected()
+        # is_disconnected() is a non-blocking probe, so it has to be polled
+        while not await request.is_disconnected():
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
         token.cancel("Client disconnected")
-    asyncio.create_task(cancel_on_disconnect())
-    return token
+    watcher = asyncio.create_task(cancel_on_disconnect())
+    try:
+        yield token
+    finally:
+        watcher.cancel()
+
+# --- Listing (keyset pagination: pass next_cursor back as cursor) ---
+MAX_PAGE_SIZE = 500
+
+
+@router.get("")
+async def list_trades(
+    state: Annotated[str | None, Query(description="Current state name, e.g. PENDING_APPROVAL")] = None,
+    requester: Annotated[str | None, Query()] = None,
+    approver: Annotated[str | None, Query()] = None,
+    counterparty: Annotated[str | None, Query()] = None,
+    notional_currency: Annotated[str | None, Query()] = None,
+    trade_date: Annotated[date | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 50,
+    cursor: Annotated[int | None, Query(ge=0, description="next_cursor of the previous page")] = None,
+    service: TradeHistoryService = Depends(get_history_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    if state is not None and state not in TradeState.__members__:
+        raise HTTPException(status_code=422, detail=f"Unknown state '{state}'")
+    query = TradeQuery(state=TradeState[state] if state else None, requester=requester, approver=approver, counterparty=counterparty,
+                       notional_currency=notional_currency, trade_date=trade_date, limit=limit, after=cursor)
+    try:
+        page = await service.query_trades(query, token)
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+    return DomainJSONResponse({"items": page.items, "next_cursor": page.next_cursor})
+
+
+@router.get("/inbox")
+async def get_inbox_page(
+    user: Annotated[str, Query(..., description="User whose approval the trades are waiting for")],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 50,
+    cursor: Annotated[int | None, Query(ge=0, description="next_cursor of the previous page")] = None,
+    inbox: ApprovalInbox = Depends(get_inbox),
+):
+    page = inbox.page(user, limit, cursor)
+    return DomainJSONResponse({"items": page.items, "next_cursor": page.next_cursor})
+
+
+@router.get("/events")
+async def stream_trade_events(
+    state: Annotated[list[str] | None, Query(description="State names to follow")] = None,
+    trade_id: Annotated[list[UUID] | None, Query(description="Trades to follow")] = None,
+    user: Annotated[str | None, Query(description="Follow trades this user acts on, requested or approves")] = None,
+    last_event_id: Annotated[int | None, Header(alias="Last-Event-ID")] = None,
+    bus: TradeEventBus = Depends(get_event_bus),
+):
+    unknown = [name for name in state or [] if name not in TradeState.__members__]
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown state(s): {', '.join(unknown)}")
+    event_filter = TradeEventFilter(
+        states=frozenset(TradeState[name] for name in state) if state else None,
+        trade_ids=frozenset(trade_id) if trade_id else None,
+        user=user,
+    )
+    subscription = bus.subscribe(event_filter, last_event_id)
+    return StreamingResponse(stream_events(bus, subscription), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+# --- Streaming exports (constant memory: records are read and sent a batch at a time) ---
+ExportFormat = Annotated[Literal["ndjson", "csv"], Query(alias="format")]
+
+
+def _export_response(rows: AsyncIterator, export_format: str, filename: str) -> StreamingResponse:
+    chunks = csv_chunks(rows) if export_format == "csv" else ndjson_chunks(rows)
+    return StreamingResponse(chunks, media_type=MEDIA_TYPES[export_format],
+                             headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'})
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    # Audit timestamps are UTC; a bound given without an offset is read as UTC too.
+    return value.replace(tzinfo=timezone.utc) if value is not None and value.tzinfo is None else value
+
+
+@router.get("/history/export")
+async def export_history(
+    start: Annotated[datetime | None, Query(alias="from", description="Records at or after (UTC if no offset)")] = None,
+    end: Annotated[datetime | None, Query(alias="to", description="Records before (UTC if no offset)")] = None,
+    export_format: ExportFormat = "ndjson",
+    service: TradeHistoryService = Depends(get_history_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    try:
+        rows = await prefetch(service.export_history(_as_utc(start), _as_utc(end), token))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+    return _export_response(rows, export_format, "audit-export")
+
+
+@router.get("/{trade_id}/history/stream")
+async def stream_history(
+    trade_id: UUID,
+    export_format: ExportFormat = "ndjson",
+    service: TradeHistoryService = Depends(get_history_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    try:
+        records = await prefetch(service.stream_history(trade_id, token))
+    except NotFoundException as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+    rows = ((trade_id, record) async for record in records)
+    return _export_response(rows, export_format, f"trade-{trade_id}-history")
+
+
+# --- Batch endpoints (registered before /{trade_id}/... so "batch" is never parsed as an id) ---
+MAX_BATCH_SIZE = 10_000
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"Batch exceeds {MAX_BATCH_SIZE} items")
+
+
+@router.post("/batch/create", status_code=status.HTTP_201_CREATED)
+async def create_trades(
+    user: Annotated[str, Query(..., description="Requester creating the trades")],
+    items: list[TradeDetails],
+    service: TradeApprovalService = Depends(get_trade_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    _check_batch_size(items)
+    try:
+        return DomainJSONResponse(await service.create_many(user, items, token), status.HTTP_201_CREATED)
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+
+@router.post("/batch/submit")
+async def submit_trades(
+    user: Annotated[str, Query(..., description="Requester submitting for approval")],
+    trade_ids: list[UUID],
+    service: TradeApprovalService = Depends(get_trade_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    _check_batch_size(trade_ids)
+    try:
+        return DomainJSONResponse(await service.submit_many(user, trade_ids, token))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+
+@router.post("/batch/approve")
+async def approve_trades(
+    user: Annotated[str, Query(..., description="Approver approving the trades")],
+    trade_ids: list[UUID],
+    service: TradeApprovalService = Depends(get_trade_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    _check_batch_size(trade_ids)
+    try:
+        return DomainJSONResponse(await service.approve_many(user, trade_ids, token))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+
+@router.post("/batch/cancel")
+async def cancel_trades(
+    user: Annotated[str, Query(..., description="User cancelling the trades")],
+    trade_ids: list[UUID],
+    service: TradeApprovalService = Depends(get_trade_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    _check_batch_size(trade_ids)
+    try:
+        return DomainJSONResponse(await service.cancel_many(user, trade_ids, token))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+
+
+# --- Endpoints (conditional requests: reads carry an ETag, writes honour If-Match) ---
+IfMatch = Annotated[str | None, Header(alias="If-Match", description="ETag of the version the change applies to")]
+IfNoneMatch = Annotated[str | None, Header(alias="If-None-Match", description="ETag of the cached representation")]
+
+
+def _tagged(trade: Trade, status_code: int = status.HTTP_200_OK) -> DomainJSONResponse:
+    return DomainJSONResponse(trade, status_code, headers={"ETag": trade_etag(trade.trade_id, trade.version)})
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
 
-# --- Endpoints ---
 @router.post("/create", status_code=status.HTTP_201_CREATED)
 async def create_trade(
     user: Annotated[str, Query(..., description="Requester creating the trade")],
@@ -29,9 +234,29 @@ async def create_trade(
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.create(user, details, token)
+        trade = await service.create(user, details, token)
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade, status.HTTP_201_CREATED)
+
+
+@router.get("/{trade_id}")
+async def get_trade(
+    trade_id: UUID,
+    if_none_match: IfNoneMatch = None,
+    service: TradeHistoryService = Depends(get_history_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    try:
+        trade = await service.get_trade(trade_id, token)
+    except NotFoundException as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    etag = trade_etag(trade.trade_id, trade.version)
+    if is_not_modified(if_none_match, etag):
+        return _not_modified(etag)
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/update")
@@ -39,65 +264,87 @@ async def update_trade(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="Requester updating the trade")],
     details: TradeDetails,
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.update(user, trade_id, details, token)
+        trade = await service.update(user, trade_id, details, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/submit")
 async def submit_trade(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="Requester submitting for approval")],
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.submit(user, trade_id, token)
+        trade = await service.submit(user, trade_id, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/approve")
 async def approve_trade(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="Approver approving the trade")],
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.approve(user, trade_id, token)
+        trade = await service.approve(user, trade_id, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/cancel")
 async def cancel_trade(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="User cancelling the trade")],
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.cancel(user, trade_id, token)
+        trade = await service.cancel(user, trade_id, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/send_to_execute")
 async def send_to_execute(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="Approver sending to execution venue")],
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.send_to_execute(user, trade_id, token)
+        trade = await service.send_to_execute(user, trade_id, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
+    except ExecutionUnavailableException as ex:
+        raise HTTPException(status_code=503, detail=str(ex), headers={"Retry-After": str(math.ceil(ex.retry_after))})
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.post("/{trade_id}/book")
@@ -105,23 +352,49 @@ async def book_trade(
     trade_id: UUID,
     user: Annotated[str, Query(..., description="Requester booking executed trade")],
     confirmation: ExecutionConfirmation,
+    if_match: IfMatch = None,
     service: TradeApprovalService = Depends(get_trade_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.book(user, trade_id, confirmation, token)
+        trade = await service.book(user, trade_id, confirmation, token, expected_version(if_match, trade_id))
+    except PreconditionFailedException as ex:
+        raise HTTPException(status_code=412, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return _tagged(trade)
 
 
 @router.get("/{trade_id}/history")
 async def get_history(
     trade_id: UUID,
-    service: TradeApprovalService = Depends(get_trade_service),
+    if_none_match: IfNoneMatch = None,
+    service: TradeHistoryService = Depends(get_history_service),
+    token: CancellationToken = Depends(get_cancellation_token),
+):
+    try:
+        history = await service.get_history(trade_id, token)
+    except NotFoundException as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
+    except Exception as ex:
+        raise HTTPException(status_code=400, detail=str(ex))
+    # The last record's step is the trade's version; a match skips serialising the trail.
+    etag = trade_etag(history.trade_id, history.records[-1].step)
+    if is_not_modified(if_none_match, etag):
+        return _not_modified(etag)
+    return DomainJSONResponse(history, headers={"ETag": etag})
+
+
+@router.get("/{trade_id}/changelog")
+async def get_changelog(
+    trade_id: UUID,
+    service: TradeHistoryService = Depends(get_history_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
     try:
-        return await service.get_history(trade_id, token)
+        return DomainJSONResponse(await service.get_changelog(trade_id, token))
+    except NotFoundException as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
 
@@ -129,10 +402,20 @@ async def get_history(
 @router.get("/{trade_id}/differences")
 async def get_differences(
     trade_id: UUID,
-    service: TradeApprovalService = Depends(get_trade_service),
+    version_from: Annotated[int, Query(alias="from", ge=1, description="Older version")],
+    version_to: Annotated[int, Query(alias="to", ge=1, description="Newer version")],
+    if_none_match: IfNoneMatch = None,
+    service: TradeHistoryService = Depends(get_history_service),
     token: CancellationToken = Depends(get_cancellation_token),
 ):
+    # Recorded versions never change, so a client holding this diff's tag needs no load at all.
+    etag = trade_etag(trade_id, version_from, version_to)
+    if is_not_modified(if_none_match, etag):
+        return _not_modified(etag)
     try:
-        return await service.get_differences(trade_id, token)
+        diff = await service.get_differences(trade_id, version_from, version_to, token)
+    except NotFoundException as ex:
+        raise HTTPException(status_code=404, detail=str(ex))
     except Exception as ex:
         raise HTTPException(status_code=400, detail=str(ex))
+    return DomainJSONResponse(diff, headers={"ETag": etag})
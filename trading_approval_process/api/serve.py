@@ -0,0 +1,58 @@
+"""
+Production entry point: `--workers` server processes behind one port.
+
+The workers share a SQLite file for the trades, each following the others' saves through
+the change feed (see AppContainer), and a second one for the rate limiter's counters, so
+`--rate-limit` holds per client across all workers. Both are passed to the workers through
+the environment (see api/settings.py). A single worker without `--db` keeps everything in
+memory, as `python -m trading_approval_process.api` does.
+
+Idempotency keys are honoured per worker: a retry routed to another worker than the first
+attempt runs again (and is then subject to the trade's version checks).
+
+Run:  python -m trading_approval_process.api.serve --workers 4 --db /var/lib/trade-approval/trades.db
+"""
+import argparse
+import asyncio
+import os
+from pathlib import Path
+
+import uvicorn
+
+from trading_approval_process.api.settings import DATABASE_ENV, RATE_LIMIT_ENV, RATE_LIMIT_STORAGE_ENV
+from trading_approval_process.infrastructure import SqliteTradeRepository
+
+
+def prepare(database: Path, rate_limit_storage: str | None) -> None:
+    """Create the schema once, then point the workers at the shared files."""
+    database.parent.mkdir(parents=True, exist_ok=True)
+    asyncio.run(SqliteTradeRepository(str(database), pool_size=1).close())
+    os.environ[DATABASE_ENV] = str(database)
+    os.environ[RATE_LIMIT_STORAGE_ENV] = (rate_limit_storage
+                                          or f"sqlite:///{database.with_name(database.stem + '-rate-limits.db')}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--db", type=Path, help="SQLite file shared by the workers")
+    parser.add_argument("--rate-limit", default="100/second", help="requests allowed per client address ('' for none)")
+    parser.add_argument("--rate-limit-storage",
+                        help="limits storage URI of the rate limiter (default: a SQLite file next to --db)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    if args.workers > 1 and args.db is None:
+        parser.error("--workers above 1 needs --db: trades kept in memory cannot be shared between processes")
+    if args.db is not None:
+        prepare(args.db.resolve(), args.rate_limit_storage)
+    os.environ[RATE_LIMIT_ENV] = args.rate_limit
+
+    uvicorn.run("trading_approval_process.api.main:app", host=args.host, port=args.port, workers=args.workers,
+                log_level=args.log_level)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""
+Environment variables configuring the application in each server process.
+
+The production entry point (api/serve.py) sets them before starting the workers, so every
+worker process builds the same configuration.
+"""
+
+# SQLite file holding the trades, shared by the workers. Unset: trades are kept in memory.
+DATABASE_ENV = "TRADE_APPROVAL_DB"
+
+# `limits` storage URI of the rate limiter's counters, e.g. "sqlite:///var/lib/app/rate-limits.db".
+RATE_LIMIT_STORAGE_ENV = "TRADE_APPROVAL_RATE_LIMITS"
+
+# Requests allowed per client address on every route, e.g. "100/second". Unset: no limit.
+RATE_LIMIT_ENV = "TRADE_APPROVAL_RATE_LIMIT"
@@ -0,0 +1,37 @@
+from typing import AsyncIterator
+
+from .encoders import dumps
+from ..infrastructure.events.trade_event_bus import Subscription, TradeEventBus
+
+KEEPALIVE_INTERVAL = 15.0
+
+
+def format_event(event_id: int | None, event: str, data: object) -> str:
+    """One server-sent event frame."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\ndata: {dumps(data).decode()}\n\n"
+
+
+async def stream_events(bus: TradeEventBus, subscription: Subscription,
+                        keepalive: float = KEEPALIVE_INTERVAL) -> AsyncIterator[str]:
+    """
+    Frames for one SSE client until its subscription ends.
+
+    A `resync` event tells the client it resumed past the retained history and should
+    reload state; comment lines keep idle connections open through proxies. The stream
+    ends when the bus disconnects a slow subscriber, and the client reconnects with the
+    Last-Event-ID header to continue where it stopped.
+    """
+    try:
+        if subscription.gap:
+            yield format_event(None, "resync", {"last_event_id": bus.last_event_id})
+        while True:
+            event = await subscription.get(timeout=keepalive)
+            if event is None:
+                if subscription.closed:
+                    return
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event.event_id, "trade", event)
+    finally:
+        bus.unsubscribe(subscription)
@@ -1,6 +1,7 @@
 from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_action import TradeAction
 
@@ -10,18 +11,20 @@ class ApproveCommand:
         self._repository = repository
         self._time = time
 
-    async def run(self, user: str, trade_id: str, token: CancellationToken) ->Trade:
-        # Load
+    @instrumented(phased=True)
+    async def run(self, user: str, trade_id: str, token: CancellationToken, expected_version: int | None = None) ->Trade:
+        phase("load")
         trade = await self._repository.get_by_id(trade_id, token)
 
-        # Validate
+        phase("validate")
+        trade.check_version(expected_version)
         trade.validate(user, TradeAction.APPROVE)
 
-        # Change
+        phase("change")
         trade.approver = user
         trade.change(user, TradeAction.APPROVE, self._time.now())
 
-        # Save
+        phase("save")
         await self._repository.update(trade, token)
 
         return trade
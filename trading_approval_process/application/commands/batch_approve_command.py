@@ -0,0 +1,10 @@
+from trading_approval_process.application.commands.batch_transition_command import BatchTransitionCommand
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+class BatchApproveCommand(BatchTransitionCommand):
+    action = TradeAction.APPROVE
+
+    def _prepare(self, trade: Trade, user: str) -> None:
+        trade.approver = user
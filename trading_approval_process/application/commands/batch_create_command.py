@@ -0,0 +1,45 @@
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
+from trading_approval_process.domain.exceptions.domain_exception import DomainException
+from trading_approval_process.domain.models.batch_item_result import BatchItemResult
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+
+
+class BatchCreateCommand:
+    def __init__(self, repository: ITradeRepository, time: ITimeProvider):
+        self._repository = repository
+        self._time = time
+
+    @instrumented(phased=True)
+    async def run(self, user: str, items: list[TradeDetails], token: CancellationToken) -> list[BatchItemResult]:
+        phase("apply")
+        now = self._time.now()
+        results: list[BatchItemResult] = []
+        created: list[Trade] = []
+
+        for index, trade_details in enumerate(items):
+            # Create
+            trade: Trade = Trade()
+            try:
+                # Validate
+                trade.validate(user, TradeAction.CREATE, trade_details)
+            except DomainException as ex:
+                results.append(BatchItemResult(index, None, error=str(ex)))
+                continue
+
+            # Change
+            trade.requester = user
+            trade.details = trade_details
+            trade.change(user, TradeAction.CREATE, now)
+            created.append(trade)
+            results.append(BatchItemResult(index, trade.trade_id, trade.state, trade.version))
+
+        phase("save")
+        if created:
+            await self._repository.add_many(created, token)
+
+        return results
@@ -0,0 +1,6 @@
+from trading_approval_process.application.commands.batch_transition_command import BatchTransitionCommand
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+class BatchSubmitCommand(BatchTransitionCommand):
+    action = TradeAction.SUBMIT
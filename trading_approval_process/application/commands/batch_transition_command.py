@@ -0,0 +1,66 @@
+import uuid
+
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
+from trading_approval_process.domain.exceptions import NotFoundException, ValidationException
+from trading_approval_process.domain.exceptions.domain_exception import DomainException
+from trading_approval_process.domain.models.batch_item_result import BatchItemResult
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+class BatchTransitionCommand:
+    """
+    Apply one action to many trades: one bulk load, per-item validate and change, one bulk save.
+
+    Items that fail validation are reported individually; the rest are saved together.
+    """
+
+    action: TradeAction
+
+    def __init__(self, repository: ITradeRepository, time: ITimeProvider):
+        self._repository = repository
+        self._time = time
+
+    @instrumented(phased=True)
+    async def run(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        phase("load")
+        trades = await self._repository.get_many(trade_ids, token)
+
+        phase("apply")
+        now = self._time.now()
+        results: list[BatchItemResult] = []
+        changed: list[Trade] = []
+        seen: set[str] = set()
+
+        for index, (trade_id, trade) in enumerate(zip(trade_ids, trades)):
+            try:
+                if trade is None:
+                    raise NotFoundException(f"Trade {trade_id} not found")
+                if str(trade_id) in seen:
+                    raise ValidationException(f"Trade {trade_id} appears more than once in the batch")
+                seen.add(str(trade_id))
+
+                # Validate
+                trade.validate(user, self.action)
+            except DomainException as ex:
+                results.append(BatchItemResult(index, trade_id, error=str(ex)))
+                continue
+
+            # Change
+            self._prepare(trade, user)
+            trade.change(user, self.action, now)
+            changed.append(trade)
+            results.append(BatchItemResult(index, trade.trade_id, trade.state, trade.version))
+
+        phase("save")
+        if changed:
+            await self._repository.update_many(changed, token)
+
+        return results
+
+    def _prepare(self, trade: Trade, user: str) -> None:
+        """Set action-specific fields before the transition is recorded."""
+        pass
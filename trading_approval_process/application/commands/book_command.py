@@ -4,6 +4,8 @@ from dataclasses import replace
 from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
+from trading_approval_process.domain.exceptions import ValidationException
 from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_action import TradeAction
@@ -14,14 +16,19 @@ class BookCommand:
         self._repository = repository
         self._time = time
 
-    async def run(self, user: str, trade_id: str, confirmation: ExecutionConfirmation, token: CancellationToken) ->Trade:
-        # Load
+    @instrumented(phased=True)
+    async def run(self, user: str, trade_id: str, confirmation: ExecutionConfirmation, token: CancellationToken, expected_version: int | None = None) ->Trade:
+        phase("load")
         trade = await self._repository.get_by_id(trade_id, token)
 
-        # Validate
+        phase("validate")
+        trade.check_version(expected_version)
         trade.validate(user, TradeAction.BOOK)
+        if trade.execution_receipt is None:
+            # Deferred sends: the trade is still waiting in the outbox, not yet at the venue.
+            raise ValidationException(f"Trade {trade.trade_id} has no execution receipt yet")
 
-        # Change
+        phase("change")
         trade.execution_confirmation = confirmation
         trade.details = replace( trade.details,
             strike=confirmation.strike,
@@ -29,7 +36,7 @@ class BookCommand:
         )
         trade.change(user, TradeAction.BOOK, self._time.now())
 
-        # Save
+        phase("save")
         await self._repository.update(trade, token)
 
         return trade
\ No newline at end of file
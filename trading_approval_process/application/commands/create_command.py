@@ -2,6 +2,7 @@
 from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_action import TradeAction
 from trading_approval_process.domain.models.trade_details import TradeDetails
@@ -12,19 +13,20 @@ class CreateCommand:
         self._repository = repository
         self._time = time
 
+    @instrumented(phased=True)
     async def run(self, user: str, trade_details: TradeDetails, token: CancellationToken) ->Trade:
-        # Create
+        phase("create")
         trade: Trade = Trade()
 
-        # Validate
+        phase("validate")
         trade.validate(user, TradeAction.CREATE,  trade_details)
 
-        # Change
+        phase("change")
         trade.requester = user
         trade.details = trade_details
         trade.change(user, TradeAction.CREATE, self._time.now())
 
-        # Save
+        phase("save")
         await self._repository.add(trade, token)
 
         return trade
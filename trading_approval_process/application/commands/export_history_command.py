@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+from typing import AsyncIterator
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.audit_record import AuditRecord
+
+
+class ExportHistoryCommand:
+    def __init__(self, repository: ITradeRepository):
+        self._repository = repository
+
+    def run(self, start: datetime | None, end: datetime | None,
+            token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        # Validate
+        if start is not None and end is not None and end < start:
+            raise ValueError("Export range ends before it starts")
+
+        # Load, a batch of records at a time, as the caller consumes them
+        return self._repository.export_audit(start, end, token)
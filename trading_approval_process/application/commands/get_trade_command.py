@@ -0,0 +1,14 @@
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented
+from trading_approval_process.domain.models.trade import Trade
+
+
+class GetTradeCommand:
+    def __init__(self, repository: ITradeRepository):
+        self._repository = repository
+
+    @instrumented()
+    async def run(self, trade_id: str, token: CancellationToken) ->Trade:
+        # Load
+        return await self._repository.get_by_id(trade_id, token)
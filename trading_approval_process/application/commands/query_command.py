@@ -0,0 +1,14 @@
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
+
+
+class QueryCommand:
+    def __init__(self, repository: ITradeRepository):
+        self._repository = repository
+
+    @instrumented()
+    async def run(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        # Load one page of matching trades through the repository's secondary indexes
+        return await self._repository.query(query, token)
@@ -0,0 +1,35 @@
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
+from trading_approval_process.domain.exceptions import ValidationException
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+
+
+class RecordReceiptCommand:
+    def __init__(self, repository: ITradeRepository, time: ITimeProvider):
+        self._repository = repository
+        self._time = time
+
+    @instrumented(phased=True)
+    async def run(self, user: str, trade_id: str, receipt: ExecutionReceipt, token: CancellationToken,
+                  expected_version: int | None = None) ->Trade:
+        phase("load")
+        trade = await self._repository.get_by_id(trade_id, token)
+
+        phase("validate")
+        trade.check_version(expected_version)
+        trade.validate(user, TradeAction.RECORD_RECEIPT)
+        if trade.execution_receipt is not None:
+            raise ValidationException(f"Trade {trade.trade_id} already has an execution receipt")
+
+        phase("change")
+        trade.execution_receipt = receipt
+        trade.change(user, TradeAction.RECORD_RECEIPT, self._time.now())
+
+        phase("save")
+        await self._repository.update(trade, token)
+
+        return trade
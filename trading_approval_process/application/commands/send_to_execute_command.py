@@ -2,30 +2,35 @@ from trading_approval_process.application.interfaces.i_time_provider import ITim
 from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumented, phase
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_action import TradeAction
 
 
 class SendToExecuteCommand:
 
-    def __init__(self, executor: ITradeExecutor, repository: ITradeRepository, time: ITimeProvider):
+    def __init__(self, executor: ITradeExecutor | None, repository: ITradeRepository, time: ITimeProvider):
         self._executor = executor
         self._repository = repository
         self._time = time
 
 
-    async def run(self, user: str, trade_id: str, token: CancellationToken) ->Trade:
-        # Load
+    @instrumented(phased=True)
+    async def run(self, user: str, trade_id: str, token: CancellationToken, expected_version: int | None = None) ->Trade:
+        phase("load")
         trade = await  self._repository.get_by_id(trade_id, token)
 
-        # Validate
+        phase("validate")
+        trade.check_version(expected_version)
         trade.validate(user, TradeAction.SEND_TO_EXECUTE)
 
-        # Change
-        trade.execution_receipt = await self._executor.send(trade, token)
+        # Change (without an executor only the intent is saved; the dispatcher sends it later)
+        phase("change")
+        if self._executor is not None:
+            trade.execution_receipt = await self._executor.send(trade, token)
         trade.change(user, TradeAction.SEND_TO_EXECUTE, self._time.now())
 
-        # Save
+        phase("save")
         await self._repository.update(trade, token)
 
         return trade
@@ -0,0 +1,14 @@
+from typing import AsyncIterator
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.audit_record import AuditRecord
+
+
+class StreamHistoryCommand:
+    def __init__(self, repository: ITradeRepository):
+        self._repository = repository
+
+    def run(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        # Load, a batch of records at a time, as the caller consumes them
+        return self._repository.stream_audit(trade_id, token)
@@ -1,7 +1,10 @@
+import uuid
 from abc import ABC, abstractmethod
 
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.batch_item_result import BatchItemResult
 from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_details import TradeDetails
 
@@ -15,31 +18,63 @@ class ITradeApprovalService(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def submit(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
+    async def submit(self, user: str, trade_id: str, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
         """Submit a trade for approval (Draft → PendingApproval)."""
         raise NotImplementedError
 
     @abstractmethod
-    async def approve(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
+    async def approve(self, user: str, trade_id: str, token: CancellationToken,
+                      expected_version: int | None = None) -> Trade:
         """Approve a trade in PendingApproval or NeedsReapproval state."""
         raise NotImplementedError
 
     @abstractmethod
-    async def update(self, user: str, trade_id: str, details: TradeDetails, token: CancellationToken) -> Trade:
+    async def update(self, user: str, trade_id: str, details: TradeDetails, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
         """Update trade details (Draft or PendingApproval)."""
         raise NotImplementedError
 
     @abstractmethod
-    async def cancel(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
+    async def cancel(self, user: str, trade_id: str, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
         """Cancel a trade (Requester or Approver)."""
         raise NotImplementedError
 
     @abstractmethod
-    async def send_to_execute(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
+    async def send_to_execute(self, user: str, trade_id: str, token: CancellationToken,
+                              expected_version: int | None = None) -> Trade:
         """Send an approved trade to the counterparty for execution."""
         raise NotImplementedError
 
     @abstractmethod
-    async def book(self, user: str, trade_id: str, confirmation: ExecutionConfirmation, token: CancellationToken) -> Trade:
+    async def record_receipt(self, user: str, trade_id: str, receipt: ExecutionReceipt, token: CancellationToken,
+                             expected_version: int | None = None) -> Trade:
+        """Attach the counterparty's receipt to a trade sent for execution in the background."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def book(self, user: str, trade_id: str, confirmation: ExecutionConfirmation, token: CancellationToken,
+                   expected_version: int | None = None) -> Trade:
         """Book a trade once executed by counterparty."""
         raise NotImplementedError
+
+    @abstractmethod
+    async def create_many(self, user: str, items: list[TradeDetails], token: CancellationToken) -> list[BatchItemResult]:
+        """Create many trades in DRAFT state with a single save."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def submit_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        """Submit many trades for approval with a single save."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def approve_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        """Approve many trades with a single save."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def cancel_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        """Cancel many trades with a single save."""
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 from trading_approval_process.core.cancellation_token import CancellationToken
@@ -11,3 +12,7 @@ class ITradeExecutor(ABC):
     async def send(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
         """Send a trade for external execution."""
         pass
+
+    async def send_many(self, trades: list[Trade], token: CancellationToken) -> list[ExecutionReceipt]:
+        """Send several trades, receipts in the same order; batch-capable executors override this."""
+        return list(await asyncio.gather(*(self.send(trade, token) for trade in trades)))
@@ -1,21 +1,52 @@
+import uuid
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
 
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_changelog import TradeChangelog
 from trading_approval_process.domain.models.trade_diff import TradeDiff
 from trading_approval_process.domain.models.trade_history import TradeHistory
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
 
 
 class ITradeHistoryService(ABC):
 
 
+    @abstractmethod
+    async def get_trade(self, trade_id: str, token: CancellationToken) -> Trade:
+        """Return the current state of a trade."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_history(self, trade_id: str, token: CancellationToken) -> TradeHistory:
         """Return the complete audit trail of a trade."""
         raise NotImplementedError
 
+    @abstractmethod
+    def stream_history(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        """Stream the audit trail of a trade without materialising it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_history(self, start: datetime | None, end: datetime | None,
+                       token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        """Stream the audit records of all trades timestamped in [start, end)."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_differences(self, trade_id: str, version_a: int, version_b: int, token: CancellationToken) -> TradeDiff:
         """Show field-level differences between two versions of trade details."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_changelog(self, trade_id: str, token: CancellationToken) -> TradeChangelog:
+        """Show field-level differences between every pair of consecutive versions."""
+        raise NotImplementedError
 
+    @abstractmethod
+    async def query_trades(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        """List trades matching the query, one keyset page at a time."""
+        raise NotImplementedError
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from trading_approval_process.domain.models.trade import Trade
+
+
+class ITradeListener(ABC):
+    """Observer of committed trade saves, used to maintain derived views."""
+
+    @abstractmethod
+    def on_saved(self, trades: list[Trade]) -> None:
+        """Called right after the trades were persisted; must not block or await."""
+        pass
@@ -1,12 +1,21 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.audit_record import AuditRecord
 from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
 
 
 class ITradeRepository(ABC):
-    """Abstract interface for trade persistence."""
+    """
+    Abstract interface for trade persistence.
+
+    A save either commits and returns, or raises having stored nothing: in particular the
+    token is checked before any write, never after one.
+    """
 
     @abstractmethod
     async def add(self, trade: Trade, token: CancellationToken) -> Trade:
@@ -23,4 +32,37 @@ class ITradeRepository(ABC):
         """Retrieve a trade by its unique identifier."""
         pass
 
+    @abstractmethod
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        """Persist several new trades in a single transaction; none is stored if any id exists."""
+        pass
+
+    @abstractmethod
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        """Persist several updated trades in a single transaction; none is stored on a version conflict."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        """Retrieve several trades in one round trip; missing ids yield None at their position."""
+        pass
+
+    @abstractmethod
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        """List trades matching the query's filters in creation order, one keyset page at a time."""
+        pass
 
+    @abstractmethod
+    def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        """Yield a trade's audit records in step order, a bounded batch at a time."""
+        pass
+
+    @abstractmethod
+    def export_audit(self, start: datetime | None, end: datetime | None,
+                     token: CancellationToken) -> AsyncIterator[tuple[UUID, AuditRecord]]:
+        """
+        Yield every audit record timestamped in [start, end) with its trade id.
+
+        Each trade's records come in step order; how trades interleave is up to the store.
+        """
+        pass
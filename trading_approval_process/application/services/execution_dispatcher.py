@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from trading_approval_process.application.interfaces.i_trade_approval_service import ITradeApprovalService
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.application.views.execution_outbox import ExecutionOutbox, OutboxEntry
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.retry_policy import RetryPolicy
+from trading_approval_process.domain.exceptions import (
+    InvalidTransitionException, NotFoundException, PreconditionFailedException)
+
+DEFAULT_DISPATCH_RETRY_POLICY = RetryPolicy(attempts=5, base_delay=0.05, max_delay=2.0, retry_on=(Exception,))
+
+
+@dataclass(frozen=True)
+class DispatchStats:
+    depth: int         # intents queued or being sent
+    in_flight: int
+    dispatched: int    # receipts recorded
+    superseded: int    # intents dropped because the trade moved on (e.g. cancelled) or is gone
+    failures: int      # intents sent back to the outbox after exhausting their retries
+    latency_avg_ms: float
+    latency_max_ms: float
+
+
+class ExecutionDispatcher:
+    """
+    Drains the ExecutionOutbox: sends each intent to the executor and records its receipt.
+
+    - `concurrency` workers bound the number of sends in flight.
+    - A failing send is retried per the retry policy; an intent that still fails goes back
+      to the outbox after `requeue_delay` seconds. An intent whose trade is gone, or can no
+      longer take a receipt, is dropped: retrying it could never succeed.
+    - Exactly once against the repository: the receipt is recorded with the intent's version
+      as the expected version, so it lands once, on the version that asked for it. An intent
+      superseded before it was sent (e.g. the trade was cancelled) is dropped unsent.
+    - A crash between sending and recording re-sends the intent on restart, so executors
+      should treat the trade id and version as an idempotency key.
+    """
+
+    def __init__(self, outbox: ExecutionOutbox, executor: ITradeExecutor, service: ITradeApprovalService,
+                 repository: ITradeRepository, concurrency: int = 8,
+                 retry_policy: RetryPolicy = DEFAULT_DISPATCH_RETRY_POLICY, requeue_delay: float = 5.0) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        self._outbox = outbox
+        self._executor = executor
+        self._service = service
+        self._repository = repository
+        self._concurrency = concurrency
+        self._retry_policy = retry_policy
+        self._requeue_delay = requeue_delay
+        self._workers: list[asyncio.Task] = []
+        self._in_flight = 0
+        self._dispatched = 0
+        self._superseded = 0
+        self._failures = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    # ---------------------------
+    # Lifecycle
+    # ---------------------------
+    async def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self._concurrency)]
+
+    async def stop(self) -> None:
+        """Stop the workers; intents they were sending stay pending and are re-sent after a restart."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def stats(self) -> DispatchStats:
+        return DispatchStats(
+            depth=len(self._outbox),
+            in_flight=self._in_flight,
+            dispatched=self._dispatched,
+            superseded=self._superseded,
+            failures=self._failures,
+            latency_avg_ms=self._latency_total / self._dispatched * 1e3 if self._dispatched else 0.0,
+            latency_max_ms=self._latency_max * 1e3,
+        )
+
+    # ---------------------------
+    # Workers
+    # ---------------------------
+    async def _work(self) -> None:
+        while True:
+            entry = await self._outbox.get()
+            self._in_flight += 1
+            try:
+                await self._dispatch(entry)
+            except (NotFoundException, InvalidTransitionException) as ex:
+                logging.warning("ExecutionDispatcher: dropping trade %s v%d: %s", entry.trade_id, entry.version, ex)
+                self._superseded += 1
+                self._outbox.done(entry)
+            except Exception:
+                logging.exception("ExecutionDispatcher: sending trade %s v%d failed, retrying later.",
+                                  entry.trade_id, entry.version)
+                self._failures += 1
+                self._outbox.retry_later(entry, self._requeue_delay)
+            finally:
+                self._in_flight -= 1
+
+    async def _dispatch(self, entry: OutboxEntry) -> None:
+        token = CancellationToken()
+        trade = await self._repository.get_by_id(entry.trade_id, token)
+        if trade.version != entry.version or not ExecutionOutbox.is_due(trade):
+            self._superseded += 1
+            self._outbox.done(entry)
+            return
+
+        receipt = await self._retry_policy.run(lambda: self._executor.send(trade, token), token)
+        try:
+            # The approver sent the trade; the receipt is recorded on their behalf.
+            await self._service.record_receipt(trade.approver, trade.trade_id, receipt, token,
+                                               expected_version=entry.version)
+        except PreconditionFailedException:
+            logging.warning("ExecutionDispatcher: trade %s changed while it was sent; receipt %s not recorded.",
+                            entry.trade_id, receipt.ticket_id)
+            self._superseded += 1
+        else:
+            latency = time.monotonic() - entry.enqueued_at
+            self._dispatched += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+        self._outbox.done(entry)
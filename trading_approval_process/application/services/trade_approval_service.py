@@ -1,7 +1,16 @@
+import uuid
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable, TypeVar
+
 from trading_approval_process.application.commands.approve_command import ApproveCommand
+from trading_approval_process.application.commands.batch_approve_command import BatchApproveCommand
+from trading_approval_process.application.commands.batch_cancel_command import BatchCancelCommand
+from trading_approval_process.application.commands.batch_create_command import BatchCreateCommand
+from trading_approval_process.application.commands.batch_submit_command import BatchSubmitCommand
 from trading_approval_process.application.commands.book_command import BookCommand
 from trading_approval_process.application.commands.cancel_command import CancelCommand
 from trading_approval_process.application.commands.create_command import CreateCommand
+from trading_approval_process.application.commands.record_receipt_command import RecordReceiptCommand
 from trading_approval_process.application.commands.send_to_execute_command import SendToExecuteCommand
 from trading_approval_process.application.commands.submit_command import SubmitCommand
 from trading_approval_process.application.commands.update_command import UpdateCommand
@@ -9,41 +18,118 @@ from trading_approval_process.application.interfaces.i_time_provider import ITim
 from trading_approval_process.application.interfaces.i_trade_approval_service import ITradeApprovalService
 from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.batch_item_result import BatchItemResult
 from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
 from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.keyed_lock import KeyedLock
+from trading_approval_process.core.retry_policy import RetryPolicy
 from trading_approval_process.domain.models.trade import Trade
 from trading_approval_process.domain.models.trade_details import TradeDetails
 
+T = TypeVar("T")
+
+DEFAULT_RETRY_POLICY = RetryPolicy(retry_on=(ConcurrencyException,))
+
 
 class TradeApprovalService(ITradeApprovalService):
-    """Trade approval service for workflow."""
+    """
+    Trade approval service for workflow.
 
-    def __init__( self, executor: ITradeExecutor, repository: ITradeRepository, time: ITimeProvider) -> None:
+    Commands on the same trade are serialised through a per-trade lock, and a command that
+    still loses an optimistic concurrency check (e.g. against another process) is re-run
+    from a fresh load according to the retry policy.
+
+    With `deferred_execution`, `send_to_execute` only records the intent (the trade moves to
+    SENT_TO_COUNTERPARTY without a receipt) and returns; ExecutionDispatcher sends it in the
+    background and attaches the receipt through `record_receipt`.
+    """
+
+    def __init__( self, executor: ITradeExecutor, repository: ITradeRepository, time: ITimeProvider,
+                  retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY, locks: KeyedLock | None = None,
+                  deferred_execution: bool = False) -> None:
         self._executor = executor
         self._repository = repository
         self._time = time
+        self._retry_policy = retry_policy
+        self._locks = locks or KeyedLock()
+        self._deferred_execution = deferred_execution
 
     async def create(self, user: str, details: TradeDetails, token: CancellationToken) -> Trade:
         return await CreateCommand(self._repository, self._time).run(user, details, token)
 
-    async def submit(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
-        return await SubmitCommand(self._repository, self._time).run(user, trade_id, token)
+    async def submit(self, user: str, trade_id: str, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: SubmitCommand(self._repository, self._time).run(user, trade_id, token, expected_version))
+
+    async def approve(self, user: str, trade_id: str, token: CancellationToken,
+                      expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: ApproveCommand(self._repository, self._time).run(user, trade_id, token, expected_version))
 
-    async def approve(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
-        return await ApproveCommand(self._repository, self._time).run(user, trade_id, token)
+    async def update(self, user: str, trade_id: str, details: TradeDetails, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: UpdateCommand(self._repository, self._time).run(user, trade_id, details, token, expected_version))
 
-    async def update(self, user: str, trade_id: str, details: TradeDetails, token: CancellationToken) -> Trade:
-        return await UpdateCommand(self._repository, self._time).run(user, trade_id, details, token)
+    async def cancel(self, user: str, trade_id: str, token: CancellationToken,
+                     expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: CancelCommand(self._repository, self._time).run(user, trade_id, token, expected_version))
 
-    async def cancel(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
-        return await CancelCommand(self._repository, self._time).run(user, trade_id, token)
+    async def send_to_execute(self, user: str, trade_id: str, token: CancellationToken,
+                              expected_version: int | None = None) -> Trade:
+        if self._deferred_execution:
+            return await self._run_exclusive(trade_id, token,
+                lambda: SendToExecuteCommand(None, self._repository, self._time).run(user, trade_id, token, expected_version))
+        # Not retried: the trade has already been sent to the counterparty when the save fails.
+        return await self._run_exclusive(trade_id, token,
+            lambda: SendToExecuteCommand(self._executor, self._repository, self._time).run(user, trade_id, token, expected_version),
+            retry=False)
 
-    async def send_to_execute(self, user: str, trade_id: str, token: CancellationToken) -> Trade:
-        return await SendToExecuteCommand(self._executor, self._repository, self._time).run(user, trade_id, token)
+    async def record_receipt(self, user: str, trade_id: str, receipt: ExecutionReceipt, token: CancellationToken,
+                             expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: RecordReceiptCommand(self._repository, self._time).run(user, trade_id, receipt, token, expected_version))
 
     async def book(self, user: str, trade_id: str, confirmation: ExecutionConfirmation,
-                   token: CancellationToken) -> Trade:
-        return await BookCommand(self._repository, self._time).run(user, trade_id, confirmation, token)
+                   token: CancellationToken, expected_version: int | None = None) -> Trade:
+        return await self._run_exclusive(trade_id, token,
+            lambda: BookCommand(self._repository, self._time).run(user, trade_id, confirmation, token, expected_version))
+
+    async def create_many(self, user: str, items: list[TradeDetails], token: CancellationToken) -> list[BatchItemResult]:
+        return await BatchCreateCommand(self._repository, self._time).run(user, items, token)
+
+    async def submit_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        return await self._run_exclusive_many(trade_ids, token,
+            lambda: BatchSubmitCommand(self._repository, self._time).run(user, trade_ids, token))
+
+    async def approve_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        return await self._run_exclusive_many(trade_ids, token,
+            lambda: BatchApproveCommand(self._repository, self._time).run(user, trade_ids, token))
+
+    async def cancel_many(self, user: str, trade_ids: list[uuid.UUID], token: CancellationToken) -> list[BatchItemResult]:
+        return await self._run_exclusive_many(trade_ids, token,
+            lambda: BatchCancelCommand(self._repository, self._time).run(user, trade_ids, token))
+
+    async def _run_exclusive(self, trade_id: str, token: CancellationToken,
+                             command: Callable[[], Awaitable[T]], retry: bool = True) -> T:
+        """Run a load → validate → change → save command while holding the trade's lock."""
+        async with self._locks.acquire(str(trade_id)):
+            if retry:
+                return await self._retry_policy.run(command, token)
+            return await command()
+
+    async def _run_exclusive_many(self, trade_ids: list[uuid.UUID], token: CancellationToken,
+                                  command: Callable[[], Awaitable[T]]) -> T:
+        """Run a batch command while holding the locks of all its trades."""
+        async with AsyncExitStack() as stack:
+            # A global acquisition order keeps overlapping batches from deadlocking.
+            for key in sorted({str(trade_id) for trade_id in trade_ids}):
+                await stack.enter_async_context(self._locks.acquire(key))
+            return await self._retry_policy.run(command, token)
 
 
 
@@ -1,20 +1,65 @@
+import uuid
+from datetime import datetime
+from typing import AsyncIterator
+
+from trading_approval_process.application.commands.changelog_command import ChangelogCommand
 from trading_approval_process.application.commands.differences_command import DifferencesCommand
+from trading_approval_process.application.commands.export_history_command import ExportHistoryCommand
+from trading_approval_process.application.commands.get_trade_command import GetTradeCommand
 from trading_approval_process.application.commands.history_command import HistoryCommand
-from trading_approval_process.application.interfaces import ITradeRepository, ITimeProvider
+from trading_approval_process.application.commands.query_command import QueryCommand
+from trading_approval_process.application.commands.stream_history_command import StreamHistoryCommand
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.application.interfaces.i_trade_historyl_service import ITradeHistoryService
 from trading_approval_process.core.cancellation_token import CancellationToken
-from trading_approval_process.domain import TradeHistory, TradeDiff
+from trading_approval_process.core.lru_cache import LruCache
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_changelog import TradeChangelog
+from trading_approval_process.domain.models.trade_diff import TradeDiff
+from trading_approval_process.domain.models.trade_history import TradeHistory
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
 
 
 class TradeHistoryService(ITradeHistoryService):
-    """History service for trade details."""
+    """
+    History service for trade details.
+
+    Differences between two versions are cached: a version's details never change once it
+    is recorded, so a cached diff can only be evicted, never go stale.
+    """
 
-    def __init__( self, repository: ITradeRepository, time: ITimeProvider) -> None:
+    def __init__( self, repository: ITradeRepository, time: ITimeProvider,
+                  differences_cache: LruCache[TradeDiff] | None = None) -> None:
         self._repository = repository
         self._time = time
+        self.differences_cache: LruCache[TradeDiff] = differences_cache or LruCache(maxsize=4096)
+
+    async def get_trade(self, trade_id: str, token: CancellationToken) -> Trade:
+        return await GetTradeCommand(self._repository).run(trade_id, token)
 
     async def get_history(self, trade_id: str, token: CancellationToken) -> TradeHistory:
         return await HistoryCommand(self._repository).run(trade_id, token)
 
+    def stream_history(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        return StreamHistoryCommand(self._repository).run(trade_id, token)
+
+    def export_history(self, start: datetime | None, end: datetime | None,
+                       token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        return ExportHistoryCommand(self._repository).run(start, end, token)
+
     async def get_differences(self, trade_id: str, version_a: int, version_b: int, token: CancellationToken) -> TradeDiff:
-        return await DifferencesCommand(self._repository).run(trade_id, version_a, version_b, token)
+        key = (str(trade_id), version_a, version_b)
+        diff = self.differences_cache.get(key)
+        if diff is None:
+            # Unknown versions raise NotFoundException and are not cached.
+            diff = await DifferencesCommand(self._repository).run(trade_id, version_a, version_b, token)
+            self.differences_cache.put(key, diff)
+        return diff
+
+    async def get_changelog(self, trade_id: str, token: CancellationToken) -> TradeChangelog:
+        return await ChangelogCommand(self._repository).run(trade_id, token)
+
+    async def query_trades(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        return await QueryCommand(self._repository).run(query, token)
@@ -0,0 +1,146 @@
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.inbox_item import InboxItem, InboxPage
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+
+WAITING_STATES = (TradeState.PENDING_APPROVAL, TradeState.NEEDS_REAPPROVAL)
+
+
+class ApprovalInbox(ITradeListener):
+    """
+    Materialized view of the trades waiting for each user's approval.
+
+    - PENDING_APPROVAL trades wait for any user but their requester; NEEDS_REAPPROVAL
+      trades wait for their requester only (see StateTransitions).
+    - Maintained from the state transitions of committed saves, as a listener of
+      ObservedTradeRepository, so it never drifts from the store. `rebuild` recomputes it
+      from the repository, e.g. on startup.
+    - An entry gets a sequence number when the trade starts waiting. A page merges the
+      shared pending list with the user's own reapproval list from the cursor, so it costs
+      O(log n + page size), plus the user's own pending requests it has to skip.
+    - Memory follows the waiting trades, not the store: only the last `departed_capacity`
+      trades that stopped waiting keep their version, so that a late notification of an
+      earlier, waiting version cannot bring them back.
+    """
+
+    def __init__(self, departed_capacity: int = 10_000) -> None:
+        self._departed_capacity = departed_capacity
+        self._clear()
+
+    def _clear(self) -> None:
+        self._next_seq = 1
+        self._departed: OrderedDict[str, int] = OrderedDict()
+        self._entries: dict[str, int] = {}
+        self._items: dict[int, InboxItem] = {}
+        self._pending: list[int] = []
+        self._reapproval: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def on_saved(self, trades: list[Trade]) -> None:
+        for trade in trades:
+            self._apply(trade)
+
+    async def rebuild(self, repository: ITradeRepository, token: CancellationToken) -> None:
+        """Recompute the inbox from the waiting trades in the repository."""
+        waiting: list[Trade] = []
+        for state in WAITING_STATES:
+            cursor = None
+            while True:
+                page = await repository.query(TradeQuery(state=state, limit=500, after=cursor), token)
+                waiting.extend(page.items)
+                if page.next_cursor is None:
+                    break
+                cursor = page.next_cursor
+
+        self._clear()
+        # The audit log tells when each trade started waiting; replay entries in that order.
+        for trade in sorted(waiting, key=lambda trade: trade.audit[-1].timestamp):
+            self._apply(trade)
+
+    def _apply(self, trade: Trade) -> None:
+        key = str(trade.trade_id)
+        seq = self._entries.get(key)
+        known = self._items[seq].version if seq is not None else self._departed.get(key, 0)
+        if trade.version <= known:
+            return  # a notification overtaken by a later save of the same trade
+
+        if seq is not None:
+            current = self._items[seq]
+            if current.state == trade.state and current.requester == trade.requester:
+                self._items[seq] = self._item(trade)
+                return
+            self._remove(key, seq)
+        if trade.state in WAITING_STATES:
+            self._departed.pop(key, None)
+            self._insert(key, self._item(trade))
+        elif seq is not None or key in self._departed:
+            self._departed[key] = trade.version
+            self._departed.move_to_end(key)
+            if len(self._departed) > self._departed_capacity:
+                self._departed.popitem(last=False)
+
+    def _insert(self, key: str, item: InboxItem) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._entries[key], self._items[seq] = seq, item
+        if item.state is TradeState.PENDING_APPROVAL:
+            self._pending.append(seq)
+        else:
+            self._reapproval.setdefault(item.requester, []).append(seq)
+
+    def _remove(self, key: str, seq: int) -> None:
+        item = self._items.pop(seq)
+        del self._entries[key]
+        if item.state is TradeState.PENDING_APPROVAL:
+            entries = self._pending
+        else:
+            entries = self._reapproval[item.requester]
+        del entries[bisect_left(entries, seq)]
+        if not entries and item.state is TradeState.NEEDS_REAPPROVAL:
+            del self._reapproval[item.requester]
+
+    @staticmethod
+    def _item(trade: Trade) -> InboxItem:
+        return InboxItem(
+            trade_id=trade.trade_id,
+            state=trade.state,
+            requester=trade.requester,
+            version=trade.version,
+            details=trade.details,
+            waiting_since=trade.audit[-1].timestamp,
+        )
+
+    # ---------------------------
+    # Reads
+    # ---------------------------
+    def page(self, user: str, limit: int = 50, after: int | None = None) -> InboxPage:
+        """The next `limit` trades waiting for `user`, oldest first."""
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        pending, reapproval = self._pending, self._reapproval.get(user, [])
+        i = bisect_right(pending, after) if after is not None else 0
+        j = bisect_right(reapproval, after) if after is not None else 0
+
+        matched: list[int] = []
+        while len(matched) <= limit and (i < len(pending) or j < len(reapproval)):
+            if j >= len(reapproval) or (i < len(pending) and pending[i] < reapproval[j]):
+                seq, i = pending[i], i + 1
+                if self._items[seq].requester == user:
+                    continue  # requesters never approve their own submissions
+            else:
+                seq, j = reapproval[j], j + 1
+            matched.append(seq)
+
+        next_cursor = matched[limit - 1] if len(matched) > limit else None
+        return InboxPage([self._items[seq] for seq in matched[:limit]], next_cursor)
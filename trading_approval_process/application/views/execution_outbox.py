@@ -0,0 +1,87 @@
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxEntry:
+    """A trade version waiting to be sent to the counterparty."""
+    trade_id: uuid.UUID
+    version: int
+    enqueued_at: float  # time.monotonic() when the intent was seen
+
+
+class ExecutionOutbox(ITradeListener):
+    """
+    Trades saved as SENT_TO_COUNTERPARTY without a receipt, queued for ExecutionDispatcher.
+
+    - The intent is the trade's own state, written by the same save that moves it, so it is
+      durable exactly when the transition is; there is no separate outbox record to keep in step.
+    - Maintained from committed saves as a listener of ObservedTradeRepository; `rebuild`
+      queues the intents found in the repository, e.g. the ones left behind by a restart.
+    - An intent (trade id and version) is queued once until it is marked `done`.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[OutboxEntry] = asyncio.Queue()
+        self._pending: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @staticmethod
+    def is_due(trade: Trade) -> bool:
+        return trade.state is TradeState.SENT_TO_COUNTERPARTY and trade.execution_receipt is None
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def on_saved(self, trades: list[Trade]) -> None:
+        for trade in trades:
+            if self.is_due(trade):
+                self._enqueue(trade)
+
+    async def rebuild(self, repository: ITradeRepository, token: CancellationToken) -> None:
+        """Queue every intent in the repository that is not queued yet."""
+        cursor = None
+        while True:
+            page = await repository.query(
+                TradeQuery(state=TradeState.SENT_TO_COUNTERPARTY, limit=500, after=cursor), token)
+            for trade in page.items:
+                if self.is_due(trade):
+                    self._enqueue(trade)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    def _enqueue(self, trade: Trade) -> None:
+        key = str(trade.trade_id)
+        if self._pending.get(key) == trade.version:
+            return
+        self._pending[key] = trade.version
+        self._queue.put_nowait(OutboxEntry(trade.trade_id, trade.version, time.monotonic()))
+
+    # ---------------------------
+    # Draining
+    # ---------------------------
+    async def get(self) -> OutboxEntry:
+        """The next queued intent, waiting for one if the outbox is empty."""
+        return await self._queue.get()
+
+    def done(self, entry: OutboxEntry) -> None:
+        """Forget an intent that was dispatched or superseded."""
+        key = str(entry.trade_id)
+        if self._pending.get(key) == entry.version:
+            del self._pending[key]
+
+    def retry_later(self, entry: OutboxEntry, delay: float) -> None:
+        """Queue a failed intent again after `delay` seconds."""
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, entry)
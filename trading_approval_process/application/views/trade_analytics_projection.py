@@ -0,0 +1,281 @@
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_analytics import (
+    GROUP_FIELDS, AnalyticsFilter, ApprovalTurnaround, CounterpartyCancellations, NotionalGroup)
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.domain.models.trade_style import TradeStyle
+
+REBUILD_PAGE_SIZE = 1000
+
+# Group keys are packed into one integer per row; up to this many distinct packed keys the
+# groups are counted with bincount (linear), beyond it with a sort (np.unique).
+_DENSE_GROUPS = 1 << 22
+
+
+class _Codes:
+    """Dictionary encoding of a string column: each distinct value gets a small integer code."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self) -> None:
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def find(self, value: str) -> int:
+        """The code of a value, or -2 (matching no row) when no trade has it."""
+        return self._codes.get(value, -2)
+
+
+class TradeAnalyticsProjection(ITradeListener):
+    """
+    Columnar projection of trade headers and details for aggregate queries.
+
+    - One row per trade, one NumPy array per field; strings are dictionary-encoded, states
+      and enums stored as their values, dates as datetime64. Arrays grow by doubling.
+    - Maintained from committed saves as a listener of ObservedTradeRepository, a batch of
+      trades at a time, so bulk saves and `rebuild` assign whole columns at once.
+    - Queries filter with boolean masks and aggregate with bincount, so they cost a few
+      passes over contiguous arrays instead of a walk over Trade objects.
+    """
+
+    _COLUMNS = {
+        "state": np.int8, "direction": np.int8, "style": np.int8, "version": np.int32,
+        "currency": np.int32, "counterparty": np.int32, "trading_entity": np.int32, "approver": np.int32,
+        "notional": np.float64,
+        "trade_date": "datetime64[D]", "value_date": "datetime64[D]",
+        "waiting_since": "datetime64[us]", "approved_at": "datetime64[us]",
+    }
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._capacity = max(capacity, 1)
+        self._clear()
+
+    def _clear(self) -> None:
+        self._rows: dict[uuid.UUID, int] = {}
+        self._columns = {name: np.zeros(self._capacity, dtype) for name, dtype in self._COLUMNS.items()}
+        self._codes = {name: _Codes() for name in ("currency", "counterparty", "trading_entity", "approver")}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def on_saved(self, trades: list[Trade]) -> None:
+        self._apply(trades)
+
+    async def rebuild(self, repository: ITradeRepository, token: CancellationToken) -> None:
+        """Recompute the projection from every trade in the repository."""
+        self._clear()
+        cursor = None
+        while True:
+            page = await repository.query(TradeQuery(limit=REBUILD_PAGE_SIZE, after=cursor), token)
+            self._apply(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    def _apply(self, trades: list[Trade]) -> None:
+        latest: dict[int, Trade] = {}
+        version = self._columns["version"]
+        for trade in trades:
+            if trade.details is None:
+                continue
+            row = self._rows.get(trade.trade_id)
+            if row is None:
+                row = self._rows[trade.trade_id] = len(self._rows)
+                self._reserve(row + 1)
+            elif trade.version <= version[row] or trade.version <= getattr(latest.get(row), "version", 0):
+                continue  # a notification overtaken by a later save of the same trade
+            latest[row] = trade
+        if not latest:
+            return
+
+        rows = np.fromiter(latest.keys(), np.int64, len(latest))
+        trades = list(latest.values())
+        codes, columns = self._codes, self._columns
+        columns["state"][rows] = [trade.state.value for trade in trades]
+        columns["version"][rows] = [trade.version for trade in trades]
+        columns["direction"][rows] = [trade.details.direction.value for trade in trades]
+        columns["style"][rows] = [trade.details.style.value for trade in trades]
+        columns["notional"][rows] = [trade.details.notional_amount for trade in trades]
+        columns["currency"][rows] = [codes["currency"].encode(trade.details.notional_currency) for trade in trades]
+        columns["counterparty"][rows] = [codes["counterparty"].encode(trade.details.counterparty) for trade in trades]
+        columns["trading_entity"][rows] = [codes["trading_entity"].encode(trade.details.trading_entity)
+                                           for trade in trades]
+        columns["approver"][rows] = [codes["approver"].encode(trade.approver) for trade in trades]
+        columns["trade_date"][rows] = _days([trade.details.trade_date for trade in trades])
+        columns["value_date"][rows] = _days([trade.details.value_date for trade in trades])
+        approvals = [self._last_approval(trade) for trade in trades]
+        columns["waiting_since"][rows] = [None if approval is None else approval[0] for approval in approvals]
+        columns["approved_at"][rows] = [None if approval is None else approval[1] for approval in approvals]
+
+    @staticmethod
+    def _last_approval(trade: Trade) -> tuple[datetime, datetime] | None:
+        """When the trade last started waiting for approval and when that approval came, if it has been approved."""
+        audit = trade.audit
+        for index in range(len(audit) - 1, 0, -1):
+            record = audit[index]
+            if record.action is TradeAction.APPROVE:
+                return _instant(audit[index - 1].timestamp), _instant(record.timestamp)
+        return None
+
+    def _reserve(self, size: int) -> None:
+        if size <= self._capacity:
+            return
+        while self._capacity < size:
+            self._capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(self._capacity, column.dtype)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+
+    # ---------------------------
+    # Queries
+    # ---------------------------
+    def notional(self, group_by: tuple[str, ...], where: AnalyticsFilter = AnalyticsFilter()) -> list[NotionalGroup]:
+        """Trade count and total notional per group of `group_by` fields, largest notional first."""
+        unknown = [name for name in group_by if name not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(f"Cannot group by {', '.join(unknown)}; choose from {', '.join(GROUP_FIELDS)}")
+        mask = self._mask(where)
+        notional = self._column("notional")[mask]
+        if not group_by:
+            return [NotionalGroup({}, int(notional.size), float(notional.sum()))] if notional.size else []
+
+        keys, counts, sums = self._group([self._column(name)[mask] for name in group_by],
+                                         notional)
+        groups = [NotionalGroup({name: self._decode(name, value) for name, value in zip(group_by, key)},
+                                int(count), float(total))
+                  for key, count, total in zip(keys, counts, sums)]
+        groups.sort(key=lambda group: -group.notional)
+        return groups
+
+    def approval_turnaround(self, where: AnalyticsFilter = AnalyticsFilter()) -> list[ApprovalTurnaround]:
+        """Approval turnaround per approver, over the last approval of every approved trade, slowest first."""
+        mask = self._mask(where) & ~np.isnat(self._column("approved_at"))
+        seconds = (self._column("approved_at")[mask] - self._column("waiting_since")[mask]) / np.timedelta64(1, "s")
+        approvers = self._column("approver")[mask]
+        if not approvers.size:
+            return []
+        size = len(self._codes["approver"].values)
+        counts = np.bincount(approvers, minlength=size)
+        totals = np.bincount(approvers, weights=seconds, minlength=size)
+        maxima = np.zeros(size)
+        np.maximum.at(maxima, approvers, seconds)
+        result = [ApprovalTurnaround(self._codes["approver"].values[code], int(counts[code]),
+                                     float(totals[code] / counts[code]), float(maxima[code]))
+                  for code in np.flatnonzero(counts)]
+        result.sort(key=lambda item: -item.average_seconds)
+        return result
+
+    def cancellations(self, where: AnalyticsFilter = AnalyticsFilter()) -> list[CounterpartyCancellations]:
+        """Trades and cancelled trades per counterparty, most cancellations first."""
+        mask = self._mask(where)
+        counterparties = self._column("counterparty")[mask]
+        size = len(self._codes["counterparty"].values)
+        trades = np.bincount(counterparties, minlength=size)
+        cancelled = np.bincount(counterparties[self._column("state")[mask] == TradeState.CANCELLED.value],
+                                minlength=size)
+        result = [CounterpartyCancellations(self._codes["counterparty"].values[code], int(trades[code]),
+                                            int(cancelled[code]), float(cancelled[code] / trades[code]))
+                  for code in np.flatnonzero(trades)]
+        result.sort(key=lambda item: (-item.cancelled, item.counterparty))
+        return result
+
+    def _column(self, name: str) -> np.ndarray:
+        return self._columns[name][:len(self._rows)]
+
+    def _mask(self, where: AnalyticsFilter) -> np.ndarray:
+        mask = np.ones(len(self._rows), bool)
+        if where.states:
+            mask &= np.isin(self._column("state"), [state.value for state in where.states])
+        if where.currency is not None:
+            mask &= self._column("currency") == self._codes["currency"].find(where.currency)
+        if where.counterparty is not None:
+            mask &= self._column("counterparty") == self._codes["counterparty"].find(where.counterparty)
+        if where.trade_date_from is not None:
+            mask &= self._column("trade_date") >= np.datetime64(where.trade_date_from, "D")
+        if where.trade_date_to is not None:
+            mask &= self._column("trade_date") <= np.datetime64(where.trade_date_to, "D")
+        return mask
+
+    @staticmethod
+    def _group(columns: list[np.ndarray], weights: np.ndarray) -> tuple[list[tuple[int, ...]], np.ndarray, np.ndarray]:
+        """Distinct key tuples of the columns, with the row count and weight sum of each."""
+        if not weights.size:
+            return [], np.zeros(0, np.int64), np.zeros(0)
+        values = [column.view(np.int64) if column.dtype.kind == "M" else column.astype(np.int64) for column in columns]
+        lows = [int(column.min()) for column in values]
+        radices = [int(column.max()) - low + 1 for column, low in zip(values, lows)]
+        span = int(np.prod(radices, dtype=object))
+        if span >= 1 << 62:  # too wide to pack: sort the key tuples instead
+            keys, inverse, counts = np.unique(np.stack(values, axis=1), axis=0, return_inverse=True, return_counts=True)
+            sums = np.bincount(inverse.ravel(), weights=weights, minlength=len(keys))
+            return [tuple(key) for key in keys.tolist()], counts, sums
+
+        packed = np.zeros(weights.size, np.int64)
+        for column, low, radix in zip(values, lows, radices):
+            packed = packed * radix + (column - low)
+        if span <= _DENSE_GROUPS:
+            counts = np.bincount(packed, minlength=span)
+            keys = np.flatnonzero(counts)
+            sums = np.bincount(packed, weights=weights, minlength=span)[keys]
+            counts = counts[keys]
+        else:
+            keys, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+            sums = np.bincount(inverse, weights=weights, minlength=keys.size)
+
+        unpacked = []
+        for key in keys.tolist():
+            parts = []
+            for low, radix in zip(reversed(lows), reversed(radices)):
+                key, part = divmod(key, radix)
+                parts.append(part + low)
+            unpacked.append(tuple(reversed(parts)))
+        return unpacked, counts, sums
+
+    def _decode(self, name: str, value: int) -> object:
+        if name == "state":
+            return TradeState(value)
+        if name == "direction":
+            return TradeDirection(value)
+        if name == "style":
+            return TradeStyle(value)
+        if name in ("trade_date", "value_date"):
+            return date.fromordinal(_EPOCH_ORDINAL + value)
+        codes = self._codes[name]
+        return codes.values[value] if value >= 0 else None
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _instant(timestamp: datetime) -> datetime:
+    # datetime64 is naive: aware timestamps are stored as UTC, naive ones are taken as UTC already.
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.replace(tzinfo=None) - timestamp.utcoffset()
+    return timestamp
+
+
+def _days(dates: list[date]) -> np.ndarray:
+    return (np.fromiter(map(date.toordinal, dates), np.int64, len(dates)) - _EPOCH_ORDINAL).astype("datetime64[D]")
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from trading_approval_process.application.interfaces.i_time_provider import ITimeProvider
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.application.views.approval_inbox import WAITING_STATES
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.log_histogram import LogHistogram
+from trading_approval_process.core.timer_wheel import TimerWheel
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_query import TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+
+TERMINAL_STATES = (TradeState.EXECUTED, TradeState.CANCELLED)
+REBUILD_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class SlaStats:
+    threshold_seconds: float
+    watched: int         # trades waiting for approval, with a timer running
+    breached: int        # trades waiting past the threshold right now
+    breaches_total: int
+
+
+class WorkflowMetrics(ITradeListener):
+    """
+    Time-in-state metrics and approval SLA, derived from the audit timestamps.
+
+    - Every new audit record closes a stay in its `state_before`: the time since the previous
+      record goes into that state's dwell-time histogram and, for an approval, into the
+      approver's latency histogram. Records are counted once per trade, by step.
+    - A trade entering PENDING_APPROVAL or NEEDS_REAPPROVAL gets an SLA timer on a timer
+      wheel, cancelled when it moves on; `check_sla` fires only the timers that came due,
+      so no scan over the waiting trades is needed. The background ticker calls it every
+      wheel tick and logs each breach.
+    - Maintained from committed saves as a listener of ObservedTradeRepository; `rebuild`
+      replays the repository's audit trails, e.g. on startup.
+    - The steps of the last `finished_capacity` executed or cancelled trades are kept, so that
+      a notification delivered again (e.g. by the change feed after a rebuild) is not counted twice.
+    """
+
+    def __init__(self, time: ITimeProvider, sla_seconds: float = 4 * 3600, tick: float = 1.0,
+                 finished_capacity: int = 10_000) -> None:
+        self._time = time
+        self._finished_capacity = finished_capacity
+        self._sla = sla_seconds
+        self._tick = tick
+        self._ticker: asyncio.Task | None = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self.dwell: dict[TradeState, LogHistogram] = {}
+        self.approval_latency: dict[str, LogHistogram] = {}
+        self.transitions: dict[TradeAction, int] = {}
+        self._steps: dict[uuid.UUID, int] = {}
+        self._finished: OrderedDict[uuid.UUID, int] = OrderedDict()
+        self._wheel = TimerWheel(self._tick, now=_epoch(self._time.now()))
+        self._breached: set[uuid.UUID] = set()
+        self._breaches = 0
+
+    # ---------------------------
+    # Maintenance
+    # ---------------------------
+    def on_saved(self, trades: list[Trade]) -> None:
+        for trade in trades:
+            self._apply(trade)
+
+    async def rebuild(self, repository: ITradeRepository, token: CancellationToken) -> None:
+        """Recompute the metrics from the audit trails of every trade in the repository."""
+        self._clear()
+        cursor = None
+        while True:
+            page = await repository.query(TradeQuery(limit=REBUILD_PAGE_SIZE, after=cursor), token)
+            self.on_saved(page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+    def _apply(self, trade: Trade) -> None:
+        seen = self._steps.get(trade.trade_id) or self._finished.get(trade.trade_id, 0)
+        if trade.version <= seen:
+            return  # a notification overtaken by a later save of the same trade
+        audit = trade.audit
+        for index in range(seen, len(audit)):
+            record = audit[index]
+            self.transitions[record.action] = self.transitions.get(record.action, 0) + 1
+            if index == 0:
+                continue
+            stay = (record.timestamp - audit[index - 1].timestamp).total_seconds()
+            self._histogram(self.dwell, record.state_before).record(stay)
+            if record.action is TradeAction.APPROVE:
+                self._histogram(self.approval_latency, record.user_id).record(stay)
+
+        if trade.state in TERMINAL_STATES:
+            self._steps.pop(trade.trade_id, None)  # no further records to wait for
+            self._finished[trade.trade_id] = len(audit)
+            if len(self._finished) > self._finished_capacity:
+                self._finished.popitem(last=False)
+        else:
+            self._steps[trade.trade_id] = len(audit)
+
+        self._breached.discard(trade.trade_id)
+        if trade.state in WAITING_STATES:
+            self._wheel.schedule(trade.trade_id, _epoch(audit[-1].timestamp) + self._sla)
+        else:
+            self._wheel.cancel(trade.trade_id)
+
+    @staticmethod
+    def _histogram(histograms: dict, key) -> LogHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LogHistogram()
+        return histogram
+
+    # ---------------------------
+    # SLA
+    # ---------------------------
+    def check_sla(self) -> list[uuid.UUID]:
+        """Trades that have just exceeded the approval SLA."""
+        breached = self._wheel.advance(_epoch(self._time.now()))
+        for trade_id in breached:
+            logging.warning("WorkflowMetrics: trade %s has waited for approval over %.0fs.", trade_id, self._sla)
+        self._breached.update(breached)
+        self._breaches += len(breached)
+        return breached
+
+    def sla_stats(self) -> SlaStats:
+        return SlaStats(threshold_seconds=self._sla, watched=len(self._wheel), breached=len(self._breached),
+                        breaches_total=self._breaches)
+
+    async def start(self) -> None:
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(self._tick_forever())
+
+    async def stop(self) -> None:
+        if self._ticker is not None:
+            self._ticker.cancel()
+            await asyncio.gather(self._ticker, return_exceptions=True)
+            self._ticker = None
+
+    async def _tick_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._tick)
+            self.check_sla()
+
+
+def _epoch(timestamp: datetime) -> float:
+    # Naive audit timestamps are UTC.
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
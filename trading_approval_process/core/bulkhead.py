@@ -0,0 +1,43 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class BulkheadFullError(Exception):
+    pass
+
+
+class Bulkhead:
+    """
+    Bound on the calls in flight to one dependency.
+
+    A call over the limit is refused at once instead of queueing, so a slow dependency
+    holds at most `limit` coroutines and the callers beyond that get a fast answer.
+    """
+
+    __slots__ = ("_limit", "_in_flight", "_rejected")
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        self._limit = limit
+        self._in_flight = 0
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def rejected(self) -> int:
+        return self._rejected
+
+    @contextmanager
+    def enter(self) -> Iterator[None]:
+        if self._in_flight >= self._limit:
+            self._rejected += 1
+            raise BulkheadFullError(f"{self._in_flight} calls already in flight")
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
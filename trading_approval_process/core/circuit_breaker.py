@@ -0,0 +1,95 @@
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"        # calls go through
+    OPEN = "open"            # calls fail fast until the reset timeout has passed
+    HALF_OPEN = "half_open"  # one probe call decides between closing and opening again
+
+
+@dataclass(frozen=True)
+class CircuitStats:
+    state: str
+    consecutive_failures: int
+    rejected: int
+    opened: int
+    retry_after: float
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    - `failure_threshold` failures in a row open the circuit; while it is open, `allow()`
+      refuses calls for `reset_timeout` seconds.
+    - After that a single probe is let through: its success closes the circuit, its
+      failure opens it for another `reset_timeout`.
+    Not thread-safe: use it from the event loop.
+    """
+
+    __slots__ = ("_failure_threshold", "_reset_timeout", "_clock", "_state", "_failures", "_opened_at",
+                 "_probing", "_rejected", "_opened")
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be positive")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._rejected = 0
+        self._opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and self.retry_after == 0.0:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 when it would now)."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """May a call go through now? A refused call must not be attempted."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._state = CircuitState.HALF_OPEN
+            self._probing = True
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            if self._state is not CircuitState.OPEN:
+                self._opened += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._probing = False
+
+    def record_abandoned(self) -> None:
+        """An allowed call ended without an outcome (e.g. its caller was cancelled)."""
+        self._probing = False
+
+    def stats(self) -> CircuitStats:
+        return CircuitStats(state=self.state.value, consecutive_failures=self._failures, rejected=self._rejected,
+                            opened=self._opened, retry_after=round(self.retry_after, 3))
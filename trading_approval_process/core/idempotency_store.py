@@ -0,0 +1,125 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class IdempotencyKeyReusedError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class IdempotencyStats:
+    executed: int   # operations run
+    replayed: int   # requests answered with a stored outcome
+    joined: int     # requests that waited on a concurrent execution of the same key
+    conflicts: int  # keys reused for a different request
+    size: int
+    maxsize: int
+
+
+class _Entry(Generic[V]):
+    __slots__ = ("fingerprint", "outcome", "expires_at")
+
+    def __init__(self, fingerprint: str, outcome: asyncio.Future, expires_at: float) -> None:
+        self.fingerprint = fingerprint
+        self.outcome = outcome
+        self.expires_at = expires_at
+
+
+class IdempotencyStore(Generic[V]):
+    """
+    Outcomes of operations by idempotency key, kept for `ttl` seconds.
+
+    - Single flight: while an operation runs, requests with the same key wait for it
+      and share its outcome instead of running it again.
+    - Completed outcomes accepted by `keep` are replayed until they expire; the others
+      (and failures) are forgotten, so a retry runs the operation again.
+    - A key presented with a different fingerprint (another request body) is refused.
+    - At most `maxsize` keys are kept; the oldest are dropped first.
+    Not thread-safe: use it from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 24 * 3600,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._entries: OrderedDict[Hashable, _Entry[V]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._executed = 0
+        self._replayed = 0
+        self._joined = 0
+        self._conflicts = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def run(self, key: Hashable, fingerprint: str, operation: Callable[[], Awaitable[V]],
+                  keep: Callable[[V], bool] = lambda outcome: True) -> tuple[V, bool]:
+        """The operation's outcome, and whether it was shared rather than produced by this call."""
+        while True:
+            self._expire()
+            entry = self._entries.get(key)
+            if entry is None:
+                return await self._execute(key, fingerprint, operation, keep), False
+            if entry.fingerprint != fingerprint:
+                self._conflicts += 1
+                raise IdempotencyKeyReusedError(f"Idempotency key '{key}' was already used for a different request.")
+            if entry.outcome.done():
+                self._replayed += 1
+                return entry.outcome.result(), True
+            self._joined += 1
+            try:
+                return await asyncio.shield(entry.outcome), True
+            except asyncio.CancelledError:
+                if not entry.outcome.cancelled():
+                    raise
+                # The execution was abandoned (its request went away): run it on this request instead.
+
+    async def _execute(self, key: Hashable, fingerprint: str, operation: Callable[[], Awaitable[V]],
+                       keep: Callable[[V], bool]) -> V:
+        entry = _Entry(fingerprint, asyncio.get_running_loop().create_future(), self._clock() + self._ttl)
+        self._entries[key] = entry
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        self._executed += 1
+        try:
+            outcome = await operation()
+        except BaseException as ex:
+            self._forget(key, entry)
+            if isinstance(ex, Exception):
+                entry.outcome.set_exception(ex)
+                entry.outcome.exception()  # retrieved: waiters, if any, re-raise it
+            else:
+                entry.outcome.cancel()
+            raise
+        entry.outcome.set_result(outcome)
+        if not keep(outcome):
+            self._forget(key, entry)
+        return outcome
+
+    def _forget(self, key: Hashable, entry: _Entry[V]) -> None:
+        if self._entries.get(key) is entry:
+            del self._entries[key]
+
+    def _expire(self) -> None:
+        # Entries are inserted in expiry order, since every entry lives for the same ttl.
+        now = self._clock()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now:
+                break
+            if not entry.outcome.done():
+                entry.expires_at = now + self._ttl  # still running: keep collapsing duplicates
+                self._entries.move_to_end(key)
+                continue
+            del self._entries[key]
+
+    def stats(self) -> IdempotencyStats:
+        return IdempotencyStats(executed=self._executed, replayed=self._replayed, joined=self._joined,
+                                conflicts=self._conflicts, size=len(self._entries), maxsize=self._maxsize)
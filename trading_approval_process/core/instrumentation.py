@@ -0,0 +1,199 @@
+import contextvars
+import itertools
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+_span_ids = itertools.count(1)
+_WALL_CLOCK_OFFSET = time.time() - time.perf_counter()
+
+
+@dataclass(slots=True, eq=False)
+class Span:
+    """A timed operation; spans opened while another is current become its children."""
+    name: str
+    parent: "Span | None"
+    attributes: dict[str, Any]
+    start: float                       # time.perf_counter()
+    span_id: int
+    duration: float = 0.0
+    error: str | None = None           # exception type name, when the operation raised
+    events: list[tuple[float, str, dict[str, Any]]] = field(default_factory=list)
+    phased: bool = False               # a command span, split into phases by `phase()`
+    is_phase: bool = False
+
+    @property
+    def started_at(self) -> float:
+        """Wall-clock start (Unix seconds), for exporters; derived rather than read per span."""
+        return _WALL_CLOCK_OFFSET + self.start
+
+    @property
+    def trace_id(self) -> int:
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span.span_id
+
+
+class SpanSink(ABC):
+    """Receiver of finished spans; called on the event loop, so it must not block."""
+
+    @abstractmethod
+    def on_span(self, span: Span) -> None:
+        pass
+
+    def on_event(self, name: str, attributes: dict[str, Any], span: Span | None) -> None:
+        """A point-in-time event, e.g. a trade changing state; ignored unless overridden."""
+        pass
+
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("current_span", default=None)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _ActiveSpan:
+    __slots__ = ("_instrumentation", "_span")
+
+    def __init__(self, instrumentation: "Instrumentation", span: Span) -> None:
+        self._instrumentation = instrumentation
+        self._span = span
+
+    def __enter__(self) -> Span:
+        _current.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        span = self._span
+        current = _current.get()
+        if current is not None and current.is_phase and current.parent is span:
+            self._instrumentation._finish(current, exc_type)  # the command's last phase
+        self._instrumentation._finish(span, exc_type)
+        _current.set(span.parent)
+        return False
+
+
+class Instrumentation:
+    """
+    Registry of span sinks, and the entry points that time operations into them.
+
+    With no sink registered, `span` hands back a shared no-op context manager and
+    `instrumented` functions call straight through: instrumentation costs an attribute
+    check per call until someone listens.
+    """
+
+    __slots__ = ("sinks",)
+
+    def __init__(self) -> None:
+        self.sinks: tuple[SpanSink, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink: SpanSink) -> None:
+        self.sinks = (*self.sinks, sink)
+
+    def remove_sink(self, sink: SpanSink) -> None:
+        self.sinks = tuple(registered for registered in self.sinks if registered is not sink)
+
+    def span(self, name: str, **attributes: Any):
+        """Context manager timing the enclosed block as a child of the current span."""
+        if not self.sinks:
+            return _NOOP
+        return _ActiveSpan(self, self._open(name, _current.get(), attributes))
+
+    def phase(self, name: str) -> None:
+        """
+        Start the next phase of the current command (see `instrumented(phased=True)`).
+
+        Closes the previous phase, if any; the last one closes with the command. Outside
+        an instrumented command this does nothing.
+        """
+        if not self.sinks:
+            return
+        current = _current.get()
+        if current is None:
+            return
+        if current.is_phase:
+            self._finish(current, None)
+            command = current.parent
+        elif current.phased:
+            command = current
+        else:
+            return
+        span = self._open(f"{command.name}.{name}", command, {})
+        span.is_phase = True
+        _current.set(span)
+
+    def event(self, name: str, **attributes: Any) -> None:
+        """Record a point-in-time event on the current span and pass it to the sinks."""
+        if not self.sinks:
+            return
+        current = _current.get()
+        if current is not None:
+            current.events.append((time.time(), name, attributes))
+        for sink in self.sinks:
+            try:
+                sink.on_event(name, attributes, current)
+            except Exception:
+                logging.exception("Instrumentation: sink %r failed on event %s.", sink, name)
+
+    @staticmethod
+    def _open(name: str, parent: Span | None, attributes: dict[str, Any]) -> Span:
+        return Span(name, parent, attributes, time.perf_counter(), next(_span_ids))
+
+    def _finish(self, span: Span, exc_type: type[BaseException] | None) -> None:
+        span.duration = time.perf_counter() - span.start
+        if exc_type is not None:
+            span.error = exc_type.__name__
+        for sink in self.sinks:
+            try:
+                sink.on_span(span)
+            except Exception:
+                logging.exception("Instrumentation: sink %r failed on span %s.", sink, span.name)
+
+
+# The process-wide instrumentation: domain objects and commands report here.
+instrumentation = Instrumentation()
+span = instrumentation.span
+phase = instrumentation.phase
+event = instrumentation.event
+
+
+def instrumented(name: str | None = None, phased: bool = False) -> Callable:
+    """
+    Time every call of an async function as a span (named after the function by default).
+
+    With `phased`, the function marks its phases with `phase(...)` and each becomes a child
+    span, e.g. ApproveCommand.run.load / .validate / .change / .save.
+    """
+    def decorate(function: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or function.__qualname__
+
+        @wraps(function)
+        async def timed(*args, **kwargs) -> T:
+            if not instrumentation.sinks:
+                return await function(*args, **kwargs)
+            active = instrumentation.span(span_name)
+            active._span.phased = phased
+            with active:
+                return await function(*args, **kwargs)
+        return timed
+    return decorate
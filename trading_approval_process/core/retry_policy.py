@@ -0,0 +1,40 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from trading_approval_process.core.cancellation_token import CancellationToken
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry an operation on transient failures with capped exponential backoff and full jitter.
+
+    Jitter spreads competing retries apart, so writers that collided once do not collide again.
+    """
+
+    attempts: int = 5
+    base_delay: float = 0.002
+    max_delay: float = 0.1
+    retry_on: tuple[type[BaseException], ...] = ()
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    async def run(self, operation: Callable[[], Awaitable[T]], token: CancellationToken) -> T:
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except self.retry_on as ex:
+                if attempt >= self.attempts:
+                    raise
+                logging.debug("RetryPolicy: attempt %d failed — %s", attempt, ex)
+                await asyncio.sleep(self.backoff(attempt))
+                await token.throw_if_cancellation_requested()
+                attempt += 1
@@ -0,0 +1,105 @@
+import logging
+from collections import deque
+from typing import Any
+
+from trading_approval_process.core.instrumentation import Span, SpanSink
+from trading_approval_process.core.log_histogram import LogHistogram
+
+
+class HistogramSink(SpanSink):
+    """Duration histogram and error count per span name, kept in memory (exported at /metrics)."""
+
+    def __init__(self) -> None:
+        self.durations: dict[str, LogHistogram] = {}
+        self.errors: dict[str, int] = {}
+
+    def on_span(self, span: Span) -> None:
+        histogram = self.durations.get(span.name)
+        if histogram is None:
+            histogram = self.durations[span.name] = LogHistogram(resolution=1e-6)
+        histogram.record(span.duration)
+        if span.error is not None:
+            self.errors[span.name] = self.errors.get(span.name, 0) + 1
+
+
+class LogSink(SpanSink):
+    """One structured log record per span and event; the fields are passed as `extra` for JSON formatters."""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG) -> None:
+        self._logger = logger or logging.getLogger("trading_approval_process.spans")
+        self._level = level
+
+    def on_span(self, span: Span) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "span %s %.3f ms%s", span.name, span.duration * 1e3,
+                             f" error={span.error}" if span.error else "",
+                             extra={"span": span.name, "span_id": span.span_id, "trace_id": span.trace_id,
+                                    "duration_ms": span.duration * 1e3, "error": span.error, **span.attributes})
+
+    def on_event(self, name: str, attributes: dict[str, Any], span: Span | None) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "event %s %s", name,
+                             " ".join(f"{key}={value}" for key, value in attributes.items()),
+                             extra={"event": name, "span_id": span.span_id if span else None, **attributes})
+
+
+class OtlpSpanExporter(SpanSink):
+    """
+    Exporter stub shaped like OpenTelemetry's OTLP/JSON span records.
+
+    Spans are buffered as they finish and converted a batch at a time by `flush` to OTLP field
+    names and units (hex ids, Unix nanoseconds, typed attribute values, status codes); the
+    batch goes to `export`, which keeps the last `retain` spans here and is the place to post
+    them to a collector.
+    """
+
+    def __init__(self, service_name: str = "trade-approval", batch_size: int = 512, retain: int = 10_000) -> None:
+        self.service_name = service_name
+        self._batch_size = batch_size
+        self._pending: list[Span] = []
+        self.exported: deque[dict[str, Any]] = deque(maxlen=retain)
+
+    def on_span(self, span: Span) -> None:
+        self._pending.append(span)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        batch, self._pending = self._pending, []
+        if batch:
+            self.export([self.to_otlp(span) for span in batch])
+
+    def export(self, batch: list[dict[str, Any]]) -> None:
+        self.exported.extend(batch)
+
+    @staticmethod
+    def to_otlp(span: Span) -> dict[str, Any]:
+        start = int(span.started_at * 1e9)
+        record = {
+            "traceId": f"{span.trace_id:032x}",
+            "spanId": f"{span.span_id:016x}",
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": start,
+            "endTimeUnixNano": start + int(span.duration * 1e9),
+            "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+            "events": [{"timeUnixNano": int(at * 1e9), "name": name,
+                        "attributes": [_attribute(key, value) for key, value in attributes.items()]}
+                       for at, name, attributes in span.events],
+            "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+        }
+        if span.parent is not None:
+            record["parentSpanId"] = f"{span.parent.span_id:016x}"
+        return record
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
@@ -0,0 +1,66 @@
+import math
+from typing import Hashable
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel of deadlines by key.
+
+    - A deadline lands in slot `tick % slots` of its tick; `schedule` and `cancel` are O(1).
+    - `advance(now)` visits only the slots of the ticks that passed since the last call, and
+      returns the keys whose deadline is due, so the cost follows elapsed time and expiries
+      rather than the number of timers (deadlines more than a turn ahead stay in their slot).
+    - Deadlines resolve to `tick` seconds, rounded up: a timer never fires early.
+    Not thread-safe: use it from the event loop.
+    """
+
+    __slots__ = ("_tick", "_slots", "_wheel", "_where", "_current")
+
+    def __init__(self, tick: float = 1.0, slots: int = 512, now: float = 0.0) -> None:
+        if tick <= 0 or slots < 1:
+            raise ValueError("tick and slots must be positive")
+        self._tick = tick
+        self._slots = slots
+        self._wheel: list[dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: dict[Hashable, int] = {}
+        self._current = math.floor(now / tick)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Fire `key` at `deadline` (seconds on the clock passed to `advance`), replacing its previous timer."""
+        self.cancel(key)
+        # A deadline already past fires on the next advance.
+        due = max(math.ceil(deadline / self._tick), self._current + 1)
+        self._wheel[due % self._slots][key] = due
+        self._where[key] = due
+
+    def cancel(self, key: Hashable) -> bool:
+        due = self._where.pop(key, None)
+        if due is None:
+            return False
+        del self._wheel[due % self._slots][key]
+        return True
+
+    def advance(self, now: float) -> list[Hashable]:
+        """Move the wheel to `now` and return the keys that became due, earliest first."""
+        target = math.floor(now / self._tick)
+        if target <= self._current:
+            return []
+        fired: list[tuple[int, Hashable]] = []
+        # Past a whole turn, every slot is visited once anyway.
+        first = max(self._current + 1, target - self._slots + 1)
+        for tick in range(first, target + 1):
+            slot = self._wheel[tick % self._slots]
+            due = [(when, key) for key, when in slot.items() if when <= target]
+            for _, key in due:
+                del slot[key]
+                del self._where[key]
+            fired.extend(due)
+        self._current = target
+        fired.sort(key=lambda entry: entry[0])
+        return [key for _, key in fired]
@@ -5,10 +5,14 @@ from .validation_exception import ValidationException
 from .authorization_exception import AuthorizationException
 from .invalid_transition_exception import InvalidTransitionException
 from .not_found_exception import NotFoundException
+from .precondition_failed_exception import PreconditionFailedException
+from .execution_unavailable_exception import ExecutionUnavailableException
 
 __all__ = [
     "ValidationException",
     "AuthorizationException",
     "InvalidTransitionException",
     "NotFoundException",
+    "PreconditionFailedException",
+    "ExecutionUnavailableException",
 ]
@@ -0,0 +1,8 @@
+from .domain_exception import DomainException
+
+class ExecutionUnavailableException(DomainException):
+    code = "EXECUTION_UNAVAILABLE"
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
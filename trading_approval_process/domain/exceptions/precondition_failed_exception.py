@@ -0,0 +1,4 @@
+from .domain_exception import DomainException
+
+class PreconditionFailedException(DomainException):
+    code = "TRADE_VERSION_MISMATCH"
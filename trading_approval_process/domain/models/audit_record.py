@@ -1,10 +1,11 @@
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from .trade_state import TradeState
 from .trade_action import TradeAction
 from .trade_details import TradeDetails
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditRecord:
     step: int
     action: TradeAction
@@ -15,6 +16,12 @@ class AuditRecord:
     timestamp: datetime
     notes: str | None = None
 
+    def __post_init__(self) -> None:
+        # User ids and transition notes repeat across records; keep one copy of each.
+        object.__setattr__(self, "user_id", sys.intern(self.user_id))
+        if self.notes is not None:
+            object.__setattr__(self, "notes", sys.intern(self.notes))
+
     def __str__(self) -> str:
         """Return a concise human-readable summary for testing and logging."""
         ts = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,75 @@
+from collections.abc import Sequence
+from itertools import islice
+from typing import Iterable, Iterator, overload
+
+from trading_approval_process.domain.models.audit_record import AuditRecord
+
+
+class AuditTrail(Sequence[AuditRecord]):
+    """
+    Append-only audit sequence with structural sharing.
+
+    - `fork()` is O(1): the fork shares the backing list and sees only its own prefix.
+    - Appending to the longest fork extends the shared list in place; any other fork
+      copies its prefix first (copy-on-write), so records a fork can see never change.
+    - Records are frozen dataclasses, so sharing them between trades is safe.
+    """
+
+    __slots__ = ("_records", "_length")
+
+    def __init__(self, records: Iterable[AuditRecord] = ()) -> None:
+        self._records: list[AuditRecord] = list(records)
+        self._length: int = len(self._records)
+
+    def fork(self) -> "AuditTrail":
+        """Return an independent trail sharing the current records."""
+        trail = AuditTrail.__new__(AuditTrail)
+        trail._records = self._records
+        trail._length = self._length
+        return trail
+
+    def append(self, record: AuditRecord) -> None:
+        if self._length != len(self._records):
+            # Another fork already extended the shared list past our prefix.
+            self._records = self._records[:self._length]
+        self._records.append(record)
+        self._length += 1
+
+    def at_step(self, step: int) -> AuditRecord | None:
+        """The record of a version in O(1): steps are consecutive from 1, so step n is at n - 1."""
+        if 0 < step <= self._length:
+            record = self._records[step - 1]
+            if record.step == step:
+                return record
+        return None
+
+    # ---------------------------
+    # Sequence protocol
+    # ---------------------------
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> AuditRecord: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[AuditRecord]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._records[i] for i in range(self._length)[index]]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("audit trail index out of range")
+        return self._records[index]
+
+    def __iter__(self) -> Iterator[AuditRecord]:
+        return islice(self._records, self._length)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AuditTrail):
+            return self._length == other._length and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AuditTrail({list(self)!r})"
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+import uuid
+
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    """Outcome of one item of a batch command, reported at the item's position in the request."""
+    index: int
+    trade_id: uuid.UUID | None
+    state: TradeState | None = None
+    version: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import uuid
+
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True)
+class InboxItem:
+    """A trade waiting for someone's approval, as listed in their inbox."""
+    trade_id: uuid.UUID
+    state: TradeState
+    requester: str | None
+    version: int
+    details: TradeDetails | None
+    waiting_since: datetime
+
+
+@dataclass(frozen=True)
+class InboxPage:
+    """One page of an inbox; pass `next_cursor` back to fetch the next page."""
+    items: list[InboxItem] = field(default_factory=list)
+    next_cursor: int | None = None
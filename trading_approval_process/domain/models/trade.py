@@ -1,25 +1,37 @@
+import sys
 import uuid
 from dataclasses import fields
 from datetime import datetime
-from typing import Callable, Optional
 
+from trading_approval_process.core.instrumentation import instrumentation
 from trading_approval_process.domain.exceptions import *
 from trading_approval_process.domain.models.trade_state import TradeState
 from trading_approval_process.domain.models.trade_action import TradeAction
 from trading_approval_process.domain.models.trade_details import TradeDetails
 from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.audit_trail import AuditTrail
 from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
 from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
+from trading_approval_process.domain.models.trade_changelog import ChangelogEntry, TradeChangelog
 from trading_approval_process.domain.models.trade_diff import TradeDiff
 from trading_approval_process.domain.models.trade_history import TradeHistory
-from trading_approval_process.domain.models.trade_state_transitions import StateTransitions
+from trading_approval_process.domain.models.trade_state_transitions import TRANSITIONS, StateTransitions
+
+# Field names are resolved once rather than through dataclasses.fields() on every diff.
+_DETAIL_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(TradeDetails))
 
 
 class Trade:
     """Domain aggregate representing a Trade."""
 
-    def __init__(self,  trade_id: uuid.UUID | None = None, logger: Optional[Callable[[str], None]] = None) -> None:
-        self._logger = logger
+    # Slotted: no per-instance __dict__, which matters with a million trades held in memory.
+    __slots__ = ("trade_id", "requester", "approver", "state", "state_before", "version", "details", "audit",
+                 "execution_receipt", "execution_confirmation")
+
+    # The compiled workflow is immutable and shared, not rebuilt per trade or per clone.
+    _transitions: StateTransitions = TRANSITIONS
+
+    def __init__(self,  trade_id: uuid.UUID | None = None) -> None:
         self.trade_id = trade_id or uuid.uuid4()
         self.requester: str | None = None
         self.approver: str | None = None
@@ -27,22 +39,26 @@ class Trade:
         self.state_before: TradeState = TradeState.INITIAL
         self.version: int = 0
         self.details: TradeDetails | None = None
-        self.audit: list[AuditRecord] = []
+        self.audit: AuditTrail = AuditTrail()
         self.execution_receipt: ExecutionReceipt | None = None
         self.execution_confirmation: ExecutionConfirmation | None = None
 
-        self._transitions = StateTransitions()
+    def __copy__(self) -> "Trade":
+        clone = Trade.__new__(Trade)
+        for name in Trade.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
 
     def validate(self, user: str, action: TradeAction, new_details: TradeDetails | None = None ) -> None:
         """Validate that the given user may perform the action in the current state."""
 
-        if not self._transitions.is_state_registered(self.state):
-            raise InvalidTransitionException(f"State '{self.state.name}' is not registered in transition map.")
-
-        if not self._transitions.is_action_available(self.state, action):
+        transition = self._transitions.lookup(self.state, action)
+        if transition is None:
+            if not self._transitions.is_state_registered(self.state):
+                raise InvalidTransitionException(f"State '{self.state.name}' is not registered in transition map.")
             raise InvalidTransitionException(f"Action '{action.name}' is not allowed from state '{self.state.name}'.")
 
-        if not self._transitions.is_user_authorized(self, user, action):
+        if not transition.is_authorised(self, user):
             raise AuthorizationException(
                 f"User '{user}' is not authorised to perform action '{action.name}' from state '{self.state.name}'.")
 
@@ -50,8 +66,28 @@ class Trade:
         if new_details is not None:
             new_details.validate()
 
+    def check_version(self, expected_version: int | None) -> None:
+        """Validate that the trade is still at the version the caller last saw, when given."""
+        if expected_version is not None and expected_version != self.version:
+            raise PreconditionFailedException(
+                f"Trade '{self.trade_id}' is at version {self.version}, not {expected_version}.")
+
     def change(self, user: str, action: TradeAction, timestamp: datetime) -> None:
-        next_state, note = self._transitions.get_transition(self.state, action)
+        transition = self._transitions.lookup(self.state, action)
+        if transition is None:
+            raise InvalidTransitionException(f"Action '{action.name}' is not allowed from state '{self.state.name}'.")
+        next_state, note = transition.next_state, transition.note
+
+        # Keep one instance of repeated user ids, and let an unchanged (equal) details value
+        # reference the previous record's instance instead of holding a duplicate.
+        if self.requester is not None:
+            self.requester = sys.intern(self.requester)
+        if self.approver is not None:
+            self.approver = sys.intern(self.approver)
+        if self.audit:
+            previous = self.audit[-1].details
+            if previous is not self.details and previous == self.details:
+                self.details = previous
 
         self.version += 1
         self.state_before = self.state
@@ -59,14 +95,14 @@ class Trade:
         self.audit.append(
             AuditRecord(self.version, action, user, self.state_before, self.state, self.details, timestamp, note))
 
-
-        if self._logger:
-            self._logger(
-                f"[Trade {self.trade_id}] {action.name} by {user} → {self.state.name} at {timestamp.isoformat()}")
+        # Reported as an event on the current command span (see core.instrumentation).
+        if instrumentation.sinks:
+            instrumentation.event("trade.changed", trade_id=self.trade_id, action=action.name, user=user,
+                                  state=self.state.name, version=self.version, timestamp=timestamp)
 
     def to_history(self) -> TradeHistory:
         """"Retrieve full history ot the trade."""
-        return TradeHistory(self.trade_id, self.requester, self.approver, self.audit)
+        return TradeHistory(self.trade_id, self.requester, self.approver, list(self.audit))
 
     def get_differences(self, version_a: int, version_b: int) -> TradeDiff:
         """Compute field-level differences between two TradeDetails instances."""
@@ -74,14 +110,31 @@ class Trade:
         details_a = self._get_details_by_version(version_a)
         details_b = self._get_details_by_version(version_b)
 
+        return TradeDiff(self._diff(details_a, details_b))
+
+    def get_changelog(self) -> TradeChangelog:
+        """Differences between every pair of consecutive versions, computed in one pass."""
+        entries = []
+        previous: TradeDetails | None = None
+        for record in self.audit:
+            changes = self._diff(previous, record.details) if previous is not None else {}
+            entries.append(ChangelogEntry(record.step, record.action, record.user_id, record.timestamp,
+                                          record.state_before, record.state_after, changes))
+            previous = record.details
+        return TradeChangelog(self.trade_id, entries)
+
+    @staticmethod
+    def _diff(details_a: TradeDetails, details_b: TradeDetails) -> dict[str, tuple[str, str]]:
+        if details_a is details_b:
+            return {}  # unchanged details are shared between records, see change()
+
         differences = {}
-        for field in fields(details_a):
-            field_in_details_a = getattr(details_a, field.name)
-            field_in_details_b = getattr(details_b, field.name)
+        for name in _DETAIL_FIELDS:
+            field_in_details_a = getattr(details_a, name)
+            field_in_details_b = getattr(details_b, name)
             if field_in_details_a != field_in_details_b:
-                differences[field.name] = ( str(field_in_details_a), str(field_in_details_b) )
-
-        return TradeDiff(differences)
+                differences[name] = ( str(field_in_details_a), str(field_in_details_b) )
+        return differences
 
     def _get_details_by_version(self, version: int) -> TradeDetails:
         """Retrieve details related to the given version."""
@@ -89,8 +142,8 @@ class Trade:
         if version == self.version:
             return self.details
 
-        for record in self.audit:
-            if record.step == version:
-                return record.details
+        record = self.audit.at_step(version)
+        if record is not None:
+            return record.details
 
         raise NotFoundException(f"Version {version} not found for trade {self.trade_id}.")
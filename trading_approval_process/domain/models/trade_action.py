@@ -8,3 +8,4 @@ class TradeAction(Enum):
     APPROVE = auto()
     SEND_TO_EXECUTE = auto()
     BOOK = auto()
+    RECORD_RECEIPT = auto()
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from datetime import date
+
+from trading_approval_process.domain.models.trade_state import TradeState
+
+GROUP_FIELDS = ("state", "currency", "counterparty", "trading_entity", "direction", "style", "trade_date", "value_date")
+
+
+@dataclass(frozen=True)
+class AnalyticsFilter:
+    """Filters over the analytics projection; unset filters match every trade."""
+    states: tuple[TradeState, ...] = ()
+    currency: str | None = None
+    counterparty: str | None = None
+    trade_date_from: date | None = None
+    trade_date_to: date | None = None  # inclusive
+
+
+@dataclass(frozen=True)
+class NotionalGroup:
+    """Trade count and total notional of one group; `group` maps each grouped field to its value."""
+    group: dict[str, object]
+    trades: int
+    notional: float
+
+
+@dataclass(frozen=True)
+class ApprovalTurnaround:
+    """Time from a trade starting to wait for approval to `approver` approving it."""
+    approver: str
+    approvals: int
+    average_seconds: float
+    max_seconds: float
+
+
+@dataclass(frozen=True)
+class CounterpartyCancellations:
+    counterparty: str
+    trades: int
+    cancelled: int
+    cancellation_ratio: float
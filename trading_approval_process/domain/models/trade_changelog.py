@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+import uuid
+
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True, slots=True)
+class ChangelogEntry:
+    """One version of a trade and the detail fields it changed from the version before."""
+    version: int
+    action: TradeAction
+    user_id: str
+    timestamp: datetime
+    state_before: TradeState
+    state_after: TradeState
+    changes: dict[str, tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class TradeChangelog:
+    trade_id: uuid.UUID
+    entries: list[ChangelogEntry]
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from datetime import date
 from .currency_codes import VALID_CURRENCY_CODES
@@ -7,7 +8,7 @@ from .trade_style import TradeStyle
 from trading_approval_process.domain.exceptions import ValidationException
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeDetails:
     trading_entity: str
     counterparty: str
@@ -22,6 +23,13 @@ class TradeDetails:
     strike: float | None = None
     confirmation_id: str | None = None
 
+    def __post_init__(self) -> None:
+        # A few entities, counterparties and currency pairs recur across every trade;
+        # interning keeps one copy of each string however many trades hold it.
+        for name in ("trading_entity", "counterparty", "notional_currency", "underlying"):
+            value = getattr(self, name)
+            if type(value) is str:
+                object.__setattr__(self, name, sys.intern(value))
 
     def validate(self):
         if not self.trading_entity:
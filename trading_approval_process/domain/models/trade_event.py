@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from datetime import datetime
+import uuid
+
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True)
+class TradeEvent:
+    """A committed state change of a trade, numbered in publication order."""
+    event_id: int
+    trade_id: uuid.UUID
+    version: int
+    action: TradeAction
+    user_id: str
+    requester: str | None
+    approver: str | None
+    state_before: TradeState
+    state_after: TradeState
+    timestamp: datetime
+
+
+@dataclass(frozen=True)
+class TradeEventFilter:
+    """Which events a subscriber receives; unset criteria match everything."""
+    states: frozenset[TradeState] | None = None
+    trade_ids: frozenset[uuid.UUID] | None = None
+    user: str | None = None
+
+    def matches(self, event: TradeEvent) -> bool:
+        if self.states is not None and event.state_after not in self.states:
+            return False
+        if self.trade_ids is not None and event.trade_id not in self.trade_ids:
+            return False
+        # A user follows the trades they act on, requested or approve.
+        if self.user is not None and self.user not in (event.user_id, event.requester, event.approver):
+            return False
+        return True
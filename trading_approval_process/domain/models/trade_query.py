@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_state import TradeState
+
+
+@dataclass(frozen=True)
+class TradeQuery:
+    """
+    Equality filters over the indexed trade fields plus a keyset page window.
+
+    Trades are listed in creation order; `after` is the cursor returned with the previous
+    page, so a page costs the same however deep into the listing it is.
+    """
+    state: TradeState | None = None
+    requester: str | None = None
+    approver: str | None = None
+    counterparty: str | None = None
+    notional_currency: str | None = None
+    trade_date: date | None = None
+    limit: int = 50
+    after: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.limit < 1:
+            raise ValueError("limit must be positive")
+
+    def filters(self) -> dict[str, object]:
+        """The filters that are set, keyed by indexed field name."""
+        return {name: value for name in INDEXED_FIELDS if (value := getattr(self, name)) is not None}
+
+
+@dataclass(frozen=True)
+class TradePage:
+    """One page of a trade query; pass `next_cursor` as `after` to fetch the next page."""
+    items: list[Trade] = field(default_factory=list)
+    next_cursor: int | None = None
+
+
+INDEXED_FIELDS = ("state", "requester", "approver", "counterparty", "notional_currency", "trade_date")
+
+
+def indexed_values(trade: Trade) -> dict[str, object]:
+    """Current values of the indexed fields of a trade."""
+    details = trade.details
+    return {
+        "state": trade.state,
+        "requester": trade.requester,
+        "approver": trade.approver,
+        "counterparty": details.counterparty if details else None,
+        "notional_currency": details.notional_currency if details else None,
+        "trade_date": details.trade_date if details else None,
+    }
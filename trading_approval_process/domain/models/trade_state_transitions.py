@@ -1,58 +1,108 @@
-from types import MappingProxyType
-from typing import Tuple, Callable, Any
+from typing import Any, Callable, NamedTuple
 
 from trading_approval_process.domain.models.trade_state import TradeState
 from trading_approval_process.domain.models.trade_action import TradeAction
 
 
+# ---------------------------
+# Authorisation rules (shared by every transition that uses them)
+# ---------------------------
+def _anyone(trade: Any, user: str) -> bool:
+    return True
+
+
+def _requester(trade: Any, user: str) -> bool:
+    return user == trade.requester
+
+
+def _not_requester(trade: Any, user: str) -> bool:
+    return user != trade.requester
+
+
+def _approver(trade: Any, user: str) -> bool:
+    return user == trade.approver
+
+
+def _requester_or_approver(trade: Any, user: str) -> bool:
+    return user == trade.requester or user == trade.approver
+
+
+class Transition(NamedTuple):
+    """Outcome of an allowed action: the next state, its audit note and who may perform it."""
+    next_state: TradeState
+    note: str
+    is_authorised: Callable[[Any, str], bool]
+
+
 class StateTransitions:
+    """
+    The trade workflow, compiled once into a flat table shared by all trades.
+
+    The table is a tuple indexed by `state * stride + action` over the enums' integer values,
+    so a lookup is one index operation instead of hashing enum members through nested dicts.
+    """
+
+    # Allowed state transitions: from_state : action : (to_state, note, user_right)
+    _DEFINITION: dict[TradeState, dict[TradeAction, Transition]] = {
+        TradeState.INITIAL: {
+            TradeAction.CREATE: Transition(TradeState.DRAFT, "Trade created", _anyone) },
+        TradeState.DRAFT: {
+            TradeAction.UPDATE: Transition(TradeState.DRAFT, "Trade updated", _requester),
+            TradeAction.CANCEL: Transition(TradeState.CANCELLED, "Trade cancelled", _requester),
+            TradeAction.SUBMIT: Transition(TradeState.PENDING_APPROVAL, "Trade submitted", _requester), },
+        TradeState.PENDING_APPROVAL: {
+            TradeAction.UPDATE: Transition(TradeState.NEEDS_REAPPROVAL, "Trade updated, need reapproval", _not_requester),
+            TradeAction.CANCEL: Transition(TradeState.CANCELLED, "Trade cancelled", _not_requester),
+            TradeAction.APPROVE: Transition(TradeState.APPROVED, "Trade approved", _not_requester), },
+        TradeState.NEEDS_REAPPROVAL: {
+            TradeAction.APPROVE: Transition(TradeState.APPROVED, "Trade reapproved", _requester),
+            TradeAction.CANCEL: Transition(TradeState.CANCELLED, "Trade cancelled", _requester) },
+        TradeState.APPROVED: {
+            TradeAction.SEND_TO_EXECUTE: Transition(TradeState.SENT_TO_COUNTERPARTY, "Trade sent to counterparty", _approver),
+            TradeAction.CANCEL: Transition(TradeState.CANCELLED, "Trade cancelled", _approver) },
+        TradeState.SENT_TO_COUNTERPARTY: {
+            TradeAction.RECORD_RECEIPT: Transition(TradeState.SENT_TO_COUNTERPARTY, "Execution receipt recorded", _approver),
+            TradeAction.BOOK: Transition(TradeState.EXECUTED, "Trade executed", _requester_or_approver),
+            TradeAction.CANCEL: Transition(TradeState.CANCELLED, "Trade cancelled", _requester_or_approver) },
+        #TradeState.CANCEL_REQUESTED: {
+        #    TradeAction.CANCEL_CONFIRMED: TradeState.CANCELLED,
+        #    TradeAction.EXECUTION_CONFIRMED: TradeState.EXECUTED,
+        #},
+        TradeState.EXECUTED: {},
+        TradeState.CANCELLED: {},
+    }
 
     def __init__(self) -> None:
+        # `_value_` is the member's plain int; `.value` goes through a Python-level descriptor.
+        self._stride = max(action._value_ for action in TradeAction) + 1
+        table: list[Transition | None] = [None] * ((max(state._value_ for state in TradeState) + 1) * self._stride)
+        for state, actions in self._DEFINITION.items():
+            for action, transition in actions.items():
+                table[state._value_ * self._stride + action._value_] = transition
+        self._table: tuple[Transition | None, ...] = tuple(table)
+        self._registered = frozenset(self._DEFINITION)
 
-        # Allowed state transitions: from_state : action : [to_state, nore, user_right]
-        self._map_state_translations: MappingProxyType[TradeState, dict[TradeAction, Tuple[ TradeState, str, Callable[[Any, str], bool]]]] = MappingProxyType({
-            TradeState.INITIAL: {
-                TradeAction.CREATE: (TradeState.DRAFT, "Trade created", lambda trade, user: True) },
-            TradeState.DRAFT: {
-                TradeAction.UPDATE: (TradeState.DRAFT, "Trade updated", lambda trade, user: user in [trade.requester]) ,
-                TradeAction.CANCEL: (TradeState.CANCELLED, "Trade cancelled", lambda trade, user: user in [trade.requester]) ,
-                TradeAction.SUBMIT: (TradeState.PENDING_APPROVAL, "Trade submitted", lambda trade, user: user in [trade.requester]) , },
-            TradeState.PENDING_APPROVAL: {
-                TradeAction.UPDATE: (TradeState.NEEDS_REAPPROVAL, "Trade updated, need reapproval", lambda trade, user: user not in [trade.requester]) ,
-                TradeAction.CANCEL: (TradeState.CANCELLED, "Trade cancelled", lambda trade, user: user not in [trade.requester]) ,
-                TradeAction.APPROVE: (TradeState.APPROVED, "Trade approved", lambda trade, user: user not in [trade.requester]) ,},
-            TradeState.NEEDS_REAPPROVAL: {
-                TradeAction.APPROVE: (TradeState.APPROVED, "Trade reapproved", lambda trade, user: user in [trade.requester]),
-                TradeAction.CANCEL: (TradeState.CANCELLED, "Trade cancelled", lambda trade, user: user in [trade.requester]) },
-            TradeState.APPROVED: {
-                TradeAction.SEND_TO_EXECUTE: (TradeState.SENT_TO_COUNTERPARTY, "Trade sent to counterparty", lambda trade, user: user in [trade.approver] ),
-                TradeAction.CANCEL: (TradeState.CANCELLED, "Trade cancelled",  lambda trade, user: user in [trade.approver] ) },
-            TradeState.SENT_TO_COUNTERPARTY: {
-                TradeAction.BOOK: (TradeState.EXECUTED, "Trade executed", lambda trade, user: user in [trade.requester, trade.approver] ),
-                TradeAction.CANCEL: (TradeState.CANCELLED, "Trade cancelled", lambda trade, user: user in [trade.requester, trade.approver]) },
-            #TradeState.CANCEL_REQUESTED: {
-            #    TradeAction.CANCEL_CONFIRMED: TradeState.CANCELLED,
-            #    TradeAction.EXECUTION_CONFIRMED: TradeState.EXECUTED,
-            #},
-            TradeState.EXECUTED: [],
-            TradeState.CANCELLED: [],
-        })
+    def lookup(self, state: TradeState, action: TradeAction) -> Transition | None:
+        """The transition for the action in the state, or None when it is not allowed."""
+        return self._table[state._value_ * self._stride + action._value_]
 
     def is_state_registered(self, state: TradeState) -> bool:
         """Is the given state registered in the current state?"""
-        return state in self._map_state_translations
+        return state in self._registered
 
     def is_action_available(self, state: TradeState, action: TradeAction) -> bool:
         """Is the given action available in the current state?"""
-        available_actions = self._map_state_translations[state]
-        return action in available_actions
+        return self.lookup(state, action) is not None
 
     def is_user_authorized(self, trade: Any, user: str, action: TradeAction) -> bool:
         """Is the given user authorized in the current state for the given action?"""
-        next_state, note, is_authorised = self._map_state_translations[trade.state][action]
-        return is_authorised(trade, user)
+        return self.lookup(trade.state, action).is_authorised(trade, user)
 
-    def get_transition(self, state: TradeState, action: TradeAction) -> tuple[TradeState, str]  :
+    def get_transition(self, state: TradeState, action: TradeAction) -> tuple[TradeState, str]:
         """Get the transition from the given state by given action."""
-        next_state, note, is_authorised = self._map_state_translations[state][action]
-        return (next_state, note)
+        transition = self.lookup(state, action)
+        return transition.next_state, transition.note
+
+
+# Compiled once at import; the table is immutable, so every Trade shares it.
+TRANSITIONS = StateTransitions()
@@ -1,9 +1,30 @@
 """
 Infrastructure adapters for repositories, time providers, and executors.
-In-memory versions are provided for prototyping and testing.
+In-memory versions are provided for prototyping and testing; SQLite and an event-sourced
+log store provide durable storage.
 """
 from trading_approval_process.infrastructure.reository.inmemory_trade_repository import InMemoryTradeRepository
+from trading_approval_process.infrastructure.reository.sqlite_trade_repository import SqliteTradeRepository
+from trading_approval_process.infrastructure.reository.event_sourced_trade_repository import EventSourcedTradeRepository
+from trading_approval_process.infrastructure.reository.observed_trade_repository import ObservedTradeRepository
+from trading_approval_process.infrastructure.reository.instrumented_trade_repository import InstrumentedTradeRepository
 from trading_approval_process.infrastructure.executor.inmemory_trade_executor import InmemoryTradeExecutor
+from trading_approval_process.infrastructure.executor.batching_trade_executor import BatchingTradeExecutor
+from trading_approval_process.infrastructure.executor.tcp_trade_executor import TcpTradeExecutor
+from trading_approval_process.infrastructure.executor.resilient_trade_executor import ResilientTradeExecutor
+from trading_approval_process.infrastructure.executor.instrumented_trade_executor import InstrumentedTradeExecutor
 from trading_approval_process.infrastructure.time.system_time import SystemTime
 
-__all__ = ["InMemoryTradeRepository", "InmemoryTradeExecutor", "SystemTime"]
+__all__ = [
+    "InMemoryTradeRepository",
+    "SqliteTradeRepository",
+    "EventSourcedTradeRepository",
+    "ObservedTradeRepository",
+    "InstrumentedTradeRepository",
+    "InmemoryTradeExecutor",
+    "BatchingTradeExecutor",
+    "TcpTradeExecutor",
+    "ResilientTradeExecutor",
+    "InstrumentedTradeExecutor",
+    "SystemTime",
+]
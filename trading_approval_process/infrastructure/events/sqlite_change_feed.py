@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.infrastructure.reository.sqlite_trade_repository import SqliteTradeRepository
+
+
+@dataclass(frozen=True)
+class ChangeFeedStats:
+    cursor: int      # sequence number of the last change read
+    polls: int
+    delivered: int   # trades handed to the listeners
+    pruned: int      # change log rows dropped after `retention`
+
+
+class SqliteChangeFeed:
+    """
+    Follows the saves other processes make to a shared SQLite file, for this process's views.
+
+    Every worker saves through its own SqliteTradeRepository with `record_changes`, which logs
+    each saved version under the repository's origin. The feed polls that log every `interval`
+    seconds, loads the trades changed by *other* origins and hands them to its listeners like
+    a local save would (its own saves reach them through ObservedTradeRepository already).
+
+    - Several versions of a trade saved between two polls arrive as the latest one, and a
+      change saved during a rebuild arrives again; views that skip versions they have seen
+      (inbox, metrics, analytics) stay exact, the event bus sees the changes coalesced.
+    - `prime` fixes the starting point: called before the views are rebuilt, so a change
+      saved during the rebuild is delivered again rather than missed.
+    - Changes older than `retention` seconds are pruned from the log, every `retention / 10`.
+    """
+
+    def __init__(self, repository: SqliteTradeRepository, interval: float = 0.05, batch_size: int = 500,
+                 retention: float = 3600.0) -> None:
+        self._repository = repository
+        self._interval = interval
+        self._batch_size = batch_size
+        self._retention = retention
+        self._listeners: list[ITradeListener] = []
+        self._cursor = 0
+        self._polls = 0
+        self._delivered = 0
+        self._pruned = 0
+        self._pruned_at = time.monotonic()
+        self._poller: asyncio.Task | None = None
+
+    def subscribe(self, listener: ITradeListener) -> None:
+        self._listeners.append(listener)
+
+    async def prime(self) -> None:
+        """Start after the latest change recorded so far."""
+        self._cursor = await self._repository.last_change()
+
+    async def poll(self) -> int:
+        """Deliver the changes recorded since the last poll; returns how many trades were delivered."""
+        self._polls += 1
+        delivered = 0
+        while True:
+            changes = await self._repository.changes_after(self._cursor, self._batch_size)
+            if not changes:
+                break
+            foreign = list(dict.fromkeys(change.trade_id for change in changes
+                                         if change.origin != self._repository.origin))
+            if foreign:
+                trades = await self._repository.get_many(foreign, CancellationToken())
+                delivered += self._notify([trade for trade in trades if trade is not None])
+            self._cursor = changes[-1].seq
+            if len(changes) < self._batch_size:
+                break
+        self._delivered += delivered
+        return delivered
+
+    async def start(self) -> None:
+        if self._poller is None:
+            self._poller = asyncio.create_task(self._poll_forever())
+
+    async def stop(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+
+    def stats(self) -> ChangeFeedStats:
+        return ChangeFeedStats(cursor=self._cursor, polls=self._polls, delivered=self._delivered,
+                               pruned=self._pruned)
+
+    async def _poll_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.poll()
+                if time.monotonic() - self._pruned_at >= self._retention / 10:
+                    self._pruned_at = time.monotonic()
+                    self._pruned += await self._repository.prune_changes(self._retention)
+            except Exception:
+                # A busy or briefly unavailable file: the cursor has not moved, the next poll retries.
+                logging.exception("SqliteChangeFeed: poll failed.")
+
+    def _notify(self, trades: list[Trade]) -> int:
+        for listener in self._listeners:
+            try:
+                listener.on_saved(trades)
+            except Exception:
+                logging.exception("SqliteChangeFeed: listener %r failed.", listener)
+        return len(trades)
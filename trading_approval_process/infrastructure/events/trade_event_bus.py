@@ -0,0 +1,139 @@
+import asyncio
+from collections import deque
+from enum import Enum, auto
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_event import TradeEvent, TradeEventFilter
+
+
+class OverflowPolicy(Enum):
+    """What happens when a subscriber's queue is full."""
+    DISCONNECT = auto()   # stop feeding it and end the subscription once drained; it resumes by id
+    DROP_OLDEST = auto()  # discard its oldest queued event and count the loss
+
+
+class Subscription:
+    """One subscriber's bounded queue of matching events."""
+
+    __slots__ = ("filter", "dropped", "gap", "_queue", "_capacity", "_policy", "_ready", "_closed")
+
+    def __init__(self, event_filter: TradeEventFilter, capacity: int, policy: OverflowPolicy) -> None:
+        self.filter = event_filter
+        self.dropped = 0
+        self.gap = False  # events between the resume point and the retained history were lost
+        self._queue: deque[TradeEvent] = deque()
+        self._capacity = capacity
+        self._policy = policy
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def offer(self, event: TradeEvent) -> None:
+        if self._closed:
+            return
+        if len(self._queue) >= self._capacity:
+            self.dropped += 1
+            if self._policy is OverflowPolicy.DISCONNECT:
+                self.close()
+                return
+            self._queue.popleft()
+        self._queue.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> TradeEvent | None:
+        """Next event; None on timeout, or once the subscription is closed and drained."""
+        while not self._queue:
+            if self._closed:
+                return None
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._queue.popleft()
+
+
+class TradeEventBus(ITradeListener):
+    """
+    In-process pub/sub of committed trade state changes.
+
+    - Fed by ObservedTradeRepository after each successful save: every command saves
+      exactly one `Trade.change`, so the last audit record of a saved trade is its event.
+    - Publishing is synchronous: each matching subscriber gets the event appended to its
+      bounded queue and is woken, so fan-out costs one filter check and append each.
+    - The last `history` events are retained, so a subscriber can resume after its
+      last seen event id; if that point was already evicted, the subscription is flagged
+      with `gap` for the client to resynchronise.
+    """
+
+    def __init__(self, history: int = 10_000, queue_size: int = 1_000,
+                 policy: OverflowPolicy = OverflowPolicy.DISCONNECT) -> None:
+        self._history: deque[TradeEvent] = deque(maxlen=history)
+        self._queue_size = queue_size
+        self._policy = policy
+        self._subscriptions: set[Subscription] = set()
+        self._last_id = 0
+
+    @property
+    def last_event_id(self) -> int:
+        return self._last_id
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    # ---------------------------
+    # Publishing
+    # ---------------------------
+    def on_saved(self, trades: list[Trade]) -> None:
+        for trade in trades:
+            self.publish(self._event(trade))
+
+    def publish(self, event: TradeEvent) -> None:
+        self._last_id = event.event_id
+        self._history.append(event)
+        for subscription in self._subscriptions:
+            if subscription.filter.matches(event):
+                subscription.offer(event)
+
+    def _event(self, trade: Trade) -> TradeEvent:
+        record = trade.audit[-1]
+        return TradeEvent(
+            event_id=self._last_id + 1,
+            trade_id=trade.trade_id,
+            version=record.step,
+            action=record.action,
+            user_id=record.user_id,
+            requester=trade.requester,
+            approver=trade.approver,
+            state_before=record.state_before,
+            state_after=record.state_after,
+            timestamp=record.timestamp,
+        )
+
+    # ---------------------------
+    # Subscribing
+    # ---------------------------
+    def subscribe(self, event_filter: TradeEventFilter | None = None,
+                  last_event_id: int | None = None) -> Subscription:
+        """Subscribe to new events; with `last_event_id`, first replay the retained ones after it."""
+        subscription = Subscription(event_filter or TradeEventFilter(), self._queue_size, self._policy)
+        if last_event_id is not None and last_event_id < self._last_id:
+            oldest = self._history[0].event_id if self._history else self._last_id + 1
+            subscription.gap = last_event_id + 1 < oldest
+            for event in self._history:
+                if event.event_id > last_event_id and subscription.filter.matches(event):
+                    subscription.offer(event)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        subscription.close()
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+from typing import Callable, Hashable
+
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+
+
+def by_counterparty(trade: Trade) -> Hashable:
+    return trade.details.counterparty
+
+
+def _discard_outcome(waiter: asyncio.Future) -> None:
+    # Nobody waits for this receipt any more; retrieve a failure so it is not reported as lost.
+    if not waiter.cancelled():
+        waiter.exception()
+
+
+def _cancel(waiters: list[asyncio.Future]) -> None:
+    # The batch was cancelled (e.g. at shutdown), even before it started: no receipt will come.
+    for waiter in waiters:
+        waiter.cancel()
+
+
+def _fail(waiters: list[asyncio.Future], error: BaseException) -> None:
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_exception(error)
+
+
+class _Batch:
+    __slots__ = ("trades", "waiters", "timer")
+
+    def __init__(self) -> None:
+        self.trades: list[Trade] = []
+        self.waiters: list[asyncio.Future[ExecutionReceipt]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class BatchingTradeExecutor(ITradeExecutor):
+    """
+    Decorator coalescing concurrent sends into `send_many` calls of the inner executor.
+
+    - A send joins the open batch of its key (the counterparty by default), so a batch only
+      holds trades for one venue.
+    - A batch is flushed `window` seconds after its first trade, or as soon as it holds
+      `max_batch` trades; each caller then receives its own receipt, or the batch's error.
+      A caller left without a receipt (too few returned) fails; a cancelled batch cancels
+      its callers.
+    - A caller whose token is cancelled stops waiting, but its trade stays in the batch:
+      once handed over, a send cannot be taken back.
+    """
+
+    def __init__(self, inner: ITradeExecutor, window: float = 0.002, max_batch: int = 100,
+                 key: Callable[[Trade], Hashable] = by_counterparty) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be positive")
+        self._inner = inner
+        self._window = window
+        self._max_batch = max_batch
+        self._key = key
+        self._open: dict[Hashable, _Batch] = {}
+        self._in_flight: set[asyncio.Task] = set()
+        self.batches = 0
+        self.trades = 0
+
+    async def send(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
+        await token.throw_if_cancellation_requested()
+        loop = asyncio.get_running_loop()
+        key = self._key(trade)
+        batch = self._open.get(key)
+        if batch is None:
+            batch = self._open[key] = _Batch()
+            batch.timer = loop.call_later(self._window, self._flush, key, batch)
+        waiter: asyncio.Future[ExecutionReceipt] = loop.create_future()
+        batch.trades.append(trade)
+        batch.waiters.append(waiter)
+        if len(batch.trades) >= self._max_batch:
+            self._flush(key, batch)
+
+        # Race the receipt against the token; neither a cancelled token nor a cancelled
+        # caller cancels the waiter, which the batch still completes.
+        cancelled = asyncio.ensure_future(token.wait())
+        try:
+            await asyncio.wait((waiter, cancelled), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            cancelled.cancel()
+        if not waiter.done():
+            waiter.add_done_callback(_discard_outcome)
+            await token.throw_if_cancellation_requested()
+        return waiter.result()
+
+    async def send_many(self, trades: list[Trade], token: CancellationToken) -> list[ExecutionReceipt]:
+        return list(await asyncio.gather(*(self.send(trade, token) for trade in trades)))
+
+    def _flush(self, key: Hashable, batch: _Batch) -> None:
+        if self._open.get(key) is not batch:
+            return  # already flushed by size
+        del self._open[key]
+        batch.timer.cancel()
+        self.batches += 1
+        self.trades += len(batch.trades)
+        task = asyncio.create_task(self._submit(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+        task.add_done_callback(lambda submitted: _cancel(batch.waiters) if submitted.cancelled() else None)
+
+    async def _submit(self, batch: _Batch) -> None:
+        try:
+            receipts = await self._inner.send_many(batch.trades, CancellationToken())
+        except Exception as error:
+            logging.warning("BatchingTradeExecutor: batch of %d trades failed: %s", len(batch.trades), error)
+            _fail(batch.waiters, error)
+            return
+        for waiter, receipt in zip(batch.waiters, receipts):
+            if not waiter.done():
+                waiter.set_result(receipt)
+        if len(receipts) != len(batch.waiters):
+            _fail(batch.waiters, RuntimeError(
+                f"{type(self._inner).__name__}.send_many returned {len(receipts)} receipts for {len(batch.trades)} trades"))
+
+    async def close(self) -> None:
+        """Flush the open batches and wait for every batch in flight."""
+        for key, batch in list(self._open.items()):
+            self._flush(key, batch)
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
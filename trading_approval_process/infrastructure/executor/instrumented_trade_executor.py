@@ -0,0 +1,20 @@
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumentation
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+
+
+class InstrumentedTradeExecutor(ITradeExecutor):
+    """Executor decorator timing every send as an `executor.send` span, by counterparty."""
+
+    def __init__(self, inner: ITradeExecutor) -> None:
+        self._inner = inner
+
+    async def send(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
+        with instrumentation.span("executor.send", counterparty=trade.details.counterparty):
+            return await self._inner.send(trade, token)
+
+    async def send_many(self, trades: list[Trade], token: CancellationToken) -> list[ExecutionReceipt]:
+        with instrumentation.span("executor.send_many", trades=len(trades)):
+            return await self._inner.send_many(trades, token)
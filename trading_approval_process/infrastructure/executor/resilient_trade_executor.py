@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from typing import Callable, Hashable
+
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.bulkhead import Bulkhead, BulkheadFullError
+from trading_approval_process.core.cancellation_token import CancellationToken, cancellation_scope
+from trading_approval_process.core.circuit_breaker import CircuitBreaker, CircuitStats
+from trading_approval_process.domain.exceptions import ExecutionUnavailableException
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.infrastructure.executor.batching_trade_executor import by_counterparty
+
+
+class _Venue:
+    __slots__ = ("breaker", "bulkhead")
+
+    def __init__(self, breaker: CircuitBreaker, bulkhead: Bulkhead) -> None:
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+
+
+class ResilientTradeExecutor(ITradeExecutor):
+    """
+    Decorator isolating callers from slow or failing venues, keyed by counterparty.
+
+    - Deadline: a send not answered within `timeout` seconds is abandoned; the inner
+      executor sees the caller's token, and the await is cancelled at the deadline.
+    - Bulkhead: at most `max_in_flight` sends per venue; sends beyond that fail fast.
+    - Circuit breaker: `failure_threshold` consecutive failures or timeouts stop sends to
+      the venue for `reset_timeout` seconds, after which a single probe is let through.
+    Refused and failed sends raise ExecutionUnavailableException with a retry-after hint;
+    a send cancelled by its caller is not held against the venue.
+    """
+
+    def __init__(self, inner: ITradeExecutor, timeout: float = 5.0, max_in_flight: int = 32,
+                 failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 key: Callable[[Trade], Hashable] = by_counterparty) -> None:
+        self._inner = inner
+        self._timeout = timeout
+        self._max_in_flight = max_in_flight
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._key = key
+        self._venues: dict[Hashable, _Venue] = {}
+
+    def _venue(self, key: Hashable) -> _Venue:
+        venue = self._venues.get(key)
+        if venue is None:
+            venue = self._venues[key] = _Venue(CircuitBreaker(self._failure_threshold, self._reset_timeout),
+                                               Bulkhead(self._max_in_flight))
+        return venue
+
+    async def send(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
+        await token.throw_if_cancellation_requested()
+        key = self._key(trade)
+        venue = self._venue(key)
+        if not venue.breaker.allow():
+            raise ExecutionUnavailableException(f"Venue for '{key}' is unavailable (circuit open).",
+                                                venue.breaker.retry_after)
+        try:
+            with venue.bulkhead.enter():
+                receipt = await self._send_within_deadline(trade, token)
+        except BulkheadFullError:
+            venue.breaker.record_abandoned()
+            raise ExecutionUnavailableException(
+                f"Venue for '{key}' is saturated ({self._max_in_flight} sends in flight).", 1.0)
+        except Exception as ex:
+            venue.breaker.record_failure()
+            logging.warning("ResilientTradeExecutor: send of trade %s to '%s' failed: %r", trade.trade_id, key, ex)
+            raise ExecutionUnavailableException(f"Venue for '{key}' failed: {ex}",
+                                                venue.breaker.retry_after) from ex
+        except BaseException:
+            venue.breaker.record_abandoned()
+            raise
+        venue.breaker.record_success()
+        return receipt
+
+    async def _send_within_deadline(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
+        deadline = None
+        try:
+            async with cancellation_scope(self._timeout) as deadline:
+                return await self._inner.send(trade, token)
+        except asyncio.CancelledError:
+            if deadline is not None and deadline.is_cancellation_requested() and not token.is_cancellation_requested():
+                raise TimeoutError(f"no answer within {self._timeout}s") from None
+            raise
+
+    def stats(self) -> dict[str, CircuitStats]:
+        return {str(key): venue.breaker.stats() for key, venue in self._venues.items()}
@@ -0,0 +1,58 @@
+import asyncio
+
+from trading_approval_process.application.interfaces.i_trade_executor import ITradeExecutor
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.infrastructure.executor.venue_connection_pool import VenueConnectionPool
+from trading_approval_process.infrastructure.executor.venue_protocol import VenueAddress, trade_to_wire
+from trading_approval_process.infrastructure.reository import trade_codec as codec
+
+
+class TcpTradeExecutor(ITradeExecutor):
+    """
+    Executor for venues speaking the venue protocol (see venue_protocol) over TCP.
+
+    Trades are routed by counterparty, to `default_venue` unless `venues` names another,
+    and every venue has its own VenueConnectionPool. `send_many` submits each venue's share
+    of the trades as one request.
+    """
+
+    def __init__(self, default_venue: VenueAddress, venues: dict[str, VenueAddress] | None = None,
+                 pool_size: int = 4) -> None:
+        self._default_venue = default_venue
+        self._venues = dict(venues or {})
+        self._pool_size = pool_size
+        self._pools: dict[VenueAddress, VenueConnectionPool] = {}
+
+    def pool(self, venue: VenueAddress) -> VenueConnectionPool:
+        pool = self._pools.get(venue)
+        if pool is None:
+            pool = self._pools[venue] = VenueConnectionPool(venue, self._pool_size)
+        return pool
+
+    def venue_of(self, trade: Trade) -> VenueAddress:
+        return self._venues.get(trade.details.counterparty, self._default_venue)
+
+    async def send(self, trade: Trade, token: CancellationToken) -> ExecutionReceipt:
+        return (await self.send_many([trade], token))[0]
+
+    async def send_many(self, trades: list[Trade], token: CancellationToken) -> list[ExecutionReceipt]:
+        await token.throw_if_cancellation_requested()
+        routed: dict[VenueAddress, list[int]] = {}
+        for position, trade in enumerate(trades):
+            routed.setdefault(self.venue_of(trade), []).append(position)
+
+        receipts: list[ExecutionReceipt | None] = [None] * len(trades)
+
+        async def submit(venue: VenueAddress, positions: list[int]) -> None:
+            wire = await self.pool(venue).request([trade_to_wire(trades[position]) for position in positions])
+            for position, receipt in zip(positions, wire):
+                receipts[position] = codec.receipt_from_dict(receipt)
+
+        await asyncio.gather(*(submit(venue, positions) for venue, positions in routed.items()))
+        return receipts
+
+    async def close(self) -> None:
+        for pool in self._pools.values():
+            await pool.close()
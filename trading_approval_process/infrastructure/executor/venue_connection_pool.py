@@ -0,0 +1,67 @@
+import asyncio
+from itertools import count
+from typing import Any
+
+from trading_approval_process.infrastructure.executor.venue_protocol import (
+    MAX_MESSAGE_BYTES, VenueAddress, read_message, write_message)
+
+
+class _Connection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class VenueConnectionPool:
+    """
+    Persistent connections to one venue.
+
+    - At most `size` connections, each carrying one request at a time; callers beyond
+      that wait for a connection to come back.
+    - Connections are opened on demand and kept for reuse. One that fails mid-request is
+      discarded, and the next request opens a fresh one.
+    """
+
+    def __init__(self, venue: VenueAddress, size: int = 4) -> None:
+        if size < 1:
+            raise ValueError("size must be positive")
+        self.venue = venue
+        self._slots = asyncio.Semaphore(size)
+        self._idle: list[_Connection] = []
+        self._ids = count(1)
+        self.opened = 0
+
+    async def request(self, trades: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send one batch of wire trades and return their wire receipts."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._open()
+            try:
+                message_id = next(self._ids)
+                await write_message(connection.writer, {"id": message_id, "trades": trades})
+                response = await read_message(connection.reader)
+            except BaseException:
+                connection.close()
+                raise
+            if response is None or response.get("id") != message_id:
+                connection.close()
+                raise ConnectionError(f"Venue {self.venue.name} closed the connection or answered out of turn")
+            self._idle.append(connection)
+        receipts = response["receipts"]
+        if len(receipts) != len(trades):
+            raise ConnectionError(f"Venue {self.venue.name} answered {len(receipts)} receipts for {len(trades)} trades")
+        return receipts
+
+    async def _open(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self.venue.host, self.venue.port, limit=MAX_MESSAGE_BYTES)
+        self.opened += 1
+        return _Connection(reader, writer)
+
+    async def close(self) -> None:
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
@@ -0,0 +1,39 @@
+"""
+Wire protocol of the execution venues: one JSON document per line over TCP.
+
+    request:  {"id": 7, "trades": [{"trade_id": "...", "version": 5, "details": {...}}, ...]}
+    response: {"id": 7, "receipts": [{"ticket_id": "...", "sent_at": "...", "venue": "...", ...}, ...]}
+
+A response carries one receipt per trade of its request, in the same order. A venue
+derives the ticket id from the trade id and version, so a re-sent trade is recognised.
+"""
+import asyncio
+import json
+from typing import Any, NamedTuple
+
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.infrastructure.reository import trade_codec as codec
+
+# Lines longer than this are rejected by the readers: 1,000 trades fit comfortably.
+MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+
+
+class VenueAddress(NamedTuple):
+    name: str
+    host: str
+    port: int
+
+
+def trade_to_wire(trade: Trade) -> dict[str, Any]:
+    return {"trade_id": str(trade.trade_id), "version": trade.version, "details": codec.details_to_dict(trade.details)}
+
+
+async def write_message(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader) -> dict[str, Any] | None:
+    """The next message, or None once the peer closed the connection."""
+    line = await reader.readline()
+    return json.loads(line) if line else None
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from datetime import UTC, datetime
+
+from trading_approval_process.infrastructure.executor.venue_protocol import (
+    MAX_MESSAGE_BYTES, read_message, write_message)
+
+
+class StandInVenueServer:
+    """
+    Local stand-in for an execution venue, for tests, benchmarks and development.
+
+    Answers every request of the venue protocol after `latency` seconds, with one SENT
+    receipt per trade; requests on one connection are answered in order, connections
+    are served concurrently.
+    """
+
+    def __init__(self, name: str = "STANDIN", latency: float = 0.0) -> None:
+        self.name = name
+        self.latency = latency
+        self.connections = 0
+        self.requests = 0
+        self.trades = 0
+        self._server: asyncio.Server | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening and return the bound port (an ephemeral one by default)."""
+        self._server = await asyncio.start_server(self._serve, host, port, limit=MAX_MESSAGE_BYTES)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening and drop the open connections, as a venue going down would."""
+        if self._server is not None:
+            self._server.close()
+            for handler in self._handlers:
+                handler.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while (request := await read_message(reader)) is not None:
+                self.requests += 1
+                self.trades += len(request["trades"])
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                sent_at = datetime.now(UTC).isoformat()
+                await write_message(writer, {"id": request["id"], "receipts": [{
+                    "ticket_id": f"{self.name}-{trade['trade_id']}-{trade['version']}",
+                    "sent_at": sent_at,
+                    "venue": self.name,
+                    "status": "SENT",
+                    "notes": "Accepted by stand-in venue",
+                } for trade in request["trades"]]})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        except Exception:
+            logging.exception("StandInVenueServer: dropping a connection.")
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
@@ -0,0 +1,87 @@
+import sqlite3
+import threading
+import time
+
+from limits.storage import Storage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    key        TEXT PRIMARY KEY,
+    count      INTEGER NOT NULL,
+    expires_at REAL    NOT NULL
+) WITHOUT ROWID;
+"""
+
+# One statement per increment: a window that has expired restarts instead of accumulating.
+_INCREMENT = """
+INSERT INTO rate_limits (key, count, expires_at) VALUES (:key, :amount, :now + :expiry)
+ON CONFLICT (key) DO UPDATE SET
+    count      = CASE WHEN expires_at <= :now THEN :amount ELSE count + :amount END,
+    expires_at = CASE WHEN expires_at <= :now THEN :now + :expiry ELSE expires_at END
+RETURNING count
+"""
+_SELECT_COUNT = "SELECT count FROM rate_limits WHERE key = ? AND expires_at > ?"
+_SELECT_EXPIRY = "SELECT expires_at FROM rate_limits WHERE key = ? AND expires_at > ?"
+
+
+class SqliteRateLimitStorage(Storage):
+    """
+    Rate limit counters in a SQLite file, shared by every process that opens it.
+
+    Registered with `limits` for `sqlite:///<path>` storage URIs, so a rate limiter
+    configured with one keeps a single count per client across all workers. Supports the
+    fixed-window strategy. Each check is one short statement on a WAL connection, serialised
+    by a lock so that it can be made from any thread (the API makes it off the event loop).
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(self, uri: str, wrap_exceptions: bool = False, busy_timeout_ms: int = 5000, **options) -> None:
+        self._path = uri.partition("://")[2]
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._connection.executescript(_SCHEMA)
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return sqlite3.Error
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        with self._lock:
+            return self._connection.execute(
+                _INCREMENT, {"key": key, "amount": amount, "expiry": expiry, "now": time.time()}).fetchone()[0]
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            row = self._connection.execute(_SELECT_COUNT, (key, time.time())).fetchone()
+        return row[0] if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(_SELECT_EXPIRY, (key, now)).fetchone()
+        return row[0] if row else now
+
+    def check(self) -> bool:
+        try:
+            with self._lock:
+                self._connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def reset(self) -> int:
+        with self._lock:
+            return self._connection.execute("DELETE FROM rate_limits").rowcount
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
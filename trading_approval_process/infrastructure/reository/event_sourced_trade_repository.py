@@ -0,0 +1,315 @@
+import asyncio
+import json
+import uuid
+from bisect import bisect_left
+from datetime import date, datetime
+from pathlib import Path
+from typing import AsyncIterator
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery, indexed_values
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure.reository import trade_codec as codec
+from trading_approval_process.infrastructure.reository.segmented_log import LogLocation, SegmentedLog
+from trading_approval_process.infrastructure.reository.trade_index import TradeIndex
+
+
+class _Stream:
+    """Index entry of one trade: its version, latest snapshot (and its version) and the events written since."""
+
+    __slots__ = ("version", "snapshot", "snapshot_version", "events")
+
+    def __init__(self) -> None:
+        self.version: int = 0
+        self.snapshot: LogLocation | None = None
+        self.snapshot_version: int = 0
+        self.events: tuple[LogLocation, ...] = ()
+
+
+class EventSourcedTradeRepository(ITradeRepository):
+    """
+    Event-sourced repository over append-only segmented log files.
+
+    - Each save appends only the audit records added since the stored version, one event
+      per record; the last event of a save also carries the header fields (requester,
+      approver, receipt, confirmation) that audit records do not hold.
+    - Every `snapshot_every` versions a snapshot is written to a snapshot log: the header
+      and details, the audit records since the previous snapshot and a link to it. The
+      snapshots of a trade form a chain holding its trail once, so the logs grow, and
+      recovery scans, linearly with the records saved. The price is on reads: `get_by_id`
+      follows the chain (one read per `snapshot_every` versions) and replays fewer than
+      `snapshot_every` events, rather than reading one snapshot of the whole trail.
+    - Opening the directory rebuilds the in-memory stream and secondary indexes by scanning
+      both logs.
+    """
+
+    def __init__(self, directory: str, snapshot_every: int = 16, segment_size: int = 64 * 1024 * 1024,
+                 fsync: bool = False) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be positive")
+        root = Path(directory)
+        self._snapshot_every = snapshot_every
+        self._events = SegmentedLog(root, "events", segment_size, fsync)
+        self._snapshots = SegmentedLog(root, "snapshots", segment_size, fsync)
+        self._streams: dict[str, _Stream] = {}
+        self._index = TradeIndex()
+        self._write_lock = asyncio.Lock()
+        self._recover()
+
+    # ---------------------------
+    # ITradeRepository
+    # ---------------------------
+    async def add(self, trade: Trade, token: CancellationToken) -> Trade:
+        await token.throw_if_cancellation_requested()
+        key = str(trade.trade_id)
+        async with self._write_lock:
+            if key in self._streams:
+                raise ValueError(f"Trade with id {trade.trade_id} already exists")
+            stream = _Stream()
+            await self._append(stream, trade, trade.audit)
+            self._streams[key] = stream
+        return trade
+
+    async def get_by_id(self, trade_id: str, token: CancellationToken) -> Trade:
+        await token.throw_if_cancellation_requested()
+        stream = self._streams.get(str(trade_id))
+        if stream is None:
+            raise NotFoundException(f"Trade {trade_id} not found")
+        # Capture the locations now; a concurrent save replaces them rather than mutating them.
+        return await asyncio.to_thread(self._replay, stream.snapshot, stream.events)
+
+    async def update(self, trade: Trade, token: CancellationToken) -> None:
+        await token.throw_if_cancellation_requested()
+        async with self._write_lock:
+            stream = self._streams.get(str(trade.trade_id))
+            if stream is None:
+                raise NotFoundException(f"Trade {trade.trade_id} not found")
+            if stream.version != trade.version - 1:
+                raise ConcurrencyException(
+                    f"Trade {trade.trade_id} version mismatch. "
+                    f"Expected {trade.version - 1}, found {stream.version}"
+                )
+            await self._append(stream, trade, trade.audit[stream.version:])
+
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        await token.throw_if_cancellation_requested()
+        keys = [str(trade.trade_id) for trade in trades]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Batch contains duplicate trade ids")
+        async with self._write_lock:
+            for trade, key in zip(trades, keys):
+                if key in self._streams:
+                    raise ValueError(f"Trade with id {trade.trade_id} already exists")
+            streams = [_Stream() for _ in trades]
+            await self._append_many([(stream, trade, trade.audit) for stream, trade in zip(streams, trades)])
+            self._streams.update(zip(keys, streams))
+        return trades
+
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        await token.throw_if_cancellation_requested()
+        streams = [self._streams.get(str(trade_id)) for trade_id in trade_ids]
+        locations = [(stream.snapshot, stream.events) for stream in streams if stream is not None]
+        replayed = iter(await asyncio.to_thread(
+            lambda: [self._replay(snapshot, events) for snapshot, events in locations]))
+        return [next(replayed) if stream is not None else None for stream in streams]
+
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        await token.throw_if_cancellation_requested()
+        keys = [str(trade.trade_id) for trade in trades]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Batch contains duplicate trade ids")
+        async with self._write_lock:
+            batch = []
+            for trade, key in zip(trades, keys):
+                stream = self._streams.get(key)
+                if stream is None:
+                    raise NotFoundException(f"Trade {trade.trade_id} not found")
+                if stream.version != trade.version - 1:
+                    raise ConcurrencyException(
+                        f"Trade {trade.trade_id} version mismatch. "
+                        f"Expected {trade.version - 1}, found {stream.version}"
+                    )
+                batch.append((stream, trade, trade.audit[stream.version:]))
+            await self._append_many(batch)
+
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        await token.throw_if_cancellation_requested()
+        keys, next_cursor = self._index.query(query)
+        locations = [(self._streams[key].snapshot, self._streams[key].events) for key in keys]
+        trades = await asyncio.to_thread(
+            lambda: [self._replay(snapshot, events) for snapshot, events in locations])
+        return TradePage(trades, next_cursor)
+
+    async def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        # A trade is replayed whole (its trail is spread over the snapshot chain), so memory
+        # is bounded by the longest trail rather than by the export.
+        trade = await self.get_by_id(trade_id, token)
+        for record in trade.audit:
+            yield record
+
+    async def export_audit(self, start: datetime | None, end: datetime | None,
+                           token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        for key in self._index.keys():
+            await token.throw_if_cancellation_requested()
+            stream = self._streams[key]
+            trade = await asyncio.to_thread(self._replay, stream.snapshot, stream.events)
+            # Records are appended in time order, so the range is found by bisection.
+            first = bisect_left(trade.audit, start, key=lambda record: record.timestamp) if start is not None else 0
+            for position in range(first, len(trade.audit)):
+                record = trade.audit[position]
+                if end is not None and record.timestamp >= end:
+                    break
+                yield trade.trade_id, record
+
+    async def close(self) -> None:
+        async with self._write_lock:
+            self._events.close()
+            self._snapshots.close()
+
+    # ---------------------------
+    # Write path
+    # ---------------------------
+    async def _append(self, stream: _Stream, trade: Trade, records: list[AuditRecord]) -> None:
+        await self._append_many([(stream, trade, records)])
+
+    async def _append_many(self, batch: list[tuple[_Stream, Trade, list[AuditRecord]]]) -> None:
+        """Write the events of every trade in one append, then snapshot those crossing a boundary."""
+        if not batch:
+            return
+        entries: list[bytes] = []
+        spans: list[tuple[int, int]] = []
+        for stream, trade, records in batch:
+            start = len(entries)
+            entries.extend(self._encode_event(trade, record, header=None) for record in records[:-1])
+            entries.append(self._encode_event(trade, records[-1], header=codec.header_to_dict(trade)))
+            spans.append((start, len(entries)))
+        locations = await asyncio.to_thread(self._events.append, entries)
+
+        due = [(stream, trade) for stream, trade, _ in batch
+               if trade.version // self._snapshot_every > stream.version // self._snapshot_every]
+        snapshots = [self._encode_snapshot(stream, trade) for stream, trade in due]
+        snapshot_locations = await asyncio.to_thread(self._snapshots.append, snapshots) if snapshots else []
+        snapshotted = {id(stream): location for (stream, _), location in zip(due, snapshot_locations)}
+
+        for (stream, trade, _), (start, end) in zip(batch, spans):
+            if id(stream) in snapshotted:
+                stream.snapshot = snapshotted[id(stream)]
+                stream.snapshot_version = trade.version
+                stream.events = ()
+            else:
+                stream.events = stream.events + tuple(locations[start:end])
+            stream.version = trade.version
+            self._index.put(str(trade.trade_id), indexed_values(trade))
+
+    @staticmethod
+    def _encode_snapshot(stream: _Stream, trade: Trade) -> bytes:
+        # Only the records since the previous snapshot, which the link leads back to.
+        snapshot = {**codec.trade_to_dict(trade),
+                    "audit": [codec.audit_to_dict(record) for record in trade.audit[stream.snapshot_version:]],
+                    "previous": stream.snapshot}
+        return json.dumps(snapshot, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _encode_event(trade: Trade, record: AuditRecord, header: dict | None) -> bytes:
+        event = {"trade_id": str(trade.trade_id), "record": codec.audit_to_dict(record), "header": header}
+        return json.dumps(event, separators=(",", ":")).encode()
+
+    # ---------------------------
+    # Read path (worker thread)
+    # ---------------------------
+    def _replay(self, snapshot: LogLocation | None, events: tuple[LogLocation, ...]) -> Trade:
+        trade: Trade | None = None
+        if snapshot is not None:
+            trade = codec.trade_from_dict(self._read_snapshot_chain(snapshot))
+        for location in events:
+            event = json.loads(self._events.read(location))
+            if trade is None:
+                trade = Trade(uuid.UUID(event["trade_id"]))
+            self._apply(trade, event)
+        return trade
+
+    def _read_snapshot_chain(self, location: LogLocation) -> dict:
+        """The latest snapshot, with the records of every earlier one joined into its trail."""
+        latest = json.loads(self._snapshots.read(location))
+        chunks = [latest["audit"]]
+        previous = latest.get("previous")
+        while previous is not None:
+            data = json.loads(self._snapshots.read(LogLocation(*previous)))
+            chunks.append(data["audit"])
+            previous = data.get("previous")
+        return {**latest, "audit": [record for chunk in reversed(chunks) for record in chunk]}
+
+    @staticmethod
+    def _apply(trade: Trade, event: dict) -> None:
+        data = event["record"]
+        previous = trade.audit[-1] if trade.audit else None
+        reuse = previous and previous.details and codec.details_to_dict(previous.details) == data["details"]
+        record = codec.audit_from_dict(data, previous.details if reuse else None)
+
+        trade.version = record.step
+        trade.state_before = record.state_before
+        trade.state = record.state_after
+        trade.details = record.details
+        trade.audit.append(record)
+        if event["header"] is not None:
+            codec.apply_header(trade, event["header"])
+
+    # ---------------------------
+    # Recovery
+    # ---------------------------
+    def _recover(self) -> None:
+        # Latest committed state of each trade, enough to rebuild the secondary indexes.
+        latest: dict[str, dict] = {}
+        for location, entry in self._snapshots.scan():
+            data = json.loads(entry)
+            stream = self._streams.setdefault(data["trade_id"], _Stream())
+            stream.snapshot, stream.version = location, data["version"]
+            stream.snapshot_version = data["version"]
+            latest[data["trade_id"]] = data
+
+        # A save is committed once its header-bearing last event is on disk; events of a
+        # save cut short by a crash are left out of the index.
+        pending: dict[str, list[LogLocation]] = {}
+        created: dict[str, None] = {}  # creation order: first event of each trade in the log
+        for location, entry in self._events.scan():
+            event = json.loads(entry)
+            key, step = event["trade_id"], event["record"]["step"]
+            created.setdefault(key)
+            stream = self._streams.setdefault(key, _Stream())
+            if step <= stream.version:
+                continue  # already folded into the latest snapshot
+            batch = pending.setdefault(key, [])
+            if step != stream.version + len(batch) + 1:
+                batch.clear()  # a retried save supersedes an uncommitted one
+            batch.append(location)
+            if event["header"] is not None:
+                stream.events = stream.events + tuple(batch)
+                stream.version = step
+                batch.clear()
+                record = event["record"]
+                latest[key] = {"state": record["state_after"], "details": record["details"], **event["header"]}
+
+        # Trades whose only save never committed do not exist.
+        for key in [key for key, stream in self._streams.items() if stream.version == 0]:
+            del self._streams[key]
+
+        for key in created:
+            if key in self._streams:
+                self._index.put(key, self._recovered_values(latest[key]))
+
+    @staticmethod
+    def _recovered_values(data: dict) -> dict[str, object]:
+        details = data["details"]
+        return {
+            "state": TradeState[data["state"]],
+            "requester": data["requester"],
+            "approver": data["approver"],
+            "counterparty": details["counterparty"] if details else None,
+            "notional_currency": details["notional_currency"] if details else None,
+            "trade_date": date.fromisoformat(details["trade_date"]) if details else None,
+        }
@@ -1,28 +1,40 @@
 import asyncio
+import uuid
 import copy
-from typing import Dict
+from bisect import bisect_left
+from datetime import datetime
+from typing import AsyncIterator, Dict
 
 from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
 from trading_approval_process.core.cancellation_token import CancellationToken
 from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.audit_record import AuditRecord
 from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery, indexed_values
+from trading_approval_process.infrastructure.reository.trade_index import TradeIndex
 from trading_approval_process.domain.exceptions import NotFoundException
 
 
+# Records yielded between two returns to the event loop when streaming a trail.
+STREAM_BATCH_SIZE = 500
+
+
 class InMemoryTradeRepository(ITradeRepository):
     """Thread-unsafe in-memory repository for testing and prototyping."""
 
     def __init__(self) -> None:
         self._store: Dict[str, Trade] = {}
+        self._index = TradeIndex()
 
     async def add(self, trade: Trade, token: CancellationToken) -> Trade:
+        # A cancelled save stores nothing: the check runs before any write, with no await after it.
+        await asyncio.sleep(0)
+        await token.throw_if_cancellation_requested()
         if trade.trade_id in self._store:
             raise ValueError(f"Trade with id {trade.trade_id} already exists")
         # store a safe cloned snapshot
         self._store[trade.trade_id] = self._clone_trade(trade)
-        await asyncio.sleep(0)
-        await token.throw_if_cancellation_requested()
-
+        self._index.put(trade.trade_id, indexed_values(trade))
         return trade
 
     async def get_by_id(self, trade_id: str, token: CancellationToken) -> Trade:
@@ -35,6 +47,8 @@ class InMemoryTradeRepository(ITradeRepository):
         return trade
 
     async def update(self, trade: Trade, token: CancellationToken) -> None:
+        await asyncio.sleep(0)
+        await token.throw_if_cancellation_requested()
         if trade.trade_id not in self._store:
             raise NotFoundException(f"Trade {trade.trade_id} not found")
 
@@ -47,15 +61,91 @@ class InMemoryTradeRepository(ITradeRepository):
 
         # replace snapshot with a cloned version
         self._store[trade.trade_id] = self._clone_trade(trade)
+        self._index.put(trade.trade_id, indexed_values(trade))
+
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        await asyncio.sleep(0)
+        await token.throw_if_cancellation_requested()
+        ids = [trade.trade_id for trade in trades]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Batch contains duplicate trade ids")
+        for trade in trades:
+            if trade.trade_id in self._store:
+                raise ValueError(f"Trade with id {trade.trade_id} already exists")
+        # all checks pass before anything is stored
+        for trade in trades:
+            self._store[trade.trade_id] = self._clone_trade(trade)
+            self._index.put(trade.trade_id, indexed_values(trade))
+        return trades
+
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        trades = [self._clone_trade(self._store[trade_id]) if trade_id in self._store else None
+                  for trade_id in trade_ids]
         await asyncio.sleep(0)
-        token.throw_if_cancellation_requested()
+        await token.throw_if_cancellation_requested()
+        return trades
+
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        await asyncio.sleep(0)
+        await token.throw_if_cancellation_requested()
+        ids = [trade.trade_id for trade in trades]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Batch contains duplicate trade ids")
+        for trade in trades:
+            if trade.trade_id not in self._store:
+                raise NotFoundException(f"Trade {trade.trade_id} not found")
+            existing = self._store[trade.trade_id]
+            if existing.version != trade.version - 1:
+                raise ConcurrencyException(
+                    f"Trade {trade.trade_id} version mismatch. "
+                    f"Expected {trade.version - 1}, found {existing.version}"
+                )
+
+        # all checks pass before anything is replaced
+        for trade in trades:
+            self._store[trade.trade_id] = self._clone_trade(trade)
+            self._index.put(trade.trade_id, indexed_values(trade))
+
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        keys, next_cursor = self._index.query(query)
+        page = TradePage([self._clone_trade(self._store[key]) for key in keys], next_cursor)
+        await asyncio.sleep(0)
+        await token.throw_if_cancellation_requested()
+        return page
+
+    async def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        if trade_id not in self._store:
+            raise NotFoundException(f"Trade {trade_id} not found")
+        # The forked trail is a fixed view: later saves of the trade do not show up in it.
+        trail = self._store[trade_id].audit.fork()
+        for start in range(0, len(trail), STREAM_BATCH_SIZE):
+            await token.throw_if_cancellation_requested()
+            for record in trail[start:start + STREAM_BATCH_SIZE]:
+                yield record
+            await asyncio.sleep(0)
+
+    async def export_audit(self, start: datetime | None, end: datetime | None,
+                           token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        for trade_id in self._index.keys():
+            await token.throw_if_cancellation_requested()
+            trail = self._store[trade_id].audit.fork()
+            # Records are appended in time order, so the range is found by bisection.
+            first = bisect_left(trail, start, key=lambda record: record.timestamp) if start is not None else 0
+            for position in range(first, len(trail)):
+                record = trail[position]
+                if end is not None and record.timestamp >= end:
+                    break
+                yield trade_id, record
+            await asyncio.sleep(0)
 
     def _clone_trade(self, trade: Trade) -> Trade:
-        """Create a safe shallow copy of Trade, excluding immutable MappingProxyType fields."""
+        """
+        Create an isolated snapshot of a Trade in O(1) regardless of its audit length.
+
+        Only the mutable scalar header is copied. Details, receipt, confirmation and audit
+        records are frozen dataclasses and are shared; the audit trail is forked, so later
+        appends on either side are invisible to the other.
+        """
         clone = copy.copy(trade)
-        # Deepcopy only mutable fields
-        clone.details = copy.deepcopy(trade.details)
-        clone.audit = copy.deepcopy(trade.audit)
-        clone.execution_receipt = copy.deepcopy(trade.execution_receipt)
-        clone.execution_confirmation = copy.deepcopy(trade.execution_confirmation)
+        clone.audit = trade.audit.fork()
         return clone
@@ -0,0 +1,67 @@
+import uuid
+from datetime import datetime
+from typing import AsyncIterator
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.core.instrumentation import instrumentation
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
+
+
+class InstrumentedTradeRepository(ITradeRepository):
+    """
+    Repository decorator timing every call as a `repository.<method>` span.
+
+    Audit streams are passed through untimed: they are read at the consumer's pace, so their
+    lifetime says more about the reader than about the store.
+    """
+
+    def __init__(self, inner: ITradeRepository) -> None:
+        self._inner = inner
+
+    @property
+    def inner(self) -> ITradeRepository:
+        return self._inner
+
+    async def add(self, trade: Trade, token: CancellationToken) -> Trade:
+        with instrumentation.span("repository.add"):
+            return await self._inner.add(trade, token)
+
+    async def update(self, trade: Trade, token: CancellationToken) -> Trade:
+        with instrumentation.span("repository.update"):
+            return await self._inner.update(trade, token)
+
+    async def get_by_id(self, trade_id: str, token: CancellationToken) -> Trade:
+        with instrumentation.span("repository.get_by_id"):
+            return await self._inner.get_by_id(trade_id, token)
+
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        with instrumentation.span("repository.add_many", trades=len(trades)):
+            return await self._inner.add_many(trades, token)
+
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        with instrumentation.span("repository.update_many", trades=len(trades)):
+            await self._inner.update_many(trades, token)
+
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        with instrumentation.span("repository.get_many", trades=len(trade_ids)):
+            return await self._inner.get_many(trade_ids, token)
+
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        with instrumentation.span("repository.query", limit=query.limit):
+            return await self._inner.query(query, token)
+
+    def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        return self._inner.stream_audit(trade_id, token)
+
+    def export_audit(self, start: datetime | None, end: datetime | None,
+                     token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        return self._inner.export_audit(start, end, token)
+
+    async def close(self) -> None:
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            await close()
+
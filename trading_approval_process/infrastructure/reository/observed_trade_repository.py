@@ -0,0 +1,83 @@
+import logging
+import uuid
+from datetime import datetime
+from typing import AsyncIterator
+
+from trading_approval_process.application.interfaces.i_trade_listener import ITradeListener
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
+
+
+class ObservedTradeRepository(ITradeRepository):
+    """
+    Repository decorator that notifies listeners of every committed save.
+
+    Listeners run synchronously right after the inner repository accepted the write and
+    before the caller resumes, so derived views follow the store exactly: a rejected save
+    (conflict, duplicate, not found) notifies nobody. So does a save whose token is cancelled,
+    which every store refuses before writing anything.
+    """
+
+    def __init__(self, inner: ITradeRepository, listeners: list[ITradeListener] | None = None) -> None:
+        self._inner = inner
+        self._listeners: list[ITradeListener] = list(listeners or [])
+
+    @property
+    def inner(self) -> ITradeRepository:
+        return self._inner
+
+    def subscribe(self, listener: ITradeListener) -> None:
+        self._listeners.append(listener)
+
+    # ---------------------------
+    # ITradeRepository
+    # ---------------------------
+    async def add(self, trade: Trade, token: CancellationToken) -> Trade:
+        result = await self._inner.add(trade, token)
+        self._notify([trade])
+        return result
+
+    async def update(self, trade: Trade, token: CancellationToken) -> None:
+        await self._inner.update(trade, token)
+        self._notify([trade])
+
+    async def get_by_id(self, trade_id: str, token: CancellationToken) -> Trade:
+        return await self._inner.get_by_id(trade_id, token)
+
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        result = await self._inner.add_many(trades, token)
+        self._notify(trades)
+        return result
+
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        await self._inner.update_many(trades, token)
+        self._notify(trades)
+
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        return await self._inner.get_many(trade_ids, token)
+
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        return await self._inner.query(query, token)
+
+    def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        return self._inner.stream_audit(trade_id, token)
+
+    def export_audit(self, start: datetime | None, end: datetime | None,
+                     token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        return self._inner.export_audit(start, end, token)
+
+    async def close(self) -> None:
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            await close()
+
+    def _notify(self, trades: list[Trade]) -> None:
+        for listener in self._listeners:
+            try:
+                listener.on_saved(trades)
+            except Exception:
+                # The save is committed; one faulty view must not fail it or starve the others.
+                logging.exception("ObservedTradeRepository: listener %r failed.", listener)
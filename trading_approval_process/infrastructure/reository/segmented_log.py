@@ -0,0 +1,124 @@
+import os
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple
+
+
+class LogLocation(NamedTuple):
+    """Position of one entry inside a segmented log."""
+    segment: int
+    offset: int
+    length: int
+
+
+class SegmentedLog:
+    """
+    Append-only, newline-delimited log split into fixed-size segment files.
+
+    - Appends go to the newest segment; a new one is started once it exceeds `segment_size`.
+    - Entries are addressed by `LogLocation` and read back with positional reads.
+    - `scan()` replays every complete entry in order and truncates a torn trailing write,
+      which is all that crash recovery needs.
+    Blocking: call from a worker thread. Appends must be serialised by the caller.
+    """
+
+    def __init__(self, directory: Path, prefix: str, segment_size: int = 64 * 1024 * 1024, fsync: bool = False) -> None:
+        self._directory = directory
+        self._prefix = prefix
+        self._segment_size = segment_size
+        self._fsync = fsync
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        self._read_lock = threading.Lock()
+        self._readers: dict[int, BinaryIO] = {}
+        self._writer: BinaryIO | None = None
+        self._segment = max(self._segments(), default=1)
+        self._size = self._path(self._segment).stat().st_size if self._path(self._segment).exists() else 0
+
+    # ---------------------------
+    # Write path
+    # ---------------------------
+    def append(self, entries: list[bytes]) -> list[LogLocation]:
+        """Append entries (without trailing newline) with a single write; return their locations."""
+        if self._size >= self._segment_size:
+            self._roll()
+        writer = self._open_writer()
+
+        locations, offset = [], self._size
+        for entry in entries:
+            locations.append(LogLocation(self._segment, offset, len(entry)))
+            offset += len(entry) + 1
+        writer.write(b"".join(entry + b"\n" for entry in entries))
+        writer.flush()
+        if self._fsync:
+            os.fsync(writer.fileno())
+        self._size = offset
+        return locations
+
+    def _roll(self) -> None:
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        self._segment += 1
+        self._size = 0
+
+    def _open_writer(self) -> BinaryIO:
+        if self._writer is None:
+            self._writer = open(self._path(self._segment), "ab")
+        return self._writer
+
+    # ---------------------------
+    # Read path
+    # ---------------------------
+    def read(self, location: LogLocation) -> bytes:
+        reader = self._reader(location.segment)
+        if hasattr(os, "pread"):
+            return os.pread(reader.fileno(), location.length, location.offset)
+        with self._read_lock:
+            reader.seek(location.offset)
+            return reader.read(location.length)
+
+    def scan(self) -> Iterator[tuple[LogLocation, bytes]]:
+        """Yield every complete entry in append order, dropping a torn trailing write."""
+        for segment in sorted(self._segments()):
+            path = self._path(segment)
+            data = path.read_bytes()
+            offset = 0
+            while offset < len(data):
+                end = data.find(b"\n", offset)
+                if end == -1:
+                    # Partial entry from a crash mid-write: cut it off so appends stay aligned.
+                    with open(path, "r+b") as file:
+                        file.truncate(offset)
+                    if segment == self._segment:
+                        self._size = offset
+                    break
+                yield LogLocation(segment, offset, end - offset), data[offset:end]
+                offset = end + 1
+
+    def _reader(self, segment: int) -> BinaryIO:
+        reader = self._readers.get(segment)
+        if reader is None:
+            with self._read_lock:
+                reader = self._readers.get(segment)
+                if reader is None:
+                    reader = open(self._path(segment), "rb")
+                    self._readers[segment] = reader
+        return reader
+
+    # ---------------------------
+    # Files
+    # ---------------------------
+    def close(self) -> None:
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def _path(self, segment: int) -> Path:
+        return self._directory / f"{self._prefix}-{segment:06d}.log"
+
+    def _segments(self) -> list[int]:
+        return [int(path.stem.rsplit("-", 1)[1]) for path in self._directory.glob(f"{self._prefix}-*.log")]
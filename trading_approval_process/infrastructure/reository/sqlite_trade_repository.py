@@ -0,0 +1,518 @@
+import asyncio
+import queue
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import AsyncIterator, Callable, Iterator, NamedTuple, TypeVar
+
+from trading_approval_process.application.interfaces.i_trade_repository import ITradeRepository
+from trading_approval_process.core.cancellation_token import CancellationToken
+from trading_approval_process.domain.exceptions import NotFoundException
+from trading_approval_process.domain.exceptions.concurent_exception import ConcurrencyException
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.audit_trail import AuditTrail
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_query import TradePage, TradeQuery
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.infrastructure.reository import trade_codec as codec
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    seq                    INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_id               TEXT    NOT NULL UNIQUE,
+    requester              TEXT,
+    approver               TEXT,
+    state                  TEXT    NOT NULL,
+    state_before           TEXT    NOT NULL,
+    version                INTEGER NOT NULL,
+    details                TEXT,
+    execution_receipt      TEXT,
+    execution_confirmation TEXT
+);
+CREATE TABLE IF NOT EXISTS audit_records (
+    trade_id     TEXT    NOT NULL,
+    step         INTEGER NOT NULL,
+    action       TEXT    NOT NULL,
+    user_id      TEXT    NOT NULL,
+    state_before TEXT    NOT NULL,
+    state_after  TEXT    NOT NULL,
+    details      TEXT,
+    timestamp    TEXT    NOT NULL,
+    notes        TEXT,
+    PRIMARY KEY (trade_id, step)
+) WITHOUT ROWID;
+-- Secondary indexes end in seq so a filtered listing is read in keyset order from the index.
+CREATE INDEX IF NOT EXISTS ix_trades_state ON trades (state, seq);
+CREATE INDEX IF NOT EXISTS ix_trades_requester ON trades (requester, seq);
+CREATE INDEX IF NOT EXISTS ix_trades_approver ON trades (approver, seq);
+CREATE INDEX IF NOT EXISTS ix_trades_counterparty ON trades (json_extract(details, '$.counterparty'), seq);
+CREATE INDEX IF NOT EXISTS ix_trades_notional_currency ON trades (json_extract(details, '$.notional_currency'), seq);
+CREATE INDEX IF NOT EXISTS ix_trades_trade_date ON trades (json_extract(details, '$.trade_date'), seq);
+-- Implicitly (timestamp, trade_id, step): an export range is read in keyset order from it.
+CREATE INDEX IF NOT EXISTS ix_audit_records_timestamp ON audit_records (timestamp);
+-- Change log for processes sharing the file (see `record_changes`): one row per saved version.
+CREATE TABLE IF NOT EXISTS trade_changes (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    trade_id    TEXT    NOT NULL,
+    version     INTEGER NOT NULL,
+    origin      TEXT    NOT NULL,
+    recorded_at REAL    NOT NULL
+);
+"""
+
+# Statements are module constants so sqlite3's per-connection statement cache reuses
+# the prepared form instead of re-parsing SQL on every call.
+_INSERT_TRADE = """
+INSERT INTO trades (trade_id, requester, approver, state, state_before, version,
+                    details, execution_receipt, execution_confirmation)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_UPDATE_TRADE = """
+UPDATE trades
+   SET requester = ?, approver = ?, state = ?, state_before = ?, version = ?,
+       details = ?, execution_receipt = ?, execution_confirmation = ?
+ WHERE trade_id = ? AND version = ?
+"""
+_INSERT_AUDIT = """
+INSERT INTO audit_records (trade_id, step, action, user_id, state_before, state_after,
+                           details, timestamp, notes)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SELECT_TRADE = """
+SELECT trade_id, requester, approver, state, state_before, version,
+       details, execution_receipt, execution_confirmation
+  FROM trades WHERE trade_id = ?
+"""
+_SELECT_AUDIT = """
+SELECT step, action, user_id, state_before, state_after, details, timestamp, notes
+  FROM audit_records WHERE trade_id = ? ORDER BY step
+"""
+_SELECT_TRADES_MANY = """
+SELECT trade_id, requester, approver, state, state_before, version,
+       details, execution_receipt, execution_confirmation
+  FROM trades WHERE trade_id IN ({marks})
+"""
+_SELECT_AUDIT_MANY = """
+SELECT trade_id, step, action, user_id, state_before, state_after, details, timestamp, notes
+  FROM audit_records WHERE trade_id IN ({marks}) ORDER BY trade_id, step
+"""
+_SELECT_AUDIT_PAGE = """
+SELECT step, action, user_id, state_before, state_after, details, timestamp, notes
+  FROM audit_records WHERE trade_id = ? AND step > ? ORDER BY step LIMIT ?
+"""
+_SELECT_AUDIT_RANGE = """
+SELECT trade_id, step, action, user_id, state_before, state_after, details, timestamp, notes
+  FROM audit_records
+ WHERE (timestamp, trade_id, step) > (?, ?, ?) AND timestamp < ?
+ ORDER BY timestamp, trade_id, step LIMIT ?
+"""
+_SELECT_VERSION = "SELECT version FROM trades WHERE trade_id = ?"
+_INSERT_CHANGE = "INSERT INTO trade_changes (trade_id, version, origin, recorded_at) VALUES (?, ?, ?, ?)"
+_SELECT_CHANGES = "SELECT seq, trade_id, version, origin FROM trade_changes WHERE seq > ? ORDER BY seq LIMIT ?"
+_SELECT_LAST_CHANGE = "SELECT COALESCE(MAX(seq), 0) FROM trade_changes"
+_DELETE_CHANGES = "DELETE FROM trade_changes WHERE recorded_at < ?"
+_SELECT_PAGE = "SELECT seq, trade_id FROM trades WHERE seq > ?{filters} ORDER BY seq LIMIT ?"
+
+# Indexed query fields and the column expressions their indexes are built on.
+_QUERY_COLUMNS = {
+    "state": "state",
+    "requester": "requester",
+    "approver": "approver",
+    "counterparty": "json_extract(details, '$.counterparty')",
+    "notional_currency": "json_extract(details, '$.notional_currency')",
+    "trade_date": "json_extract(details, '$.trade_date')",
+}
+
+# SQLite caps the number of bound parameters per statement; batched reads are chunked.
+_MAX_BATCH_PARAMETERS = 500
+
+# Audit rows read per round trip when streaming; each page is its own short read.
+_STREAM_PAGE_SIZE = 500
+
+
+class TradeChange(NamedTuple):
+    """A saved trade version, as recorded in the change log."""
+    seq: int
+    trade_id: str
+    version: int
+    origin: str  # the repository instance (i.e. process) that saved it
+
+
+class SqliteTradeRepository(ITradeRepository):
+    """
+    SQLite-backed repository.
+
+    - Trade headers and audit records live in separate tables; an update rewrites the
+      header row and appends only the new audit rows, so its cost is independent of history.
+    - Optimistic concurrency: the header UPDATE is conditional on `version = trade.version - 1`.
+    - Queries are keyset-paginated on the insertion sequence over indexes on each filter field.
+    - Blocking sqlite3 calls run in worker threads on a small pool of WAL-mode connections,
+      so readers never block the writer and the event loop never blocks on disk.
+    - With `record_changes`, every save also appends its trade versions to a change log in
+      the same transaction, tagged with this instance's `origin`, so processes sharing the
+      file can follow each other's writes (see SqliteChangeFeed).
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, busy_timeout_ms: int = 5000,
+                 record_changes: bool = False, origin: str | None = None) -> None:
+        self._path = path
+        self._busy_timeout_ms = busy_timeout_ms
+        self.record_changes = record_changes
+        self.origin = origin or uuid.uuid4().hex
+        self._pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._connections = [self._connect() for _ in range(pool_size)]
+        for connection in self._connections:
+            self._pool.put(connection)
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+
+    # ---------------------------
+    # ITradeRepository
+    # ---------------------------
+    async def add(self, trade: Trade, token: CancellationToken) -> Trade:
+        await token.throw_if_cancellation_requested()
+        await self._run(lambda connection: self._insert(connection, trade))
+        return trade
+
+    async def get_by_id(self, trade_id: str, token: CancellationToken) -> Trade:
+        await token.throw_if_cancellation_requested()
+        return await self._run(lambda connection: self._load(connection, str(trade_id)))
+
+    async def update(self, trade: Trade, token: CancellationToken) -> None:
+        await token.throw_if_cancellation_requested()
+        await self._run(lambda connection: self._update(connection, trade))
+
+    async def add_many(self, trades: list[Trade], token: CancellationToken) -> list[Trade]:
+        await token.throw_if_cancellation_requested()
+        await self._run(lambda connection: self._insert_many(connection, trades))
+        return trades
+
+    async def get_many(self, trade_ids: list[str], token: CancellationToken) -> list[Trade | None]:
+        await token.throw_if_cancellation_requested()
+        keys = [str(trade_id) for trade_id in trade_ids]
+        found = await self._run(lambda connection: self._load_many(connection, keys))
+        return [found.get(key) for key in keys]
+
+    async def update_many(self, trades: list[Trade], token: CancellationToken) -> None:
+        await token.throw_if_cancellation_requested()
+        await self._run(lambda connection: self._update_many(connection, trades))
+
+    async def query(self, query: TradeQuery, token: CancellationToken) -> TradePage:
+        await token.throw_if_cancellation_requested()
+        return await self._run(lambda connection: self._query(connection, query))
+
+    async def stream_audit(self, trade_id: str, token: CancellationToken) -> AsyncIterator[AuditRecord]:
+        key, after = str(trade_id), 0
+        while True:
+            await token.throw_if_cancellation_requested()
+            rows = await self._run(lambda connection: connection.execute(
+                _SELECT_AUDIT_PAGE, (key, after, _STREAM_PAGE_SIZE)).fetchall())
+            if not rows and after == 0:
+                raise NotFoundException(f"Trade {trade_id} not found")  # every trade has a record
+            for record in self._records_from_rows(rows):
+                yield record
+            if len(rows) < _STREAM_PAGE_SIZE:
+                return
+            after = rows[-1][0]
+
+    async def export_audit(self, start: datetime | None, end: datetime | None,
+                           token: CancellationToken) -> AsyncIterator[tuple[uuid.UUID, AuditRecord]]:
+        # Records are stored once and never rewritten, so keyset pages over the timestamp
+        # index neither skip nor repeat rows while saves go on between them.
+        after = (self._timestamp_bound(start, ""), "", 0)
+        upper = self._timestamp_bound(end, "\uffff")
+        while True:
+            await token.throw_if_cancellation_requested()
+            rows = await self._run(lambda connection: connection.execute(
+                _SELECT_AUDIT_RANGE, (*after, upper, _STREAM_PAGE_SIZE)).fetchall())
+            for trade_id, rows_of_trade in self._group_by_trade(rows):
+                for record in self._records_from_rows(rows_of_trade):
+                    yield trade_id, record
+            if len(rows) < _STREAM_PAGE_SIZE:
+                return
+            last = rows[-1]
+            after = (last[7], last[0], last[1])
+
+    # ---------------------------
+    # Change log
+    # ---------------------------
+    async def changes_after(self, seq: int, limit: int = 500) -> list[TradeChange]:
+        """Recorded changes with a sequence number above `seq`, oldest first."""
+        rows = await self._run(lambda connection: connection.execute(_SELECT_CHANGES, (seq, limit)).fetchall())
+        return [TradeChange(*row) for row in rows]
+
+    async def last_change(self) -> int:
+        """Sequence number of the latest recorded change, 0 when there is none."""
+        return await self._run(lambda connection: connection.execute(_SELECT_LAST_CHANGE).fetchone()[0])
+
+    async def prune_changes(self, older_than: float) -> int:
+        """Drop changes recorded more than `older_than` seconds ago; returns how many."""
+        cutoff = time.time() - older_than
+        return await self._run(lambda connection: connection.execute(_DELETE_CHANGES, (cutoff,)).rowcount)
+
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
+    # ---------------------------
+    # Connection pool
+    # ---------------------------
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={self._busy_timeout_ms}")
+        return connection
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection) -> Iterator[None]:
+        # IMMEDIATE takes the write lock up front, so the version check cannot go stale.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    async def _run(self, work: Callable[[sqlite3.Connection], T]) -> T:
+        def run_with_connection() -> T:
+            with self._connection() as connection:
+                return work(connection)
+        return await asyncio.to_thread(run_with_connection)
+
+    # ---------------------------
+    # Blocking operations (worker thread)
+    # ---------------------------
+    def _insert(self, connection: sqlite3.Connection, trade: Trade) -> None:
+        self._insert_many(connection, [trade])
+
+    def _insert_many(self, connection: sqlite3.Connection, trades: list[Trade]) -> None:
+        encode = _DetailsJson()
+        with self._transaction(connection):
+            try:
+                connection.executemany(_INSERT_TRADE, [
+                    (str(trade.trade_id), *self._header_values(trade, encode)) for trade in trades])
+            except sqlite3.IntegrityError:
+                existing = next((trade for trade in trades
+                                 if connection.execute(_SELECT_VERSION, (str(trade.trade_id),)).fetchone()), None)
+                raise ValueError(f"Trade with id {existing.trade_id} already exists" if existing
+                                 else "Batch contains duplicate trade ids")
+            connection.executemany(_INSERT_AUDIT, [
+                row for trade in trades for row in self._audit_rows(trade, trade.audit, encode)])
+            self._record_changes(connection, trades)
+
+    def _update(self, connection: sqlite3.Connection, trade: Trade) -> None:
+        self._update_many(connection, [trade])
+
+    def _update_many(self, connection: sqlite3.Connection, trades: list[Trade]) -> None:
+        ids = [trade.trade_id for trade in trades]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Batch contains duplicate trade ids")
+        encode = _DetailsJson()
+        with self._transaction(connection):
+            connection.execute("SAVEPOINT batch")
+            cursor = connection.executemany(_UPDATE_TRADE, [
+                (*self._header_values(trade, encode), str(trade.trade_id), trade.version - 1) for trade in trades])
+            if cursor.rowcount != len(trades):
+                # Undo the rows that did match so the stored versions can name the offender.
+                connection.execute("ROLLBACK TO batch")
+                self._raise_update_conflict(connection, trades)
+            connection.execute("RELEASE batch")
+            # Only the records appended since the stored version are written.
+            connection.executemany(_INSERT_AUDIT, [
+                row for trade in trades for row in self._audit_rows(trade, trade.audit[trade.version - 1:], encode)])
+            self._record_changes(connection, trades)
+
+    def _record_changes(self, connection: sqlite3.Connection, trades: list[Trade]) -> None:
+        if self.record_changes:
+            now = time.time()
+            connection.executemany(_INSERT_CHANGE, [
+                (str(trade.trade_id), trade.version, self.origin, now) for trade in trades])
+
+    @staticmethod
+    def _raise_update_conflict(connection: sqlite3.Connection, trades: list[Trade]) -> None:
+        """Name the first trade whose stored version is not the one it was loaded at."""
+        for trade in trades:
+            row = connection.execute(_SELECT_VERSION, (str(trade.trade_id),)).fetchone()
+            if row is None:
+                raise NotFoundException(f"Trade {trade.trade_id} not found")
+            if row[0] != trade.version - 1:
+                raise ConcurrencyException(
+                    f"Trade {trade.trade_id} version mismatch. "
+                    f"Expected {trade.version - 1}, found {row[0]}"
+                )
+
+    def _load(self, connection: sqlite3.Connection, trade_id: str) -> Trade:
+        # Header and trail are read from one snapshot, or another writer's save could land in between.
+        connection.execute("BEGIN")
+        try:
+            row = connection.execute(_SELECT_TRADE, (trade_id,)).fetchone()
+            if row is None:
+                raise NotFoundException(f"Trade {trade_id} not found")
+            audit_rows = connection.execute(_SELECT_AUDIT, (trade_id,)).fetchall()
+        finally:
+            connection.execute("COMMIT")
+        return self._to_trade(row, audit_rows)
+
+    def _load_many(self, connection: sqlite3.Connection, trade_ids: list[str]) -> dict[str, Trade]:
+        # A deferred read transaction gives every chunk the same snapshot of the database.
+        connection.execute("BEGIN")
+        try:
+            return self._read_many(connection, trade_ids)
+        finally:
+            connection.execute("COMMIT")
+
+    def _query(self, connection: sqlite3.Connection, query: TradeQuery) -> TradePage:
+        filters = query.filters()
+        clauses = "".join(f" AND {_QUERY_COLUMNS[name]} = ?" for name in filters)
+        parameters = [self._query_value(value) for value in filters.values()]
+        connection.execute("BEGIN")
+        try:
+            rows = connection.execute(_SELECT_PAGE.format(filters=clauses),
+                                      (query.after or 0, *parameters, query.limit + 1)).fetchall()
+            page = rows[:query.limit]
+            trades = self._read_many(connection, [trade_id for _, trade_id in page])
+        finally:
+            connection.execute("COMMIT")
+        next_cursor = page[-1][0] if len(rows) > query.limit else None
+        return TradePage([trades[trade_id] for _, trade_id in page], next_cursor)
+
+    @staticmethod
+    def _query_value(value: object) -> object:
+        # Stored as codec does: enums by name, dates in ISO format.
+        if isinstance(value, TradeState):
+            return value.name
+        if isinstance(value, date):
+            return value.isoformat()
+        return value
+
+    def _read_many(self, connection: sqlite3.Connection, trade_ids: list[str]) -> dict[str, Trade]:
+        trades: dict[str, Trade] = {}
+        for start in range(0, len(trade_ids), _MAX_BATCH_PARAMETERS):
+            chunk = list(dict.fromkeys(trade_ids[start:start + _MAX_BATCH_PARAMETERS]))
+            marks = ", ".join("?" * len(chunk))
+            rows = connection.execute(_SELECT_TRADES_MANY.format(marks=marks), chunk).fetchall()
+            audit_rows: dict[str, list[tuple]] = {}
+            for audit_row in connection.execute(_SELECT_AUDIT_MANY.format(marks=marks), chunk):
+                audit_rows.setdefault(audit_row[0], []).append(audit_row[1:])
+            for row in rows:
+                trades[row[0]] = self._to_trade(row, audit_rows.get(row[0], []))
+        return trades
+
+    @staticmethod
+    def _header_values(trade: Trade, encode: "_DetailsJson") -> tuple:
+        return (
+            trade.requester,
+            trade.approver,
+            trade.state.name,
+            trade.state_before.name,
+            trade.version,
+            encode(trade.details),
+            codec.dumps(codec.receipt_to_dict(trade.execution_receipt)) if trade.execution_receipt else None,
+            codec.dumps(codec.confirmation_to_dict(trade.execution_confirmation)) if trade.execution_confirmation else None,
+        )
+
+    @staticmethod
+    def _audit_rows(trade: Trade, records: list[AuditRecord] | AuditTrail, encode: "_DetailsJson") -> list[tuple]:
+        trade_id = str(trade.trade_id)
+        return [
+            (
+                trade_id,
+                record.step,
+                record.action.name,
+                record.user_id,
+                record.state_before.name,
+                record.state_after.name,
+                encode(record.details),
+                record.timestamp.isoformat(),
+                record.notes,
+            )
+            for record in records
+        ]
+
+    @staticmethod
+    def _timestamp_bound(value: datetime | None, unbounded: str) -> str:
+        # Stored as codec does: isoformat, in UTC for the system clock's timestamps.
+        if value is None:
+            return unbounded
+        return (value.astimezone(timezone.utc) if value.tzinfo else value).isoformat()
+
+    @staticmethod
+    def _group_by_trade(rows: list[tuple]) -> Iterator[tuple[uuid.UUID, list[tuple]]]:
+        """Split (trade_id, *audit row) rows into runs of one trade."""
+        start = 0
+        for end in range(1, len(rows) + 1):
+            if end == len(rows) or rows[end][0] != rows[start][0]:
+                yield uuid.UUID(rows[start][0]), [row[1:] for row in rows[start:end]]
+                start = end
+
+    @staticmethod
+    def _records_from_rows(audit_rows: list[tuple]) -> list[AuditRecord]:
+        # Consecutive records usually carry identical details; decode each distinct one once.
+        records: list[AuditRecord] = []
+        last_json, last_details = None, None
+        for step, action, user_id, before, after, details_json, timestamp, notes in audit_rows:
+            if details_json != last_json:
+                last_json = details_json
+                last_details = codec.details_from_dict(codec.loads(details_json)) if details_json else None
+            records.append(codec.audit_from_dict({
+                "step": step, "action": action, "user_id": user_id,
+                "state_before": before, "state_after": after, "details": None,
+                "timestamp": timestamp, "notes": notes,
+            }, last_details))
+        return records
+
+    @classmethod
+    def _to_trade(cls, row: tuple, audit_rows: list[tuple]) -> Trade:
+        trade_id, requester, approver, state, state_before, version, details, receipt, confirmation = row
+
+        records = cls._records_from_rows(audit_rows)
+        last_json = audit_rows[-1][5] if audit_rows else None
+        last_details = records[-1].details if records else None
+
+        trade = Trade(uuid.UUID(trade_id))
+        trade.requester = requester
+        trade.approver = approver
+        trade.state = TradeState[state]
+        trade.state_before = TradeState[state_before]
+        trade.version = version
+        trade.details = last_details if details == last_json else (
+            codec.details_from_dict(codec.loads(details)) if details else None)
+        trade.audit = AuditTrail(records)
+        trade.execution_receipt = codec.receipt_from_dict(codec.loads(receipt)) if receipt else None
+        trade.execution_confirmation = codec.confirmation_from_dict(codec.loads(confirmation)) if confirmation else None
+        return trade
+
+
+class _DetailsJson:
+    """Encodes each distinct TradeDetails instance once per write; records usually share them."""
+
+    __slots__ = ("_cache",)
+
+    def __init__(self) -> None:
+        self._cache: dict[int, tuple[TradeDetails, str]] = {}
+
+    def __call__(self, details: TradeDetails | None) -> str | None:
+        if details is None:
+            return None
+        hit = self._cache.get(id(details))
+        if hit is None:
+            # The instance is kept alongside its JSON so its id cannot be reused meanwhile.
+            hit = self._cache[id(details)] = (details, codec.dumps(codec.details_to_dict(details)))
+        return hit[1]
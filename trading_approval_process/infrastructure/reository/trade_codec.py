@@ -0,0 +1,204 @@
+"""
+Plain-data encoding of the domain records, shared by the persistent repositories.
+
+Enums are stored by name, dates and datetimes as ISO-8601 strings.
+"""
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any
+
+from trading_approval_process.domain.models.audit_record import AuditRecord
+from trading_approval_process.domain.models.audit_trail import AuditTrail
+from trading_approval_process.domain.models.execution_confirmation import ExecutionConfirmation
+from trading_approval_process.domain.models.execution_receipt import ExecutionReceipt
+from trading_approval_process.domain.models.trade import Trade
+from trading_approval_process.domain.models.trade_action import TradeAction
+from trading_approval_process.domain.models.trade_details import TradeDetails
+from trading_approval_process.domain.models.trade_direction import TradeDirection
+from trading_approval_process.domain.models.trade_state import TradeState
+from trading_approval_process.domain.models.trade_style import TradeStyle
+
+
+# ---------------------------
+# TradeDetails
+# ---------------------------
+def details_to_dict(details: TradeDetails) -> dict[str, Any]:
+    return {
+        "trading_entity": details.trading_entity,
+        "counterparty": details.counterparty,
+        "direction": details.direction.name,
+        "style": details.style.name,
+        "notional_currency": details.notional_currency,
+        "notional_amount": details.notional_amount,
+        "underlying": details.underlying,
+        "trade_date": details.trade_date.isoformat(),
+        "value_date": details.value_date.isoformat(),
+        "delivery_date": details.delivery_date.isoformat(),
+        "strike": details.strike,
+        "confirmation_id": details.confirmation_id,
+    }
+
+
+def details_from_dict(data: dict[str, Any]) -> TradeDetails:
+    return TradeDetails(
+        trading_entity=data["trading_entity"],
+        counterparty=data["counterparty"],
+        direction=TradeDirection[data["direction"]],
+        style=TradeStyle[data["style"]],
+        notional_currency=data["notional_currency"],
+        notional_amount=data["notional_amount"],
+        underlying=data["underlying"],
+        trade_date=date.fromisoformat(data["trade_date"]),
+        value_date=date.fromisoformat(data["value_date"]),
+        delivery_date=date.fromisoformat(data["delivery_date"]),
+        strike=data["strike"],
+        confirmation_id=data["confirmation_id"],
+    )
+
+
+# ---------------------------
+# Execution receipt / confirmation
+# ---------------------------
+def receipt_to_dict(receipt: ExecutionReceipt) -> dict[str, Any]:
+    return {
+        "ticket_id": receipt.ticket_id,
+        "sent_at": receipt.sent_at.isoformat(),
+        "venue": receipt.venue,
+        "status": receipt.status,
+        "notes": receipt.notes,
+    }
+
+
+def receipt_from_dict(data: dict[str, Any]) -> ExecutionReceipt:
+    return ExecutionReceipt(
+        ticket_id=data["ticket_id"],
+        sent_at=datetime.fromisoformat(data["sent_at"]),
+        venue=data["venue"],
+        status=data["status"],
+        notes=data["notes"],
+    )
+
+
+def confirmation_to_dict(confirmation: ExecutionConfirmation) -> dict[str, Any]:
+    return {
+        "ticket_id": confirmation.ticket_id,
+        "confirmation_id": confirmation.confirmation_id,
+        "counterparty": confirmation.counterparty,
+        "strike": confirmation.strike,
+        "timestamp": confirmation.timestamp.isoformat(),
+    }
+
+
+def confirmation_from_dict(data: dict[str, Any]) -> ExecutionConfirmation:
+    return ExecutionConfirmation(
+        ticket_id=data["ticket_id"],
+        confirmation_id=data["confirmation_id"],
+        counterparty=data["counterparty"],
+        strike=data["strike"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+    )
+
+
+# ---------------------------
+# AuditRecord
+# ---------------------------
+def audit_to_dict(record: AuditRecord) -> dict[str, Any]:
+    return {
+        "step": record.step,
+        "action": record.action.name,
+        "user_id": record.user_id,
+        "state_before": record.state_before.name,
+        "state_after": record.state_after.name,
+        "details": details_to_dict(record.details) if record.details else None,
+        "timestamp": record.timestamp.isoformat(),
+        "notes": record.notes,
+    }
+
+
+def audit_from_dict(data: dict[str, Any], details: TradeDetails | None = None) -> AuditRecord:
+    """Decode an audit record; pass `details` to reuse an already decoded instance."""
+    if details is None and data["details"] is not None:
+        details = details_from_dict(data["details"])
+    return AuditRecord(
+        step=data["step"],
+        action=TradeAction[data["action"]],
+        user_id=data["user_id"],
+        state_before=TradeState[data["state_before"]],
+        state_after=TradeState[data["state_after"]],
+        details=details,
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        notes=data["notes"],
+    )
+
+
+def audit_list_from_dicts(items: list[dict[str, Any]]) -> list[AuditRecord]:
+    """Decode consecutive audit records, decoding each distinct details payload only once."""
+    records: list[AuditRecord] = []
+    last_data, last_details = None, None
+    for data in items:
+        if data["details"] != last_data:
+            last_data = data["details"]
+            last_details = details_from_dict(last_data) if last_data else None
+        records.append(audit_from_dict(data, last_details))
+    return records
+
+
+# ---------------------------
+# Trade
+# ---------------------------
+def header_to_dict(trade: Trade) -> dict[str, Any]:
+    """Encode the Trade fields that are not derivable from its audit records."""
+    return {
+        "requester": trade.requester,
+        "approver": trade.approver,
+        "execution_receipt": receipt_to_dict(trade.execution_receipt) if trade.execution_receipt else None,
+        "execution_confirmation": confirmation_to_dict(trade.execution_confirmation) if trade.execution_confirmation else None,
+    }
+
+
+def apply_header(trade: Trade, data: dict[str, Any]) -> None:
+    trade.requester = data["requester"]
+    trade.approver = data["approver"]
+    receipt, confirmation = data["execution_receipt"], data["execution_confirmation"]
+    trade.execution_receipt = receipt_from_dict(receipt) if receipt else None
+    trade.execution_confirmation = confirmation_from_dict(confirmation) if confirmation else None
+
+
+def trade_to_dict(trade: Trade) -> dict[str, Any]:
+    return {
+        "trade_id": str(trade.trade_id),
+        "state": trade.state.name,
+        "state_before": trade.state_before.name,
+        "version": trade.version,
+        "details": details_to_dict(trade.details) if trade.details else None,
+        **header_to_dict(trade),
+        "audit": [audit_to_dict(record) for record in trade.audit],
+    }
+
+
+def trade_from_dict(data: dict[str, Any]) -> Trade:
+    trade = Trade(uuid.UUID(data["trade_id"]))
+    trade.state = TradeState[data["state"]]
+    trade.state_before = TradeState[data["state_before"]]
+    trade.version = data["version"]
+    trade.audit = AuditTrail(audit_list_from_dicts(data["audit"]))
+    if data["details"] is None:
+        trade.details = None
+    elif trade.audit and data["details"] == data["audit"][-1]["details"]:
+        trade.details = trade.audit[-1].details
+    else:
+        trade.details = details_from_dict(data["details"])
+    apply_header(trade, data)
+    return trade
+
+
+# ---------------------------
+# JSON helpers
+# ---------------------------
+def dumps(data: dict[str, Any] | None) -> str | None:
+    return None if data is None else json.dumps(data, separators=(",", ":"))
+
+
+def loads(text: str | None) -> dict[str, Any] | None:
+    return None if text is None else json.loads(text)
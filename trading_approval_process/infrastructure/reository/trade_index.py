@@ -0,0 +1,81 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Hashable
+
+from trading_approval_process.domain.models.trade_query import INDEXED_FIELDS, TradeQuery
+
+_POSITIONS = {name: position for position, name in enumerate(INDEXED_FIELDS)}
+_UNINDEXED = (None,) * len(INDEXED_FIELDS)
+
+
+class TradeIndex:
+    """
+    In-memory secondary indexes over the indexed trade fields, maintained on every save.
+
+    - A trade gets a sequence number on its first `put`; listings follow that order and the
+      page cursor is the sequence number of the last trade returned.
+    - Each field keeps, per value, the sorted sequence numbers of the trades currently
+      holding it. A query walks the shortest of its filters' lists from the cursor and
+      checks the remaining filters against the stored values, so a page costs
+      O(log n + page size) rather than a scan of the store.
+    """
+
+    def __init__(self) -> None:
+        self._next_seq = 1
+        self._seq: dict[Hashable, int] = {}
+        self._keys: dict[int, Hashable] = {}
+        # Values are kept as tuples in INDEXED_FIELDS order: a third of the size of a dict each.
+        self._values: dict[int, tuple] = {}
+        self._all: list[int] = []
+        self._postings: dict[str, dict[object, list[int]]] = {name: {} for name in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def keys(self) -> list[Hashable]:
+        """Keys of every indexed trade, in creation order."""
+        return [self._keys[seq] for seq in self._all]
+
+    def put(self, key: Hashable, values: dict[str, object]) -> None:
+        """Index a new trade, or move an existing one to the lists of its changed values."""
+        seq = self._seq.get(key)
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq[key], self._keys[seq] = seq, key
+            self._all.append(seq)
+
+        current = tuple(values[name] for name in INDEXED_FIELDS)
+        previous = self._values.get(seq, _UNINDEXED)
+        for name, old, new in zip(INDEXED_FIELDS, previous, current):
+            if old == new:
+                continue
+            if old is not None:
+                self._remove(name, old, seq)
+            if new is not None:
+                insort(self._postings[name].setdefault(new, []), seq)
+        self._values[seq] = current
+
+    def query(self, query: TradeQuery) -> tuple[list[Hashable], int | None]:
+        """Keys of the next page of matching trades, and the cursor of the page after it."""
+        filters = query.filters()
+        checks = [(_POSITIONS[name], value) for name, value in filters.items()]
+        candidates = min((self._postings[name].get(value, []) for name, value in filters.items()),
+                         key=len, default=self._all)
+        position = bisect_right(candidates, query.after) if query.after is not None else 0
+
+        matched: list[int] = []
+        while position < len(candidates) and len(matched) <= query.limit:
+            seq = candidates[position]
+            values = self._values[seq]
+            if all(values[index] == value for index, value in checks):
+                matched.append(seq)
+            position += 1
+
+        next_cursor = matched[query.limit - 1] if len(matched) > query.limit else None
+        return [self._keys[seq] for seq in matched[:query.limit]], next_cursor
+
+    def _remove(self, name: str, value: object, seq: int) -> None:
+        posting = self._postings[name][value]
+        del posting[bisect_left(posting, seq)]
+        if not posting:
+            del self._postings[name][value]